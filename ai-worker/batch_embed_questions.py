@@ -17,13 +17,14 @@ from utils.vector_utils import get_embedding_generator
 logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(name)s: %(message)s')
 logger = logging.getLogger("BatchEmbed")
 
-def batch_embed_questions(batch_size: int = 128):
+def batch_embed_questions(batch_size: int = 128, reembed: bool = False):
     """설명:
         임베딩이 없는 질문들을 배치 단위로 읽어 벡터 임베딩을 생성하고 DB에 저장.
         전체 처리 진행률 및 남은 예상 시간을 로그로 출력.
 
     Args:
         batch_size (int): 한 번에 처리할 질문 수 (기본값: 128).
+        reembed (bool): True면 기존 임베딩까지 모두 다시 계산 (임베딩 런타임의 접두어/정규화 정책이 바뀐 경우).
 
     Returns:
         None
@@ -34,8 +35,10 @@ def batch_embed_questions(batch_size: int = 128):
     generator = get_embedding_generator()
     
     with Session(engine) as session:
-        # 질문 총 개수 확인 (임베딩이 없는 것만)
-        total_stmt = select(func.count(Question.id)).where(Question.embedding == None)
+        # 질문 총 개수 확인 (임베딩이 없는 것만, reembed면 전체)
+        total_stmt = select(func.count(Question.id))
+        if not reembed:
+            total_stmt = total_stmt.where(Question.embedding == None)
         total_to_process = session.exec(total_stmt).one()
         
         if total_to_process == 0:
@@ -45,19 +48,23 @@ def batch_embed_questions(batch_size: int = 128):
         logger.info(f"총 {total_to_process}개의 질문에 대한 임베딩 생성을 시작합니다. (배치 크기: {batch_size})")
 
         processed = 0
+        last_id = 0
         start_time = time.time()
 
         while True:
-            # 배치 단위로 질문 가져오기
-            stmt = select(Question).where(Question.embedding == None).limit(batch_size)
+            # 배치 단위로 질문 가져오기 (id 순 keyset 페이지네이션 → reembed 시에도 같은 행을 반복하지 않음)
+            stmt = select(Question).where(Question.id > last_id).order_by(Question.id).limit(batch_size)
+            if not reembed:
+                stmt = stmt.where(Question.embedding == None)
             questions = session.exec(stmt).all()
             
             if not questions:
                 break
+            last_id = questions[-1].id
             
-            # 텍스트 추출 및 벡터화
+            # 텍스트 추출 및 벡터화 (질문 은행은 검색 대상이므로 passage API)
             texts = [q.content for q in questions]
-            embeddings = generator.encode_batch(texts, is_query=True)
+            embeddings = generator.encode_batch(texts, is_query=False)
             
             # DB 업데이트
             for q, emb in zip(questions, embeddings):
@@ -77,4 +84,5 @@ def batch_embed_questions(batch_size: int = 128):
     logger.info(f"✅ 총 {processed}개의 질문 임베딩 생성 완료!")
 
 if __name__ == "__main__":
-    batch_embed_questions()
+    # python batch_embed_questions.py --reembed : 기존 벡터까지 현재 임베딩 런타임 기준으로 재계산
+    batch_embed_questions(reembed="--reembed" in sys.argv)
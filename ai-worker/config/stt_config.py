@@ -0,0 +1,11 @@
+"""
+STT 공통 설정 (Celery STT 태스크와 상주 STT 서버가 함께 사용)
+stt_server.py가 tasks 패키지(→ evaluator → db/backend-core, DeepFace 등)를 임포트하지 않도록 의존성 없는 모듈로 분리합니다.
+"""
+import os
+
+# [문법] os.getenv(A, B): 환경변수 A를 찾고, 없으면 기본값 B를 사용하라는 뜻입니다.
+MODEL_SIZE = os.getenv("WHISPER_MODEL_SIZE", "large-v3-turbo")
+
+# 무음/잡음 구간에서 Whisper가 자주 만들어내는 환각 문구
+HALLUCINATION_PHRASES = ["겨울이 이렇게", "넘치고 넘치고", "시청해 주셔서", "감사합니다", "청취해 주셔서"]
@@ -62,7 +62,8 @@ if backend_path not in sys.path:
 try:
     from db_models import (
         User, UserRole, InterviewStatus, QuestionCategory, QuestionDifficulty, Speaker,
-        Company, Resume, Interview, Question, Transcript, EvaluationReport, AnswerBank
+        Company, Resume, Interview, Question, Transcript, EvaluationReport, AnswerBank,
+        ReportSectionSummary, ResumeChunk, EmbeddingCache
     )
 
 except ImportError as e:
@@ -203,6 +204,104 @@ def update_transcript_scores(transcript_id: int, total_score: float, rubric_scor
             session.commit()
             logger.info(f"✅ [DB_UPDATE] Transcript(id={transcript_id}) scores updated: total={total_score}")
 
+def update_transcript_scores_bulk(score_updates: List[Dict[str, Any]]) -> int:
+    """설명:
+        여러 답변의 루브릭 점수/총점과 질문 평균 점수를 한 번의 세션·커밋으로 일괄 업데이트
+        (배치 평가 결과 저장용, 답변마다 세션을 여닫는 update_transcript_scores의 일괄 버전)
+
+    Args:
+        score_updates (list): {"transcript_id", "total_score", "rubric_score", "question_id"(선택)} 딕셔너리 목록
+
+    Returns:
+        int: 업데이트된 답변 수
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    if not score_updates:
+        return 0
+
+    with Session(engine) as session:
+        t_ids = [u["transcript_id"] for u in score_updates]
+        transcripts = {t.id: t for t in session.exec(select(Transcript).where(Transcript.id.in_(t_ids))).all()}
+
+        q_ids = {u["question_id"] for u in score_updates if u.get("question_id")}
+        questions = {q.id: q for q in session.exec(select(Question).where(Question.id.in_(q_ids))).all()} if q_ids else {}
+
+        updated = 0
+        for u in score_updates:
+            transcript = transcripts.get(u["transcript_id"])
+            if not transcript:
+                continue
+            transcript.total_score = u["total_score"]
+            transcript.rubric_score = u["rubric_score"]
+            session.add(transcript)
+            updated += 1
+
+            # update_question_avg_score와 동일한 가중 평균 규칙
+            question = questions.get(u.get("question_id"))
+            if question:
+                if question.avg_score is None:
+                    question.avg_score = u["total_score"]
+                else:
+                    weight = min(question.usage_count, 10) / 10
+                    question.avg_score = question.avg_score * weight + u["total_score"] * (1 - weight)
+                session.add(question)
+
+        session.commit()
+        logger.info(f"✅ [DB_UPDATE] {updated} transcripts scores updated in bulk")
+        return updated
+
+def get_report_section_summaries(interview_id: int) -> Dict[str, ReportSectionSummary]:
+    """설명:
+        면접의 섹션별 사전 요약 조회
+
+    Args:
+        interview_id (int): 면접 ID
+
+    Returns:
+        dict: section → ReportSectionSummary
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    with Session(engine) as session:
+        stmt = select(ReportSectionSummary).where(ReportSectionSummary.interview_id == interview_id)
+        return {r.section: r for r in session.exec(stmt).all()}
+
+def upsert_report_section_summary(interview_id: int, section: str, **kwargs):
+    """설명:
+        섹션별 사전 요약 생성 또는 업데이트
+
+    Args:
+        interview_id (int): 면접 ID
+        section (str): 섹션 이름
+        **kwargs: score, summary, strengths, improvements, source_transcript_ids
+
+    Returns:
+        ReportSectionSummary: 저장된 요약
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    with Session(engine) as session:
+        stmt = select(ReportSectionSummary).where(
+            ReportSectionSummary.interview_id == interview_id,
+            ReportSectionSummary.section == section
+        )
+        row = session.exec(stmt).first()
+        if row:
+            for key, value in kwargs.items():
+                setattr(row, key, value)
+            row.updated_at = datetime.now()
+        else:
+            row = ReportSectionSummary(interview_id=interview_id, section=section, **kwargs)
+        session.add(row)
+        session.commit()
+        session.refresh(row)
+        logger.info(f"✅ [DB_UPDATE] Report section '{section}' summary saved for Interview {interview_id}")
+        return row
+
 def create_or_update_evaluation_report(interview_id: int, **kwargs):
     """설명:
         면접 평가 보고서 생성 또는 업데이트
@@ -0,0 +1,232 @@
+"""
+EXAONE 서빙 프로세스(llm_server.py)의 우선순위 스케줄러
+
+모델/네트워크와 무관한 순수 스케줄링 로직만 담아 단독으로 테스트할 수 있게 분리했습니다 (tests/test_llm_scheduler.py).
+    - 상위 클래스(rank가 작은 클래스)부터, 같은 클래스 안에서는 선점된 요청 → 먼저 들어온 요청 순으로 꺼냄
+    - 클래스별 동시 진행 한도 (선점되어 재개를 기다리는 요청도 진행 중으로 셈)
+    - 선점 가능 클래스는 상위 클래스 요청이 오면 토큰 경계에서 양보. 재개 시 프롬프트+부분 출력을 다시 prefill하므로
+      재시작 이후 (프롬프트+출력) 길이에 비례한 토큰을 생성해야만 양보하고, 요청당 선점 횟수에도 상한을 둠
+"""
+import asyncio
+import os
+import time
+from collections import deque
+
+# 선점 전 최소 생성 토큰 수 = max(LLM_PREEMPT_MIN_TOKENS, (프롬프트+출력 토큰) × LLM_PREEMPT_PROMPT_RATIO)
+# (GPU에서 prefill은 토큰당 decode보다 수십 배 빠르므로, 0.05면 재-prefill 비용이 직전 decode 시간을 넘지 않음)
+LLM_PREEMPT_MIN_TOKENS = int(os.getenv("LLM_PREEMPT_MIN_TOKENS", "8"))
+LLM_PREEMPT_PROMPT_RATIO = float(os.getenv("LLM_PREEMPT_PROMPT_RATIO", "0.05"))
+# 요청당 최대 선점 횟수 (초과하면 끝까지 생성 → interactive 부하가 계속되어도 batch 요청이 반드시 끝남)
+LLM_PREEMPT_MAX_PER_REQUEST = int(os.getenv("LLM_PREEMPT_MAX_PER_REQUEST", "3"))
+
+
+class SchedulingClass:
+    """설명:
+        LLM 요청 우선순위 클래스.
+
+    Attributes:
+        name (str): 클래스 이름 (interactive / batch).
+        rank (int): 작을수록 먼저 처리.
+        max_concurrency (int): 동시 진행 한도.
+        preemptible (bool): 상위 클래스 요청이 오면 토큰 경계에서 양보하는지 여부.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+
+    def __init__(self, name: str, rank: int, max_concurrency: int, preemptible: bool):
+        self.name = name
+        self.rank = rank
+        self.max_concurrency = max(1, max_concurrency)
+        self.preemptible = preemptible
+        self.waiting = deque()     # 아직 시작하지 않은 요청 (FIFO)
+        self.resumable = deque()   # 선점되어 이어서 생성할 요청 (먼저 재개)
+        self.in_progress = 0
+        self.stats = {"requests": 0, "preemptions": 0, "wait_ms_total": 0.0, "wait_ms_max": 0.0}
+
+
+class LLMRequest:
+    """설명:
+        생성 요청 1건. 추론 스레드는 토큰을 이벤트 루프의 sink 큐로 넘기고, 완료 시 None을 넣음.
+        선점되면 지금까지의 출력(generated)을 보관했다가 프롬프트 뒤에 이어 붙여 생성을 재개함.
+
+    Attributes:
+        priority (str): 우선순위 클래스 이름.
+        stream (bool): 토큰 스트리밍 여부.
+        sink (asyncio.Queue): 스트리밍 토큰 큐 (None = 종료).
+        cancelled (bool): 클라이언트 연결 종료 시 True → 다음 토큰에서 생성 중단.
+        generated (str): 지금까지 생성된 출력.
+        generated_tokens (int): 지금까지 생성된 토큰(청크) 수.
+        prompt_tokens (int): 프롬프트 토큰 수 (추론 스레드가 처음 실행할 때 채움, 0이면 글자 수로 추정).
+        tokens_since_resume (int): 마지막 시작/재개 이후 생성한 토큰 수.
+        preemptions (int): 이 요청이 선점된 횟수.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+
+    def __init__(self, message: dict, future: asyncio.Future, priority: str):
+        self.prompt = message["prompt"]
+        self.stop = message.get("stop")
+        self.params = message.get("params") or {}
+        self.priority = priority
+        self.stream = bool(message.get("stream"))
+        self.future = future
+        self.sink = asyncio.Queue()
+        self.cancelled = False
+        self.started = False
+        self.generated = ""
+        self.generated_tokens = 0
+        self.prompt_tokens = 0
+        self.tokens_since_resume = 0
+        self.preemptions = 0
+        self.enqueued_at = time.time()
+
+    def remaining_params(self) -> dict:
+        """재개 시 남은 max_tokens로 줄인 생성 파라미터"""
+        params = dict(self.params)
+        params["max_tokens"] = max(1, params.get("max_tokens", 2048) - self.generated_tokens)
+        return params
+
+    def min_tokens_before_yield(self) -> int:
+        """재개 시 다시 prefill할 길이(프롬프트+출력)에 비례한 최소 생성 토큰 수"""
+        prompt_tokens = self.prompt_tokens or len(self.prompt) // 2
+        return max(LLM_PREEMPT_MIN_TOKENS, int((prompt_tokens + self.generated_tokens) * LLM_PREEMPT_PROMPT_RATIO))
+
+
+class LLMScheduler:
+    """설명:
+        우선순위 클래스 기반 LLM 요청 스케줄러 (이벤트 루프 스레드 전용, 추론 스레드는 should_yield만 읽음).
+
+    Attributes:
+        classes (dict): 이름 -> SchedulingClass (rank 순).
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+
+    def __init__(self, classes):
+        self.classes = {c.name: c for c in sorted(classes, key=lambda c: c.rank)}
+        self._wakeup = asyncio.Event()
+
+    def submit(self, request: LLMRequest):
+        self.classes[request.priority].waiting.append(request)
+        self._wakeup.set()
+
+    def _drop_cancelled(self, cls: SchedulingClass):
+        """대기열 맨 앞의 취소된 요청을 실행 없이 정리 (연결 종료 감지 시 handle이 sink 종료를 기다림)"""
+        for queue in (cls.resumable, cls.waiting):
+            while queue and queue[0].cancelled:
+                request = queue.popleft()
+                self.finish(request)
+                request.sink.put_nowait(None)
+
+    def _pick(self):
+        for cls in self.classes.values():
+            self._drop_cancelled(cls)
+            if cls.resumable:
+                return cls.resumable.popleft()
+            if cls.waiting and cls.in_progress < cls.max_concurrency:
+                request = cls.waiting.popleft()
+                request.started = True
+                cls.in_progress += 1
+                wait_ms = (time.time() - request.enqueued_at) * 1000
+                cls.stats["requests"] += 1
+                cls.stats["wait_ms_total"] += wait_ms
+                cls.stats["wait_ms_max"] = max(cls.stats["wait_ms_max"], wait_ms)
+                return request
+        return None
+
+    async def acquire(self) -> LLMRequest:
+        """다음에 실행할 요청을 꺼냄 (없으면 제출/재개 신호까지 대기, 취소된 요청은 정리하고 건너뜀)"""
+        while True:
+            request = self._pick()
+            if request is None:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            if request.cancelled:
+                self.finish(request)
+                request.sink.put_nowait(None)
+                continue
+            request.tokens_since_resume = 0
+            return request
+
+    def should_yield(self, request: LLMRequest) -> bool:
+        """설명:
+            실행 중인 요청이 토큰 경계에서 양보해야 하는지 판단 (추론 스레드에서 호출).
+            선점 가능 클래스이고, 선점 횟수 상한 미만이며, 재시작 이후 최소 토큰을 생성했고,
+            상위 클래스에 바로 시작/재개할 수 있는 요청이 있으면 True.
+
+        Args:
+            request (LLMRequest): 실행 중인 요청.
+
+        Returns:
+            bool: 양보 여부.
+
+        생성자: ejm
+        생성일자: 2026-10-17
+        """
+        cls = self.classes[request.priority]
+        if not cls.preemptible or request.preemptions >= LLM_PREEMPT_MAX_PER_REQUEST:
+            return False
+        if request.tokens_since_resume < request.min_tokens_before_yield():
+            return False
+        for other in self.classes.values():
+            if other.rank >= cls.rank:
+                break
+            if other.resumable or (other.waiting and other.in_progress < other.max_concurrency):
+                return True
+        return False
+
+    def cancel(self, request: LLMRequest):
+        """설명:
+            클라이언트가 연결을 끊은 요청을 취소. 대기/재개 대기 중이면 바로 대기열에서 빼고 sink를 닫으며,
+            실행 중이면 추론 스레드가 다음 토큰에서 중단함.
+
+        Args:
+            request (LLMRequest): 취소할 요청.
+
+        생성자: ejm
+        생성일자: 2026-10-17
+        """
+        if request.cancelled:
+            return
+        request.cancelled = True
+        cls = self.classes[request.priority]
+        for queue in (cls.waiting, cls.resumable):
+            if request in queue:
+                queue.remove(request)
+                self.finish(request)
+                request.sink.put_nowait(None)
+        self._wakeup.set()
+
+    def preempt(self, request: LLMRequest):
+        """선점된 요청을 자기 클래스의 재개 대기열 맨 앞에 넣음"""
+        cls = self.classes[request.priority]
+        cls.stats["preemptions"] += 1
+        request.preemptions += 1
+        cls.resumable.appendleft(request)
+        self._wakeup.set()
+
+    def finish(self, request: LLMRequest):
+        if request.started:
+            request.started = False
+            self.classes[request.priority].in_progress -= 1
+            self._wakeup.set()
+
+    def get_stats(self) -> dict:
+        stats = {}
+        for name, cls in self.classes.items():
+            served = cls.stats["requests"]
+            stats[name] = {
+                "waiting": len(cls.waiting),
+                "resumable": len(cls.resumable),
+                "in_progress": cls.in_progress,
+                "max_concurrency": cls.max_concurrency,
+                "requests": served,
+                "preemptions": cls.stats["preemptions"],
+                "wait_ms_avg": round(cls.stats["wait_ms_total"] / served, 1) if served else 0.0,
+                "wait_ms_max": round(cls.stats["wait_ms_max"], 1),
+            }
+        return stats
@@ -0,0 +1,210 @@
+"""
+상주 EXAONE 서빙 프로세스 (GGUF 모델 1개 + 로컬 우선순위 큐)
+
+Celery 워커 프로세스가 모델을 직접 보유하면 워커 재시작/재생성 때마다 7.8B 모델을 다시 올려야 하므로,
+이 프로세스 하나가 노드 수명 동안 모델과 Prefix KV 캐시를 계속 보유하고 워커는 요청만 보냅니다.
+요청은 LLMScheduler가 우선순위 클래스 순서로 꺼내 전용 추론 스레드 1개에서 처리합니다.
+    - interactive (실시간 면접 질문 생성): 항상 먼저 처리, 선점되지 않음
+    - batch (리포트 평가/요약): 생성 도중이라도 토큰 경계에서 양보하고 이어서 생성 (선점)
+    - 클래스별 동시 진행 한도, 요청당 선점 횟수 상한 (스케줄링 로직: llm_scheduler.py)
+
+    python llm_server.py   (docker-compose: llm-server 서비스)
+
+클라이언트/프로토콜: utils/llm_client.py
+"""
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+app_root = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, app_root)
+
+# 이 프로세스가 모델을 직접 보유함 (클라이언트 모드로 동작하지 않도록 서버 주소 제거)
+os.environ.pop("LLM_SERVER_ADDR", None)
+
+from utils.exaone_llm import ExaoneLLM
+from utils.llm_client import HEADER, PRIORITY_INTERACTIVE, PRIORITY_BATCH
+from llm_scheduler import LLM_PREEMPT_MAX_PER_REQUEST, SchedulingClass, LLMRequest, LLMScheduler
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(name)s: %(message)s')
+logger = logging.getLogger("LLM-Server")
+
+LLM_SERVER_HOST = os.getenv("LLM_SERVER_HOST", "0.0.0.0")
+LLM_SERVER_PORT = int(os.getenv("LLM_SERVER_PORT", "9091"))
+
+# 클래스별 동시 진행 한도 (시작했지만 끝나지 않은 요청 수, 선점되어 대기 중인 요청 포함)
+LLM_INTERACTIVE_CONCURRENCY = int(os.getenv("LLM_INTERACTIVE_CONCURRENCY", "4"))
+LLM_BATCH_CONCURRENCY = int(os.getenv("LLM_BATCH_CONCURRENCY", "1"))
+
+SCHEDULING_CLASSES = (
+    SchedulingClass(PRIORITY_INTERACTIVE, 0, LLM_INTERACTIVE_CONCURRENCY, preemptible=False),
+    SchedulingClass(PRIORITY_BATCH, 1, LLM_BATCH_CONCURRENCY, preemptible=True),
+)
+
+
+class ExaoneServer:
+    """설명:
+        ExaoneLLM(GGUF) 1개를 보유하고 LLMScheduler 순서로 생성 요청을 처리하는 서빙 프로세스.
+        llama-cpp 컨텍스트는 동시 호출이 불가하므로 추론은 전용 스레드 1개에서만 수행함.
+
+    Attributes:
+        engine (ExaoneLLM): 로컬 모드로 로드된 엔진 싱글톤.
+        scheduler (LLMScheduler): 우선순위 클래스 스케줄러.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+
+    def __init__(self):
+        self.engine = ExaoneLLM()
+        if ExaoneLLM.llm is None:
+            raise RuntimeError("EXAONE engine is not loaded. Check USE_GPU / model path.")
+        self.scheduler = LLMScheduler(SCHEDULING_CLASSES)
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="exaone")
+
+    # ---------- 추론 (전용 스레드) ----------
+
+    def _run(self, request: LLMRequest, loop: asyncio.AbstractEventLoop) -> bool:
+        """설명:
+            요청 1건을 (이어서) 생성. 토큰마다 출력을 누적하고, 스트리밍 요청이면 sink로도 넘김.
+            재개 시에는 프롬프트+부분 출력을 프롬프트로 사용하며, 페르소나 프리픽스는 Prefix KV 캐시로 복원되고
+            llama-cpp prefix-match 덕분에 나머지 구간만 prefill 됨.
+            재-prefill 비용을 선점 판단에 반영하도록 처음 실행할 때 프롬프트 토큰 수를 기록함.
+
+        Args:
+            request (LLMRequest): 실행할 요청.
+            loop (asyncio.AbstractEventLoop): 토큰을 넘길 이벤트 루프.
+
+        Returns:
+            bool: 끝까지 생성했으면 True, 선점되어 양보했으면 False.
+
+        생성자: ejm
+        생성일자: 2026-10-17
+        """
+        if not request.prompt_tokens:
+            request.prompt_tokens = len(ExaoneLLM.llm.tokenize(request.prompt.encode("utf-8"), add_bos=True, special=True))
+        prompt = request.prompt + request.generated
+        for chunk in self.engine._stream(prompt, request.stop, **request.remaining_params()):
+            if request.cancelled:
+                logger.info("⏹️ 클라이언트 연결 종료 → 생성 중단")
+                return True
+            request.generated += chunk.text
+            request.generated_tokens += 1
+            request.tokens_since_resume += 1
+            if request.stream:
+                loop.call_soon_threadsafe(request.sink.put_nowait, chunk.text)
+            if self.scheduler.should_yield(request):
+                return False
+        return True
+
+    def warmup(self):
+        """기동 직후 짧은 생성을 한 번 수행하여 첫 요청 지연 제거"""
+        started = time.time()
+        self.engine._call("[|user|]안녕하세요[|endofturn|]\n[|assistant|]", max_tokens=1)
+        logger.info(f"🔥 EXAONE 워밍업 완료 ({time.time() - started:.2f}s)")
+
+    # ---------- 비동기 서버 ----------
+
+    async def schedule_loop(self):
+        """스케줄러가 고른 요청을 하나씩 추론 스레드에서 실행 (선점되면 재개 대기열로 되돌림)"""
+        loop = asyncio.get_running_loop()
+        while True:
+            request = await self.scheduler.acquire()
+            try:
+                finished = await loop.run_in_executor(self.executor, self._run, request, loop)
+            except Exception as e:
+                logger.error(f"❌ EXAONE 생성 실패: {e}", exc_info=True)
+                self.scheduler.finish(request)
+                if not request.future.done():
+                    request.future.set_exception(e)
+                request.sink.put_nowait(None)
+                continue
+
+            if not finished:
+                logger.info(
+                    f"⏸️ {request.priority} 요청 양보 ({request.generated_tokens} tokens 생성 후, "
+                    f"{request.preemptions + 1}/{LLM_PREEMPT_MAX_PER_REQUEST}번째 선점)"
+                )
+                self.scheduler.preempt(request)
+                continue
+
+            self.scheduler.finish(request)
+            if not request.future.done():
+                request.future.set_result(request.generated.strip())
+            request.sink.put_nowait(None)
+
+    def get_stats(self) -> dict:
+        return {"prefix_cache": ExaoneLLM.get_prefix_cache_stats(), "scheduler": self.scheduler.get_stats()}
+
+    async def _write(self, writer: asyncio.StreamWriter, message: dict):
+        payload = json.dumps(message, ensure_ascii=False).encode("utf-8")
+        writer.write(HEADER.pack(len(payload)) + payload)
+        await writer.drain()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """연결 1개 = 요청 1건: 대기열에 넣고 토큰/결과를 응답"""
+        loop = asyncio.get_running_loop()
+        request = None
+        eof_watch = None
+        try:
+            (size,) = HEADER.unpack(await reader.readexactly(HEADER.size))
+            message = json.loads((await reader.readexactly(size)).decode("utf-8"))
+            op = message.get("op")
+
+            if op == "stats":
+                await self._write(writer, self.get_stats())
+                return
+            if op == "evict":
+                # 캐시는 추론 스레드가 사용하므로 같은 스레드에서 제거 (진행 중인 생성 뒤에 실행)
+                evicted = await loop.run_in_executor(self.executor, ExaoneLLM.evict_prefix_cache, message.get("scope"))
+                await self._write(writer, {"evicted": evicted})
+                return
+            if op != "generate":
+                await self._write(writer, {"error": f"unknown op: {op}"})
+                return
+
+            priority = PRIORITY_INTERACTIVE if message.get("priority") == PRIORITY_INTERACTIVE else PRIORITY_BATCH
+            request = LLMRequest(message, loop.create_future(), priority)
+            self.scheduler.submit(request)
+            # 클라이언트는 요청 후 아무것도 보내지 않으므로 read()가 끝나면 연결 종료 (Celery 태스크 타임아웃/revoke 등)
+            # → 대기 중이거나 비스트리밍으로 생성 중인 요청도 바로 취소
+            eof_watch = asyncio.ensure_future(reader.read())
+            eof_watch.add_done_callback(lambda _: self.scheduler.cancel(request))
+            while True:
+                token = await request.sink.get()
+                if token is None:
+                    break
+                await self._write(writer, {"token": token})
+            if request.cancelled:
+                logger.info(f"⏹️ {request.priority} 요청 취소 (클라이언트 연결 종료, {request.generated_tokens} tokens 생성)")
+                return
+            try:
+                text = await request.future
+                await self._write(writer, {"done": True} if request.stream else {"text": text})
+            except Exception as e:
+                await self._write(writer, {"error": str(e)})
+        except (asyncio.IncompleteReadError, ConnectionError):
+            if request is not None:
+                self.scheduler.cancel(request)
+        finally:
+            if eof_watch is not None:
+                eof_watch.cancel()
+            writer.close()
+
+
+async def main():
+    server = ExaoneServer()
+    server.warmup()
+    asyncio.create_task(server.schedule_loop())
+    tcp_server = await asyncio.start_server(server.handle, LLM_SERVER_HOST, LLM_SERVER_PORT)
+    logger.info(f"✅ EXAONE 서빙 프로세스 대기 중 {LLM_SERVER_HOST}:{LLM_SERVER_PORT}")
+    async with tcp_server:
+        await tcp_server.serve_forever()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -58,7 +58,7 @@ app.conf.update(
     task_track_started=True,
     task_time_limit=600,
     result_expires=3600,
-    worker_max_tasks_per_child=50, # 메모리 관리 효율화
+    worker_max_tasks_per_child=50, # 메모리 관리 효율화 (gpu_queue 워커는 celeryd_init에서 해제)
     # worker_pool='solo' 제거 (CPU/GPU 워커가 각각 다른 풀을 사용하도록 docker-compose에서 결정)
     
     # [큐 라우팅] 역할별 전용 일꾼 시스템 구축
@@ -69,9 +69,13 @@ app.conf.update(
         'tasks.question_generator.*': {'queue': 'gpu_queue'},
         'tasks.resume_pipeline.generate_embeddings': {'queue': 'gpu_queue'},
         'tasks.resume_embedding.*': {'queue': 'gpu_queue'},
-        'tasks.evaluator.generate_final_report': {'queue': 'gpu_queue'},
-        'tasks.evaluator.analyze_answer': {'queue': 'gpu_queue'},
-        'tasks.evaluator.finalize_report_task': {'queue': 'gpu_queue'},
+
+        # 리포트 평가 태스크 (EXAONE batch 클래스): 실시간 질문 생성과 같은 큐에서 앞을 막지 않도록 분리
+        'tasks.evaluator.generate_final_report': {'queue': 'report_queue'},
+        'tasks.evaluator.analyze_answer': {'queue': 'report_queue'},
+        'tasks.evaluator.analyze_answers_batch': {'queue': 'report_queue'},
+        'tasks.evaluator.summarize_report_section': {'queue': 'report_queue'},
+        'tasks.evaluator.finalize_report_task': {'queue': 'report_queue'},
         
         # CPU 사용 태스크 (파싱, STT, TTS, 비전)
         'tasks.resume_pipeline.parse_pdf': {'queue': 'cpu_queue'},
@@ -83,6 +87,73 @@ app.conf.update(
     }
 )
 
+from celery.signals import celeryd_init, worker_ready
+
+@celeryd_init.connect
+def disable_recycling_for_gpu_worker(sender=None, conf=None, options=None, **kwargs):
+    """설명:
+        gpu_queue 워커만 자식 프로세스 재생성(worker_max_tasks_per_child)을 끔.
+        EXAONE은 llm-server가 보유하고 이 워커는 임베딩 런타임/이력서 인덱스를 프로세스 수명 동안 재사용하므로,
+        재생성으로 얻는 메모리 회수보다 재로드 비용이 큼. (Whisper/DeepFace/TTS를 올리는 CPU 워커는 재생성 유지)
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    queues = (options or {}).get("queues") or []
+    if isinstance(queues, str):
+        queues = queues.split(",")
+    if "gpu_queue" in queues and conf is not None:
+        conf.worker_max_tasks_per_child = None
+        logger.info("♻️ gpu_queue 워커: worker_max_tasks_per_child 해제 (프로세스 재생성 없음)")
+
+
+@worker_ready.connect
+def warm_stage_query_embeddings(sender=None, **kwargs):
+    """설명:
+        GPU 워커 시작 시 질문 생성의 고정 RAG 쿼리를 미리 임베딩하여 쿼리 캐시에 적재
+        (첫 면접에서도 인성 단계 검색이 KURE-v1 forward 없이 바로 수행되도록 함)
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    if os.getenv("QUERY_EMBED_PREWARM", "true").lower() != "true":
+        return
+    try:
+        # RAG 검색은 gpu_queue(질문 생성)에서만 수행되므로 CPU 워커는 건너뜀
+        if "gpu_queue" not in app.amqp.queues.consume_from:
+            return
+        from tasks.question_generator import get_stage_rag_queries
+        from tasks.rag_retrieval import warm_query_embeddings
+        warm_query_embeddings(get_stage_rag_queries())
+    except Exception as e:
+        logger.warning(f"Query embedding prewarm failed: {e}")
+
+@worker_ready.connect
+def check_question_embedding_policy(sender=None, **kwargs):
+    """설명:
+        GPU 워커 시작 시 질문 은행 벡터가 현재 임베딩 정책(접두어 제거 이후)으로 계산된 것인지 표본 검사.
+        예전 "query: " 접두어 벡터가 남아 있으면 유사 질문 검색이 조용히 부정확해지므로 재임베딩 절차를 경고로 안내.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    if os.getenv("EMBEDDING_POLICY_CHECK", "true").lower() != "true":
+        return
+    try:
+        if "gpu_queue" not in app.amqp.queues.consume_from:
+            return
+        from utils.vector_utils import find_stale_question_embeddings
+        stale, checked = find_stale_question_embeddings()
+        if stale:
+            logger.warning(
+                f"⚠️ 질문 은행 임베딩 {stale}/{checked}건이 현재 임베딩 정책과 불일치합니다 (접두어 변경 이전 벡터로 추정). "
+                f"재임베딩 필요: docker-compose exec ai-worker-gpu python batch_embed_questions.py --reembed"
+            )
+        elif checked:
+            logger.info(f"✅ 질문 은행 임베딩 정책 확인 완료 ({checked}건 표본 일치)")
+    except Exception as e:
+        logger.warning(f"Question embedding policy check failed: {e}")
+
 if __name__ == "__main__":
     logger.info("AI-Worker Celery App initialized.")
     
@@ -0,0 +1,113 @@
+"""
+임베딩 백엔드 비교 (torch vs ONNX int8)
+
+이력서 청크(resume_chunks)와 질문 은행(questions) 텍스트를 DB에서 읽어
+    1. 정확도: 같은 텍스트의 torch/int8 벡터 코사인 유사도 (평균/하위 1%/최소)
+    2. 검색 일치도: 같은 코퍼스 안에서 top-5 이웃 집합의 겹침 비율
+    3. 처리량: CPU에서 텍스트/초
+를 출력합니다. 평균 코사인이 --min-cosine 미만이면 종료 코드 1.
+
+실행 예시
+    docker exec -it interview_worker_cpu python scripts/benchmark_embedding_backends.py --limit 512 --threads 4
+"""
+import os
+import sys
+import time
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+current_dir = Path(__file__).parent
+sys.path.append(str(current_dir.parent.parent / "backend-core"))
+sys.path.append(str(current_dir.parent))
+if os.path.exists("/backend-core"):
+    sys.path.append("/backend-core")
+
+from sqlmodel import Session, select
+from db import engine
+from db_models import Question, ResumeChunk
+
+TOP_K = 5
+
+
+def load_corpora(limit: int) -> dict:
+    """DB에서 코퍼스별 텍스트 최대 limit건 조회"""
+    with Session(engine) as session:
+        chunks = session.exec(select(ResumeChunk.content).limit(limit)).all()
+        questions = session.exec(select(Question.content).where(Question.content != None).limit(limit)).all()
+    return {
+        "resume_chunks": [t for t in chunks if t and t.strip()],
+        "questions": [t for t in questions if t and t.strip()],
+    }
+
+
+def timed_encode(runtime, texts, batch_size: int):
+    """워밍업 후 전체 코퍼스 임베딩 (벡터, 초)"""
+    runtime.encode_passages(texts[:batch_size], batch_size=batch_size)
+    started = time.perf_counter()
+    vectors = np.asarray(runtime.encode_passages(texts, batch_size=batch_size), dtype=np.float32)
+    return vectors, time.perf_counter() - started
+
+
+def neighbor_overlap(ref: np.ndarray, other: np.ndarray, num_queries: int = 100) -> float:
+    """앞쪽 num_queries개 텍스트를 쿼리로 삼아 top-k 이웃(자기 자신 제외) 집합의 평균 겹침 비율"""
+    n = min(num_queries, len(ref))
+    k = min(TOP_K, len(ref) - 1)
+    if n == 0 or k <= 0:
+        return 1.0
+    overlaps = []
+    for i in range(n):
+        ref_scores, other_scores = ref @ ref[i], other @ other[i]
+        ref_scores[i] = other_scores[i] = -np.inf
+        ref_top = set(np.argpartition(-ref_scores, k)[:k])
+        other_top = set(np.argpartition(-other_scores, k)[:k])
+        overlaps.append(len(ref_top & other_top) / k)
+    return float(np.mean(overlaps))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KURE-v1 torch vs ONNX int8 embedding benchmark")
+    parser.add_argument("--limit", type=int, default=512, help="코퍼스별 최대 텍스트 수")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--threads", type=int, default=None, help="ONNX Runtime / torch CPU 스레드 수")
+    parser.add_argument("--min-cosine", type=float, default=0.99, help="허용 최소 평균 코사인")
+    args = parser.parse_args()
+
+    if args.threads:
+        os.environ["EMBEDDING_ONNX_THREADS"] = str(args.threads)
+        import torch
+        torch.set_num_threads(args.threads)
+
+    from utils.embedding_runtime import EmbeddingRuntime
+
+    corpora = load_corpora(args.limit)
+    # 백엔드 자체 처리량을 재기 위해 동적 배칭 없이 --batch-size로 직접 forward
+    torch_rt = EmbeddingRuntime(device="cpu", backend="torch", dynamic_batching=False)
+    onnx_rt = EmbeddingRuntime(backend="onnx-int8", dynamic_batching=False)
+
+    ok = True
+    print(f"{'corpus':<14} {'n':>5} {'torch t/s':>10} {'int8 t/s':>10} {'speedup':>8} "
+          f"{'cos mean':>9} {'cos p1':>8} {'cos min':>8} {'top5 overlap':>13}")
+    for name, texts in corpora.items():
+        if not texts:
+            print(f"{name:<14} (no rows)")
+            continue
+        ref, torch_sec = timed_encode(torch_rt, texts, args.batch_size)
+        quant, onnx_sec = timed_encode(onnx_rt, texts, args.batch_size)
+
+        cosine = np.sum(ref * quant, axis=1)  # 두 백엔드 모두 L2 정규화 출력
+        overlap = neighbor_overlap(ref, quant)
+        torch_tps, onnx_tps = len(texts) / torch_sec, len(texts) / onnx_sec
+        print(f"{name:<14} {len(texts):>5} {torch_tps:>10.1f} {onnx_tps:>10.1f} {onnx_tps / torch_tps:>7.2f}x "
+              f"{cosine.mean():>9.4f} {np.percentile(cosine, 1):>8.4f} {cosine.min():>8.4f} {overlap:>13.3f}")
+        ok = ok and float(cosine.mean()) >= args.min_cosine
+
+    if not ok:
+        print(f"❌ 평균 코사인이 기준({args.min_cosine}) 미만인 코퍼스가 있습니다.")
+        sys.exit(1)
+    print("✅ int8 백엔드 정확도 기준 통과")
+
+
+if __name__ == "__main__":
+    main()
@@ -261,12 +261,10 @@ def import_questions(session, file_path, source_name, generator):
         if not q_type:
             _, q_type = classify_question(q_text)
 
-        # Embedding 생성 (Query 모드 사용 권장? Question 자체는 DB에 저장되어 검색됨(Passage 성격도 있음)
-        # 하지만 질문-질문 유사도 검색 시에는 둘 다 Query 또는 둘 다 Passage로 맞춰야 함.
-        # 벡터 DB 검색 시 유저 쿼리는 "query:", DB 문서는 "passage:"를 붙여 저장하는 비대칭 방식이 일반적.
-        # 여기서는 Question을 '검색 대상'으로 저장하므로 "passage:" 접두어를 사용하여 저장.
-        # 나중에 유저가 질문을 검색할 때 "query:"를 붙여서 검색.
-        q_embedding = generator.encode_passage(q_text)
+        # Embedding 생성: 질문은 유사 질문 검색의 대상이므로 passage API 사용
+        # (KURE-v1은 접두어 없이 학습되어 utils/embedding_runtime의 QUERY_PREFIX/PASSAGE_PREFIX는 빈 문자열)
+        # 질문/답변을 한 배치로 임베딩 (embedding_cache에 있는 텍스트는 재계산하지 않음)
+        q_embedding, a_embedding = generator.encode_batch([q_text, a_text], is_query=False)
 
         # Create Question
         # DB 필드에 직접 저장 (NULL 값 그대로 유지)
@@ -286,8 +284,7 @@ def import_questions(session, file_path, source_name, generator):
         session.add(question)
         session.flush() # To get ID
 
-        # Answer Embedding (Passage)
-        a_embedding = generator.encode_passage(a_text)
+        # Answer Embedding (Passage) - 위에서 질문과 함께 계산됨
 
         # Create AnswerBank
         answer = AnswerBank(
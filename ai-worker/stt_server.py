@@ -0,0 +1,231 @@
+"""
+상주 STT 추론 서버 (Faster-Whisper 1개 인스턴스 + 동적 마이크로 배치)
+
+Celery 워커마다 WhisperModel을 올리는 대신, 이 프로세스 하나가 모델을 계속 보유하고
+여러 면접 세션에서 동시에 들어온 세그먼트를 짧은 대기(STT_BATCH_WAIT_MS) 동안 모아
+CTranslate2 encode/generate 한 번으로 처리합니다.
+
+    python stt_server.py   (docker-compose: stt-server 서비스)
+
+클라이언트/프로토콜: utils/stt_client.py
+"""
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+import numpy as np
+
+app_root = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, app_root)
+
+from faster_whisper import WhisperModel
+from faster_whisper.audio import pad_or_trim
+from faster_whisper.tokenizer import Tokenizer
+from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+# tasks 패키지는 db/backend-core를 임포트하므로 의존성 없는 설정 모듈만 사용
+from config.stt_config import MODEL_SIZE, HALLUCINATION_PHRASES
+from utils.stt_client import HEADER
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(name)s: %(message)s')
+logger = logging.getLogger("STT-Server")
+
+STT_SERVER_HOST = os.getenv("STT_SERVER_HOST", "0.0.0.0")
+STT_SERVER_PORT = int(os.getenv("STT_SERVER_PORT", "9090"))
+STT_BATCH_MAX = int(os.getenv("STT_BATCH_MAX", "8"))              # 한 번에 묶을 최대 세그먼트 수
+STT_BATCH_WAIT_MS = float(os.getenv("STT_BATCH_WAIT_MS", "30"))   # 첫 요청 후 추가 요청을 기다리는 시간
+STT_CPU_THREADS = int(os.getenv("STT_CPU_THREADS", "4"))
+
+SAMPLE_RATE = 16000
+MAX_BATCH_SAMPLES = 30 * SAMPLE_RATE  # Whisper 입력 창(30초)을 넘는 음성은 단독 transcribe로 처리
+NO_SPEECH_THRESHOLD = 0.6
+
+
+class WhisperBatchServer:
+    """설명:
+        WhisperModel 1개를 보유하고 동시 요청을 마이크로 배치로 처리하는 STT 서버.
+        추론은 전용 스레드 1개에서만 수행하여 CTranslate2 내부 스레드(STT_CPU_THREADS)가 경합하지 않게 함.
+
+    Attributes:
+        model (WhisperModel): Faster-Whisper 모델 (CPU, int8).
+        queue (asyncio.Queue): (PCM 바이트, Future) 대기열.
+        stats (dict): 처리 요청/배치 수 통계.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+
+    def __init__(self):
+        logger.info(f"🚀 [LOADING] Faster-Whisper ({MODEL_SIZE}) on CPU (compute_type=int8, threads={STT_CPU_THREADS})...")
+        self.model = WhisperModel(MODEL_SIZE, device="cpu", compute_type="int8", cpu_threads=STT_CPU_THREADS)
+        self.tokenizer = Tokenizer(
+            self.model.hf_tokenizer, self.model.model.is_multilingual, task="transcribe", language="ko"
+        )
+        self.prompt = list(self.tokenizer.sot_sequence) + [self.tokenizer.no_timestamps]
+        # tasks/stt.py 의 vad_parameters 와 동일
+        self.vad_options = VadOptions(
+            threshold=0.35, min_speech_duration_ms=80, min_silence_duration_ms=300, speech_pad_ms=400
+        )
+        self.queue: "asyncio.Queue[Tuple[bytes, asyncio.Future]]" = asyncio.Queue()
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whisper")
+        self.stats = {"requests": 0, "batches": 0}
+
+    # ---------- 추론 (전용 스레드) ----------
+
+    def _speech_only(self, audio: np.ndarray) -> np.ndarray:
+        """Silero VAD로 발화 구간만 이어붙임 (발화가 없으면 빈 배열)"""
+        timestamps = get_speech_timestamps(audio, self.vad_options)
+        if not timestamps:
+            return audio[:0]
+        return np.concatenate([audio[t["start"]:t["end"]] for t in timestamps])
+
+    def _generate(self, speeches: List[np.ndarray]) -> List[str]:
+        """30초 이하 음성 여러 개를 encode/generate 한 번으로 디코딩"""
+        features = np.stack([pad_or_trim(self.model.feature_extractor(s)) for s in speeches]).astype(np.float32)
+        encoder_output = self.model.encode(features)
+        results = self.model.model.generate(
+            encoder_output,
+            [self.prompt] * len(speeches),
+            beam_size=1,
+            max_length=448,
+            return_no_speech_prob=True,
+            suppress_blank=True,
+            suppress_tokens=[-1],
+        )
+        texts = []
+        for res in results:
+            if res.no_speech_prob > NO_SPEECH_THRESHOLD:
+                texts.append("")
+                continue
+            tokens = [t for t in res.sequences_ids[0] if t < self.tokenizer.eot]
+            texts.append(self.tokenizer.decode(tokens).strip())
+        return texts
+
+    def _transcribe_long(self, speech: np.ndarray) -> str:
+        """30초를 넘는 음성은 기존 transcribe 경로로 단독 처리"""
+        segments, _ = self.model.transcribe(speech, beam_size=1, language="ko", condition_on_previous_text=False)
+        return "".join(s.text for s in segments).strip()
+
+    def decode_batch(self, pcms: List[bytes]) -> List[str]:
+        """설명:
+            요청 배치를 인식하여 요청 순서대로 텍스트 반환 (VAD → 배치 디코딩 → 환각 필터).
+
+        Args:
+            pcms (list): 16kHz mono int16 raw PCM 목록.
+
+        Returns:
+            list: 요청 순서와 같은 인식 텍스트 목록.
+
+        생성자: ejm
+        생성일자: 2026-10-17
+        """
+        texts = [""] * len(pcms)
+        batch_idx, speeches = [], []
+        for i, pcm in enumerate(pcms):
+            audio = np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+            speech = self._speech_only(audio)
+            if speech.size == 0:
+                continue
+            if speech.size > MAX_BATCH_SAMPLES:
+                texts[i] = self._transcribe_long(speech)
+            else:
+                batch_idx.append(i)
+                speeches.append(speech)
+
+        if speeches:
+            for i, text in zip(batch_idx, self._generate(speeches)):
+                texts[i] = text
+
+        return [
+            "" if any(h in t for h in HALLUCINATION_PHRASES) and len(t) < 15 else t
+            for t in texts
+        ]
+
+    def warmup(self):
+        """기동 직후 더미 배치를 한 번 디코딩하여 첫 요청 지연 제거"""
+        started = time.time()
+        self._generate([np.zeros(SAMPLE_RATE, dtype=np.float32)] * min(2, STT_BATCH_MAX))
+        logger.info(f"🔥 STT 워밍업 완료 ({time.time() - started:.2f}s)")
+
+    # ---------- 비동기 서버 ----------
+
+    async def batch_loop(self):
+        """대기열에서 첫 요청을 받은 뒤 STT_BATCH_WAIT_MS 동안 추가 요청을 모아 한 번에 처리"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + STT_BATCH_WAIT_MS / 1000
+            while len(batch) < STT_BATCH_MAX:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            started = time.time()
+            try:
+                texts = await loop.run_in_executor(self.executor, self.decode_batch, [pcm for pcm, _ in batch])
+            except Exception as e:
+                logger.error(f"❌ STT 배치 처리 실패: {e}", exc_info=True)
+                for _, fut in batch:
+                    if not fut.done():
+                        fut.set_exception(e)
+                continue
+
+            for (_, fut), text in zip(batch, texts):
+                if not fut.done():
+                    fut.set_result(text)
+            self.stats["requests"] += len(batch)
+            self.stats["batches"] += 1
+            logger.info(
+                f"🎧 STT 배치 {len(batch)}건 처리 ({time.time() - started:.2f}s, "
+                f"누적 {self.stats['requests']}건/{self.stats['batches']}배치)"
+            )
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """연결당 요청을 순서대로 받아 배치 대기열에 넣고 결과를 응답"""
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                try:
+                    (size,) = HEADER.unpack(await reader.readexactly(HEADER.size))
+                    pcm = await reader.readexactly(size)
+                except asyncio.IncompleteReadError:
+                    break
+
+                fut = loop.create_future()
+                await self.queue.put((pcm, fut))
+                try:
+                    response = {"text": await fut}
+                except Exception as e:
+                    response = {"error": str(e)}
+
+                payload = json.dumps(response, ensure_ascii=False).encode("utf-8")
+                writer.write(HEADER.pack(len(payload)) + payload)
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+async def main():
+    server = WhisperBatchServer()
+    server.warmup()
+    asyncio.create_task(server.batch_loop())
+    tcp_server = await asyncio.start_server(server.handle, STT_SERVER_HOST, STT_SERVER_PORT)
+    logger.info(
+        f"✅ STT 서버 대기 중 {STT_SERVER_HOST}:{STT_SERVER_PORT} "
+        f"(batch_max={STT_BATCH_MAX}, wait={STT_BATCH_WAIT_MS}ms)"
+    )
+    async with tcp_server:
+        await tcp_server.serve_forever()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
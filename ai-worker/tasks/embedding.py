@@ -1,19 +1,20 @@
-import sys
-import os
-import json
+import logging
 import torch
-from langchain_huggingface import HuggingFaceEmbeddings
 
 # -----------------------------------------------------------
 # [전역 설정] 
 # nlpai-lab/KURE-v1: 한국어 문장 간의 의미적 유사성을 파악하는 데 특화된 모델입니다.
+# [변경] 모델 로드/접두어/정규화는 utils/embedding_runtime 한 곳에서 관리합니다.
+# (vector_utils와 이 모듈이 각각 모델을 올리던 구조를 단일 인스턴스로 통합)
 # -----------------------------------------------------------
-EMBEDDING_MODEL = "nlpai-lab/KURE-v1" 
+from utils.embedding_runtime import EMBEDDING_MODEL, RuntimeEmbeddings, get_embedding_runtime
+from utils.embedding_batcher import KIND_PASSAGE
+from utils.embedding_cache import encode_cached
+
+logger = logging.getLogger(__name__)
 
 # [문법] _embedder = None
-# 왜 필요할까? 모델은 용량이 매우 크기 때문에(수백 MB ~ GB), 함수를 호출할 때마다 
-# 새로 로드하면 서버가 매우 느려지고 메모리가 금방 바닥납니다.
-# 그래서 처음에만 로드하고 계속 재사용하기 위해 전역 변수로 선언해둡니다.
+# LangChain 인터페이스(PGVector, 쿼리 캐시)용 어댑터. 모델 자체는 런타임 싱글톤이 보유합니다.
 _embedder = None
 
 def get_embedder(device):
@@ -31,28 +32,13 @@ def get_embedder(device):
     """
     global _embedder # 함수 밖의 전역 변수 _embedder를 수정하겠다는 선언입니다.
     
-    if _embedder is None: # 아직 모델이 로드되지 않았을 때만 실행합니다.
-        # [문법] 삼항 연산자: Docker 환경(/app)인지 로컬 환경인지에 따라 모델 저장 경로를 자동으로 결정합니다.
-        cache_dir = "/app/models/embeddings" if os.path.exists("/app/models") else "./models/embeddings"
-        
-        # [문법] os.makedirs: 모델을 저장할 폴더가 없으면 에러가 나므로, 미리 폴더를 만들어둡니다.
-        os.makedirs(cache_dir, exist_ok=True)
-        
-        print(f"🚀 [STEP5] 임베딩 모델 로드 시작 (모델: {EMBEDDING_MODEL})...")
-        
-        # [해석] HuggingFaceEmbeddings 객체를 생성합니다.
-        # model_kwargs={'device': device}: GPU(cuda)를 쓸지 CPU를 쓸지 결정합니다.
-        # encode_kwargs={'normalize_embeddings': True}: 벡터의 길이를 1로 맞추는 수학적 정규화입니다.
-        # 이렇게 해야 나중에 '코사인 유사도'를 계산할 때 결과가 정확하게 나옵니다.
-        _embedder = HuggingFaceEmbeddings(
-            model_name=EMBEDDING_MODEL,
-            model_kwargs={'device': device},
-            encode_kwargs={'normalize_embeddings': True},
-            cache_folder=cache_dir
-        )
-        print("✅ 임베딩 모델 메모리 상주 완료!")
+    if _embedder is None: # 아직 어댑터가 없을 때만 생성합니다.
+        runtime = get_embedding_runtime(device)
+        # [해석] 런타임이 출력 벡터를 L2 정규화(길이 1)하므로 코사인 유사도 계산이 정확합니다.
+        runtime.model  # 모델 로드 (이미 로드되어 있으면 재사용)
+        _embedder = RuntimeEmbeddings(runtime)
         
-    return _embedder # 이미 로드된 상태라면 바로 기존 모델을 돌려줍니다.
+    return _embedder # 이미 생성된 상태라면 바로 기존 어댑터를 돌려줍니다.
  
 def load_embedding_model():
     """설명:
@@ -83,8 +69,8 @@ def embed_chunks(chunks):
     # 1. 장치 설정: [문법] torch.cuda.is_available()는 내 컴퓨터에 쓸만한 그래픽카드가 있는지 체크합니다.
     device = 'cuda' if torch.cuda.is_available() else 'cpu'
     
-    # 2. 모델 일꾼 불러오기: 위에서 만든 get_embedder를 호출해 모델을 가져옵니다.
-    embedder = get_embedder(device)
+    # 2. 모델 일꾼 불러오기: 프로세스 전역 임베딩 런타임을 가져옵니다.
+    runtime = get_embedding_runtime(device)
 
     # 3. 텍스트만 추출
     # [문법] 리스트 컴프리헨션: chunks 리스트 내부의 각 딕셔너리에서 "text" 키값만 뽑아 리스트를 만듭니다.
@@ -93,9 +79,10 @@ def embed_chunks(chunks):
     
     # 4. 벡터 변환 수행 (AI 연산)
     try:
-        # [해석] KURE-v1 모델은 접두어 없이도 뛰어난 성능을 보이므로, 
-        # 복잡한 전처리 없이 원문 그대로 임베딩을 수행하여 데이터의 순수성을 유지합니다.
-        vectors = embedder.embed_documents(texts)
+        # [해석] 이력서 청크는 검색 대상 문서이므로 passage API로 임베딩합니다.
+        # (KURE-v1은 접두어 없이 학습되어 접두어 정책은 런타임이 일괄 적용)
+        # [캐시] 다른 이력서/재처리에서 이미 계산한 청크는 embedding_cache의 벡터를 재사용합니다.
+        vectors = encode_cached(runtime, texts, KIND_PASSAGE)
     except Exception as e:
         # AI 모델 실행 중 에러(메모리 부족 등)가 나면 프로그램이 멈추지 않게 예외 처리를 합니다.
         logger.error(f"❌ 임베딩 모델 실행 중 에러: {e}")
@@ -21,9 +21,12 @@ from db import (
     Speaker,
     update_transcript_sentiment,
     update_transcript_scores,
+    update_transcript_scores_bulk,
     update_question_avg_score,
     get_interview_transcripts,
-    get_user_answers
+    get_user_answers,
+    get_report_section_summaries,
+    upsert_report_section_summary
 )
 from sqlmodel import select
 
@@ -38,6 +41,52 @@ COMPANY_IDEAL_STAGES = {
     "growth_followup",        # 14. 성장가능성 심층
 }
 
+# [Map-Reduce 리포트] 리포트 섹션 → 해당 섹션을 구성하는 스테이지 목록 (면접 진행 순서)
+# 섹션의 마지막 스테이지가 끝나는 즉시 섹션 요약(Map)을 만들어 DB에 캐시하고,
+# finalize_report_task는 캐시된 요약들만 병합(Reduce)함
+REPORT_SECTIONS = {
+    "intro": ["intro", "motivation"],
+    "technical": ["skill", "skill_followup"],
+    "experience": ["experience", "experience_followup"],
+    "problem_solving": ["problem_solving", "problem_solving_followup", "problem_solving_deep"],
+    "communication": ["communication", "communication_followup"],
+    "responsibility": ["responsibility", "responsibility_followup"],
+    "growth": ["growth", "growth_followup"],
+    "closing": ["final_statement", "closing"],
+}
+
+REPORT_SECTION_NAMES = {
+    "intro": "자기소개 및 지원 동기",
+    "technical": "직무 지식 이해도",
+    "experience": "직무 경험",
+    "problem_solving": "문제 해결",
+    "communication": "협업 및 소통",
+    "responsibility": "책임감 및 가치관",
+    "growth": "성장 가능성",
+    "closing": "최종 발언",
+}
+
+def get_report_section(stage_name: str):
+    """설명:
+        스테이지 이름이 속한 리포트 섹션 반환
+
+    Args:
+        stage_name (str): 질문 스테이지 이름
+
+    Returns:
+        str | None: 섹션 이름 (해당 없음이면 None)
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    for section, stages in REPORT_SECTIONS.items():
+        if stage_name in stages:
+            return section
+    return None
+
+# [배치 평가] 한 번의 LLM 호출로 평가할 답변 수 (프롬프트/출력 길이와 정확도의 균형점)
+EVAL_BATCH_SIZE = int(os.getenv("EVAL_BATCH_SIZE", "4"))
+
 # AI-Worker 루트 디렉토리를 찾아 sys.path에 추가
 current_file_path = os.path.abspath(__file__) # tasks/evaluator.py
 tasks_dir = os.path.dirname(current_file_path) # tasks/
@@ -106,6 +155,48 @@ class AnswerEvalSchema(BaseModel):
     rubric_scores: Dict[str, int] = Field(description="루브릭 세부 항목별 점수 (예: {'논리적 구조': 35, '핵심 전달력': 30, ...})")
     feedback: str = Field(description="답변에 대한 구체적이고 건설적인 피드백 (마크다운 없이 평문으로 작성)")
 
+class BatchAnswerEvalItem(AnswerEvalSchema):
+    """설명:
+        배치 평가 시 답변 1건의 평가 결과 (입력 답변 번호 포함).
+
+    Attributes:
+        index (int): 평가 대상 답변 번호 ([답변 N]의 N).
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    index: int = Field(description="평가 대상 답변 번호 ([답변 N]의 N)")
+
+class BatchAnswerEvalSchema(BaseModel):
+    """설명:
+        여러 답변을 한 번에 평가한 결과 목록을 담는 Pydantic 스키마.
+
+    Attributes:
+        results (List[BatchAnswerEvalItem]): 답변 번호별 평가 결과.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    results: List[BatchAnswerEvalItem] = Field(description="입력된 모든 답변에 대한 평가 결과 (답변 번호 순, 누락 없이)")
+
+class SectionSummarySchema(BaseModel):
+    """설명:
+        리포트 섹션(스테이지 묶음) 1개에 대한 사전 요약 스키마 (Map 단계 출력).
+
+    Attributes:
+        score (int): 섹션 점수 (0-100).
+        summary (str): 근거 중심 섹션 분석.
+        strengths (List[str]): 섹션에서 드러난 강점.
+        improvements (List[str]): 섹션에서 드러난 보완점.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    score: int = Field(description="섹션 점수 (0-100)")
+    summary: str = Field(description="루브릭 지표와 답변을 대조한 근거 중심 분석 (3문장 이상, 마크다운 없이 평문)")
+    strengths: List[str] = Field(description="답변 발화를 근거로 인용한 강점 (1~2개, 각 2문장 이상)")
+    improvements: List[str] = Field(description="답변 발화를 근거로 인용한 보완점 (1~2개, 각 2문장 이상)")
+
 class FinalReportSchema(BaseModel):
     """설명:
         최종 면접 리포트 데이터를 담는 Pydantic 스키마.
@@ -149,6 +240,62 @@ class FinalReportSchema(BaseModel):
     )
     summary_text: str = Field(description="성장을 위한 시니어 위원장의 최종 한마디 (3문장 내외)")
 
+# 평가 위원회 페르소나 (단건/배치 평가 공용 → Prefix KV 캐시를 함께 재사용)
+EVAL_SYSTEM_MSG = """[|system|]귀하는 기술력, 소통 능력, 조직 적합성을 정밀 검증하는 'AI 채용 평가 위원회'의 전문 심사관입니다.
+LG AI Research가 개발한 EXAONE으로서, 제공된 루브릭을 절대적 기준으로 삼아 지원자의 답변을 냉철하게 분석하고 수치화된 점수와 건설적인 피드백을 산출하십시오.
+
+[평가 가이드라인]
+1. **기술적 엄밀성**: 답변에 포함된 기술 개념의 정확성과 선택 근거의 타당성을 최우선으로 검토하십시오.
+2. **증거 중심 피드백**: 지원자의 답변 중 어떤 표현이나 사례가 루브릭 지표에 부합했는지 구체적으로 인용하십시오.
+3. **수치화**: 루브릭 점수를 엄격히 준수하되, 답변이 모호한 경우 보수적으로 평가하십시오.
+4. **인재상 반영**: 인재상 정보가 제공된 경우 분석 결과에 반드시 포함하십시오.
+5. **텍스트 정제 (No Markdown)**: 마크다운 문법을 절대 사용하지 마십시오. 오직 순수한 평문(Plain Text)으로만 작성하십시오.[|endofturn|]"""
+
+def _resolve_rubric(stage_name: str, rubric: dict = None) -> dict:
+    """설명:
+        스테이지별 100점 만점 상세 루브릭을 우선 적용하고, 없으면 전달된 루브릭 또는 기본 루브릭 반환
+
+    Args:
+        stage_name (str): 질문 스테이지 이름
+        rubric (dict): 질문에 저장된 루브릭 (선택)
+
+    Returns:
+        dict: 평가에 사용할 루브릭
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    real_rubric = get_rubric_for_stage(stage_name)
+    if real_rubric:
+        return real_rubric
+    if not rubric:
+        return {
+            "name": "일반 평가",
+            "detailed_scoring": {"전반적 답변 품질": 100},
+            "scoring_guide": {"excellent": {"range": [85, 100]}}
+        }
+    return rubric
+
+def _build_rubric_db_data(rubric: dict, rubric_scores: dict) -> dict:
+    """설명:
+        Transcript.rubric_score 컬럼에 저장할 루브릭 점수 구조 생성
+
+    Args:
+        rubric (dict): 평가에 사용된 루브릭
+        rubric_scores (dict): LLM이 산출한 세부 항목별 점수
+
+    Returns:
+        dict: 평가영역/세부항목점수/항목별배점
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    return {
+        "평가영역": rubric.get("name", "일반 평가") if rubric else "일반 평가",
+        "세부항목점수": rubric_scores,
+        "항목별배점": rubric.get("detailed_scoring", {}) if rubric else {}
+    }
+
 def _analyze_answer_logic(transcript_id: int, question_text: str, answer_text: str, rubric: dict = None, question_id: int = None, question_type: str = None):
     """설명:
         개별 답변 평가 핵심 로직 (DB 업데이트 포함)
@@ -186,18 +333,7 @@ def _analyze_answer_logic(transcript_id: int, question_text: str, answer_text: s
         # logger.info(f"🔍 Analyzing Answer: Stage={stage_name}, QuestionID={question_id}")
 
         # [핵심] 100점 만점 상세 루브릭 우선 적용
-        real_rubric = get_rubric_for_stage(stage_name)
-        if real_rubric:
-            rubric = real_rubric
-            # logger.info(f"📊 Using REAL Detailed Rubric for {stage_name}")
-        elif not rubric or "guide" in rubric:
-            # logger.warning(f"⚠️ No matching detailed rubric found for stage: {stage_name}. Using fallback.")
-            if not rubric:
-                rubric = {
-                    "name": "일반 평가",
-                    "detailed_scoring": {"전반적 답변 품질": 100},
-                    "scoring_guide": {"excellent": {"range": [85, 100]}}
-                }
+        rubric = _resolve_rubric(stage_name, rubric)
         
         # LangChain Parser 설정
         parser = JsonOutputParser(pydantic_object=AnswerEvalSchema)
@@ -225,15 +361,7 @@ def _analyze_answer_logic(transcript_id: int, question_text: str, answer_text: s
                 logger.warning(f"⚠️ 인재상 조회 실패: {ideal_err}")
 
         # 프롬프트 구성
-        system_msg = """[|system|]귀하는 기술력, 소통 능력, 조직 적합성을 정밀 검증하는 'AI 채용 평가 위원회'의 전문 심사관입니다.
-LG AI Research가 개발한 EXAONE으로서, 제공된 루브릭을 절대적 기준으로 삼아 지원자의 답변을 냉철하게 분석하고 수치화된 점수와 건설적인 피드백을 산출하십시오.
-
-[평가 가이드라인]
-1. **기술적 엄밀성**: 답변에 포함된 기술 개념의 정확성과 선택 근거의 타당성을 최우선으로 검토하십시오.
-2. **증거 중심 피드백**: 지원자의 답변 중 어떤 표현이나 사례가 루브릭 지표에 부합했는지 구체적으로 인용하십시오.
-3. **수치화**: 루브릭 점수를 엄격히 준수하되, 답변이 모호한 경우 보수적으로 평가하십시오.
-4. **인재상 반영**: 인재상 정보가 제공된 경우 분석 결과에 반드시 포함하십시오.
-5. **텍스트 정제 (No Markdown)**: 마크다운 문법을 절대 사용하지 마십시오. 오직 순수한 평문(Plain Text)으로만 작성하십시오.[|endofturn|]"""
+        system_msg = EVAL_SYSTEM_MSG
 
         user_msg = f"""[|user|]다음 질문에 대한 지원자의 답변을 루브릭 기준에 맞춰 정밀 평가하십시오.
         
@@ -249,7 +377,8 @@ LG AI Research가 개발한 EXAONE으로서, 제공된 루브릭을 절대적 
 {parser.get_format_instructions()}[|endofturn|]"""
         
         prompt = f"{system_msg}\n{user_msg}\n[|assistant|]"
-        raw_output = llm_engine.invoke(prompt, temperature=0.2)
+        # [Prefix KV 캐시] 평가 위원회 system_msg는 모든 면접에서 동일하므로 전역 범위로 재사용
+        raw_output = llm_engine.invoke(prompt, temperature=0.2, cache_prefix=f"{system_msg}\n", cache_scope="evaluator")
         
         try:
             result = parser.parse(raw_output)
@@ -263,11 +392,7 @@ LG AI Research가 개발한 EXAONE으로서, 제공된 루브릭을 절대적 
         tech_score = int(result.get("total_score", 70))
         rubric_scores = result.get("rubric_scores", {})
         
-        db_rubric_data = {
-            "평가영역": rubric.get("name", "일반 평가") if rubric else "일반 평가",
-            "세부항목점수": rubric_scores,
-            "항목별배점": rubric.get("detailed_scoring", {}) if rubric else {}
-        }
+        db_rubric_data = _build_rubric_db_data(rubric, rubric_scores)
 
         try:
             update_transcript_scores(transcript_id, total_score=float(tech_score), rubric_score=db_rubric_data)
@@ -303,6 +428,158 @@ def analyze_answer(transcript_id: int, question_text: str, answer_text: str, rub
     """
     return _analyze_answer_logic(transcript_id, question_text, answer_text, rubric, question_id, question_type)
 
+def _analyze_answers_batch_logic(interview_id: int, items: List[Dict[str, Any]]) -> Dict[int, dict]:
+    """설명:
+        여러 답변을 하나의 구조화된 프롬프트로 묶어 한 번의 LLM 호출로 평가하고,
+        결과를 update_transcript_scores_bulk로 일괄 저장.
+        출력에서 누락되었거나 파싱에 실패한 답변은 단건 평가(_analyze_answer_logic)로 폴백.
+
+    Args:
+        interview_id (int): 면접 ID (인재상 조회용)
+        items (list): {"transcript_id", "question_text", "answer_text", "rubric", "question_id", "question_type"} 목록
+
+    Returns:
+        dict: transcript_id → 평가 결과
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    start_ts = time.time()
+    results: Dict[int, dict] = {}
+    if not items:
+        return results
+
+    # 1. 답변별 루브릭 결정 (동일 루브릭은 한 번만 프롬프트에 포함)
+    rubric_labels: Dict[str, str] = {}
+    rubric_blocks: List[str] = []
+    item_rubrics: List[dict] = []
+    for item in items:
+        rubric = _resolve_rubric(item.get("question_type") or "unknown", item.get("rubric"))
+        item_rubrics.append(rubric)
+        rubric_json = json.dumps(rubric, ensure_ascii=False)
+        if rubric_json not in rubric_labels:
+            label = f"R{len(rubric_labels) + 1}"
+            rubric_labels[rubric_json] = label
+            rubric_blocks.append(f"({label}) {rubric_json}")
+
+    # 2. 인재상 (9~14번 스테이지 답변이 있을 때만 1회 조회)
+    company_ideal_section = ""
+    if any(item.get("question_type") in COMPANY_IDEAL_STAGES for item in items):
+        try:
+            with Session(engine) as session:
+                interview_obj = session.get(Interview, interview_id)
+                company_obj = session.get(Company, interview_obj.company_id) if interview_obj and interview_obj.company_id else None
+                if company_obj and company_obj.ideal:
+                    company_ideal_section = f"\n\n[회사 인재상 참고]\n지원 회사: {company_obj.company_name}\n인재상: {company_obj.ideal}\n※ '인재상 반영' 표시가 있는 답변은 위 인재상과의 부합 여부를 평가 시 반드시 반영하십시오."
+        except Exception as ideal_err:
+            logger.warning(f"⚠️ 인재상 조회 실패: {ideal_err}")
+
+    # 3. 답변 블록 구성
+    answer_blocks = []
+    for idx, (item, rubric) in enumerate(zip(items, item_rubrics), start=1):
+        label = rubric_labels[json.dumps(rubric, ensure_ascii=False)]
+        ideal_mark = ", 인재상 반영" if company_ideal_section and item.get("question_type") in COMPANY_IDEAL_STAGES else ""
+        answer_blocks.append(
+            f"[답변 {idx}] (루브릭: {label}{ideal_mark})\n[질문]\n{item['question_text']}\n[답변]\n{item['answer_text']}"
+        )
+
+    parser = JsonOutputParser(pydantic_object=BatchAnswerEvalSchema)
+    user_msg = f"""[|user|]다음 {len(items)}개의 질문-답변 쌍을 각 쌍에 지정된 루브릭 기준에 맞춰 정밀 평가하십시오.
+각 답변은 서로 독립적으로 평가하며, 다른 답변의 내용이 점수에 영향을 주어서는 안 됩니다.
+results 배열에 [답변 1]부터 [답변 {len(items)}]까지 빠짐없이 index를 붙여 출력하십시오.
+
+[평가 루브릭 목록]
+{chr(10).join(rubric_blocks)}{company_ideal_section}
+
+{chr(10).join(answer_blocks)}
+
+{parser.get_format_instructions()}[|endofturn|]"""
+
+    prompt = f"{EVAL_SYSTEM_MSG}\n{user_msg}\n[|assistant|]"
+    parsed_items: Dict[int, dict] = {}
+    try:
+        llm_engine = get_exaone_llm()
+        raw_output = llm_engine.invoke(
+            prompt,
+            temperature=0.2,
+            max_tokens=min(600 * len(items) + 200, 4096),
+            cache_prefix=f"{EVAL_SYSTEM_MSG}\n",
+            cache_scope="evaluator"
+        )
+        try:
+            parsed = parser.parse(raw_output)
+        except Exception:
+            json_match = re.search(r'\{.*\}', raw_output, re.DOTALL)
+            parsed = json.loads(json_match.group()) if json_match else {}
+        for r in (parsed or {}).get("results", []):
+            try:
+                parsed_items[int(r.get("index"))] = r
+            except (TypeError, ValueError):
+                continue
+    except Exception as e:
+        logger.error(f"❌ Batch evaluation LLM call failed: {e}")
+
+    # 4. 결과 매핑 및 일괄 저장
+    score_updates = []
+    fallback_items = []
+    for idx, (item, rubric) in enumerate(zip(items, item_rubrics), start=1):
+        r = parsed_items.get(idx)
+        if not r or r.get("total_score") is None:
+            fallback_items.append(item)
+            continue
+        try:
+            tech_score = int(r.get("total_score"))
+        except (TypeError, ValueError):
+            fallback_items.append(item)
+            continue
+        rubric_scores = r.get("rubric_scores", {}) or {}
+        score_updates.append({
+            "transcript_id": item["transcript_id"],
+            "total_score": float(tech_score),
+            "rubric_score": _build_rubric_db_data(rubric, rubric_scores),
+            "question_id": item.get("question_id")
+        })
+        results[item["transcript_id"]] = {
+            "total_score": tech_score,
+            "rubric_scores": rubric_scores,
+            "feedback": r.get("feedback", "")
+        }
+
+    try:
+        update_transcript_scores_bulk(score_updates)
+    except Exception as db_err:
+        logger.error(f"❌ 배치 평가 DB 일괄 저장 오류 (Interview {interview_id}): {db_err}")
+
+    logger.info(
+        f"📦 Batch evaluated {len(score_updates)}/{len(items)} answers in one pass "
+        f"({time.time() - start_ts:.1f}s, fallback: {len(fallback_items)})"
+    )
+
+    for item in fallback_items:
+        results[item["transcript_id"]] = _analyze_answer_logic(
+            item["transcript_id"], item["question_text"], item["answer_text"],
+            item.get("rubric"), item.get("question_id"), item.get("question_type")
+        )
+    return results
+
+@shared_task(name="tasks.evaluator.analyze_answers_batch")
+def analyze_answers_batch(interview_id: int, items: List[Dict[str, Any]]):
+    """설명:
+        여러 답변을 한 번의 LLM 호출로 평가하는 배치 평가 태스크
+
+    Args:
+        interview_id (int): 면접 ID
+        items (list): 평가 대상 답변 목록 (_analyze_answers_batch_logic 참고)
+
+    Returns:
+        dict: transcript_id(str) → 평가 결과 (Celery JSON 직렬화를 위해 키를 문자열로 변환)
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    results = _analyze_answers_batch_logic(interview_id, items)
+    return {str(k): v for k, v in results.items()}
+
 @shared_task(name="tasks.evaluator.generate_final_report")
 def generate_final_report(interview_id: int):
     """설명:
@@ -326,28 +603,36 @@ def generate_final_report(interview_id: int):
             # 답변이 하나도 없으면 바로 최종 단계로 (혹은 오류 처리)
             return finalize_report_task.delay(None, interview_id)
 
-        subtasks = []
-        for t in transcripts:
-            # 점수가 없는 답변만 평가 대상으로 등록
-            if t.total_score is None or t.total_score == 0:
-                with Session(engine) as session:
-                    q = session.get(Question, t.question_id) if t.question_id else None
-                
+        # 점수가 없는 답변만 평가 대상으로 등록 (질문은 한 번의 세션에서 일괄 조회)
+        pending = [t for t in transcripts if (t.total_score is None or t.total_score == 0) and t.question_id]
+        items = []
+        if pending:
+            with Session(engine) as session:
+                q_ids = {t.question_id for t in pending}
+                questions = {q.id: q for q in session.exec(select(Question).where(Question.id.in_(q_ids))).all()}
+            for t in pending:
+                q = questions.get(t.question_id)
                 if q:
-                    subtasks.append(
-                        analyze_answer.s(
-                            transcript_id=t.id,
-                            question_text=q.content,
-                            answer_text=t.text,
-                            rubric=q.rubric_json,
-                            question_id=t.question_id,
-                            question_type=q.question_type
-                        )
-                    )
-        
-        if subtasks:
-            logger.info(f"⛓️  Parallelizing {len(subtasks)} answer evaluations...")
-            # 병렬 실행 후 마지막에 리포트 마무리 태스크 연결 (Chain)
+                    items.append({
+                        "transcript_id": t.id,
+                        "question_text": q.content,
+                        "answer_text": t.text,
+                        "rubric": q.rubric_json,
+                        "question_id": t.question_id,
+                        "question_type": q.question_type
+                    })
+
+        if items:
+            # [배치 평가] report_queue 태스크의 EXAONE 호출은 llm-server의 batch 클래스로 모여
+            # 추론 스레드 1개에서 (실시간 질문 생성에 양보하며) 차례로 처리되므로, 답변마다 태스크를 나누면
+            # 공통 지시문 prefill만 반복됨 → EVAL_BATCH_SIZE개씩 묶어 한 번의 LLM 호출로 평가
+            batch_size = max(1, EVAL_BATCH_SIZE)
+            subtasks = [
+                analyze_answers_batch.s(interview_id, items[i:i + batch_size])
+                for i in range(0, len(items), batch_size)
+            ]
+            logger.info(f"⛓️  Evaluating {len(items)} answers in {len(subtasks)} batches (size {batch_size})...")
+            # 배치 평가 후 마지막에 리포트 마무리 태스크 연결 (Chain)
             workflow = chain(group(subtasks), finalize_report_task.s(interview_id))
             return workflow.apply_async()
         else:
@@ -358,6 +643,252 @@ def generate_final_report(interview_id: int):
         logger.error(f"❌ Error initiating report pipeline: {e}")
         return {"status": "error", "message": str(e)}
 
+def _load_report_context(interview_id: int) -> Dict[str, str]:
+    """설명:
+        리포트 생성에 필요한 면접 직무 및 회사 인재상 정보 조회
+
+    Args:
+        interview_id (int): 면접 ID
+
+    Returns:
+        dict: position, company_name, company_ideal
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    ctx = {"position": "지원 직무", "company_name": "해당 기업", "company_ideal": "기본 인재상: 성실, 협업, 도전"}
+    with Session(engine) as session:
+        interview = session.get(Interview, interview_id)
+        if not interview:
+            return ctx
+        ctx["position"] = interview.position or ctx["position"]
+
+        # ① Interview에 직접 연결된 회사 확인
+        company_obj = None
+        if interview.company_id:
+            company_obj = session.get(Company, interview.company_id)
+
+        # ② 이력서의 target_company를 통한 검색 (fallback)
+        if not company_obj and interview.resume_id:
+            resume_obj = session.get(Resume, interview.resume_id)
+            if resume_obj and resume_obj.structured_data:
+                target_co = resume_obj.structured_data.get("header", {}).get("target_company", "")
+                if target_co:
+                    norm_name = target_co.replace(" ", "").lower()
+                    all_cos = session.exec(select(Company)).all()
+                    company_obj = next((c for c in all_cos if c.company_name and c.company_name.replace(" ", "").lower() == norm_name), None)
+
+        if company_obj:
+            ctx["company_name"] = company_obj.company_name
+            ctx["company_ideal"] = company_obj.ideal or ctx["company_ideal"]
+    return ctx
+
+def _collect_section_answers(transcripts: list) -> Dict[str, List[dict]]:
+    """설명:
+        면접 발화 목록을 리포트 섹션별 질문-답변 쌍으로 분류 (질문은 한 번의 세션에서 일괄 조회)
+
+    Args:
+        transcripts (list): 면접 전체 Transcript 목록
+
+    Returns:
+        dict: section → [{"transcript_id", "question_text", "answer_text", "stage"}]
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    answers = [t for t in transcripts if t.speaker != Speaker.AI and t.question_id and (t.text or "").strip()]
+    if not answers:
+        return {}
+
+    with Session(engine) as session:
+        q_ids = {t.question_id for t in answers}
+        questions = {q.id: q for q in session.exec(select(Question).where(Question.id.in_(q_ids))).all()}
+
+    sections: Dict[str, List[dict]] = {}
+    for t in answers:
+        q = questions.get(t.question_id)
+        section = get_report_section(q.question_type) if q else None
+        if not section:
+            continue
+        sections.setdefault(section, []).append({
+            "transcript_id": t.id,
+            "question_text": q.content,
+            "answer_text": t.text,
+            "stage": q.question_type
+        })
+    return sections
+
+def _summarize_section_logic(interview_id: int, section: str, qa_pairs: List[dict], ctx: Dict[str, str]) -> dict:
+    """설명:
+        리포트 섹션 1개의 질문-답변만으로 섹션 요약을 생성하고 DB에 캐시 (Map 단계)
+
+    Args:
+        interview_id (int): 면접 ID
+        section (str): 섹션 이름
+        qa_pairs (list): 섹션에 속한 질문-답변 쌍 (_collect_section_answers 참고)
+        ctx (dict): _load_report_context 결과
+
+    Returns:
+        dict: score, summary, strengths, improvements
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    start_ts = time.time()
+    parser = JsonOutputParser(pydantic_object=SectionSummarySchema)
+    rubric_area = get_rubric_for_stage(qa_pairs[0]["stage"]) or {}
+    qa_text = "\n\n".join(f"[질문]\n{p['question_text']}\n[답변]\n{p['answer_text']}" for p in qa_pairs)
+
+    ideal_section = ""
+    if section in ("communication", "responsibility", "growth"):
+        ideal_section = f"\n\n[기업 인재상]\n회사명: {ctx['company_name']}\n인재상: {ctx['company_ideal']}\n※ 인재상과의 부합 여부를 분석에 반드시 반영하십시오."
+
+    system_msg = """[|system|]당신은 대한민국 최고의 기술 기업에서 수만 명의 인재를 발굴해온 전문 채용 위원장입니다.
+LG AI Research의 EXAONE으로서, 면접의 한 평가 영역에 해당하는 질문-답변만을 분석하여 최종 리포트에 들어갈 영역별 사전 요약을 작성하십시오.
+
+[핵심 평가 프로토콜]
+1. **근거 중심 분석**: 루브릭 지표와 지원자의 답변을 대조하여, 어떤 발화가 어떤 지표에 부합했는지 구체적으로 인용하십시오.
+2. **STAR 기법 기반 검증**: 성과 설명 시 상황(S)-과업(T)-행동(A)-결과(R) 구조로 실질적인 기여도를 증명했는지 평가하십시오.
+3. **수치화**: 루브릭을 엄격히 적용하되, 답변이 모호한 경우 보수적으로 평가하십시오.
+4. **텍스트 정제 (No Markdown)**: 마크다운 문법을 일절 사용하지 마십시오. 오직 순수한 평문(Plain Text)으로만 서술하십시오.[|endofturn|]"""
+
+    user_msg = f"""[|user|]지원 직무 '{ctx['position']}' 면접의 [{REPORT_SECTION_NAMES.get(section, section)}] 영역 요약을 작성하십시오.
+
+[영역 질문-답변]
+{qa_text}
+
+[평가 루브릭]
+{json.dumps(rubric_area, ensure_ascii=False) if rubric_area else "표준 면접 평가 기준"}{ideal_section}
+
+{parser.get_format_instructions()}[|endofturn|]"""
+
+    prompt = f"{system_msg}\n{user_msg}\n[|assistant|]"
+    raw_output = get_exaone_llm().invoke(
+        prompt, temperature=0.3, max_tokens=1200,
+        cache_prefix=f"{system_msg}\n", cache_scope="report_section"
+    )
+    try:
+        result = parser.parse(raw_output)
+    except Exception:
+        json_match = re.search(r'\{.*\}', raw_output or "", re.DOTALL)
+        if not json_match:
+            raise ValueError(f"Section '{section}' summary could not be parsed")
+        result = json.loads(json_match.group())
+
+    summary = {
+        "score": float(result.get("score", 0) or 0),
+        "summary": result.get("summary", ""),
+        "strengths": [x for x in result.get("strengths", []) if x],
+        "improvements": [x for x in result.get("improvements", []) if x],
+    }
+    upsert_report_section_summary(
+        interview_id, section,
+        source_transcript_ids=sorted(p["transcript_id"] for p in qa_pairs),
+        **summary
+    )
+    logger.info(f"🧩 [MAP] Section '{section}' summarized for Interview {interview_id} ({len(qa_pairs)} answers, {time.time() - start_ts:.1f}s)")
+    return summary
+
+@shared_task(name="tasks.evaluator.summarize_report_section")
+def summarize_report_section(interview_id: int, section: str):
+    """설명:
+        섹션(스테이지 묶음)이 끝났을 때 해당 섹션의 사전 요약을 생성하는 태스크 (Map 단계).
+        질문 생성 태스크가 섹션 전환을 감지하면 발행하며, 이미 같은 답변으로 요약되어 있으면 건너뜀.
+
+    Args:
+        interview_id (int): 면접 ID
+        section (str): 섹션 이름
+
+    Returns:
+        dict: 상태 및 섹션 요약
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    try:
+        section_answers = _collect_section_answers(get_interview_transcripts(interview_id))
+        qa_pairs = section_answers.get(section)
+        if not qa_pairs:
+            return {"status": "skipped", "section": section, "reason": "no_answers"}
+
+        cached = get_report_section_summaries(interview_id).get(section)
+        if cached and sorted(cached.source_transcript_ids or []) == sorted(p["transcript_id"] for p in qa_pairs):
+            return {"status": "cached", "section": section}
+
+        summary = _summarize_section_logic(interview_id, section, qa_pairs, _load_report_context(interview_id))
+        return {"status": "success", "section": section, "summary": summary}
+    except Exception as e:
+        logger.error(f"❌ Section summary failed (Interview {interview_id}, {section}): {e}")
+        return {"status": "error", "section": section, "message": str(e)}
+
+def _merge_section_summaries(sections: Dict[str, dict], ctx: Dict[str, str]) -> dict:
+    """설명:
+        섹션별 사전 요약을 FinalReportSchema 형태로 병합 (Reduce 단계).
+        영역 점수/피드백은 섹션 요약을 그대로 사용하고, 종합 한마디(summary_text)만 짧게 생성.
+
+    Args:
+        sections (dict): section → 섹션 요약
+        ctx (dict): _load_report_context 결과
+
+    Returns:
+        dict: FinalReportSchema 필드를 담은 리포트 결과
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    all_scores = [v["score"] for v in sections.values() if v.get("score") is not None]
+    default_score = int(sum(all_scores) / len(all_scores)) if all_scores else 70
+
+    def area(keys):
+        picked = [sections[k] for k in keys if k in sections]
+        if not picked:
+            return default_score, ""
+        score = int(sum(p["score"] for p in picked) / len(picked))
+        feedback = " ".join(p["summary"] for p in picked if p.get("summary"))
+        return score, feedback
+
+    result = {}
+    for field, keys in (
+        ("technical", ["technical"]),
+        ("experience", ["experience"]),
+        ("problem_solving", ["problem_solving"]),
+        ("communication", ["communication", "intro", "closing"]),
+        ("responsibility", ["responsibility"]),
+        ("growth", ["growth"]),
+    ):
+        score, feedback = area(keys)
+        result[f"{field}_score"] = score
+        result[f"{field}_feedback"] = feedback
+
+    area_scores = [result[f"{f}_score"] for f in ("technical", "experience", "problem_solving", "communication", "responsibility", "growth")]
+    result["overall_score"] = int(sum(area_scores) / len(area_scores))
+
+    # 강점은 점수가 높은 섹션, 보완점은 낮은 섹션에서 우선 선택
+    ranked = sorted(sections.values(), key=lambda v: v.get("score") or 0, reverse=True)
+    result["strengths"] = [v["strengths"][0] for v in ranked if v.get("strengths")][:3]
+    result["improvements"] = [v["improvements"][0] for v in reversed(ranked) if v.get("improvements")][:3]
+
+    # 종합 한마디만 짧게 생성 (입력은 섹션 요약뿐이므로 대화 전문 대비 수십 분의 일 길이)
+    digest = "\n".join(
+        f"- {REPORT_SECTION_NAMES.get(k, k)} ({int(v['score'])}점): {v.get('summary', '')}"
+        for k, v in sections.items()
+    )
+    try:
+        prompt = f"""[|system|]당신은 '{ctx['position']}' 분야 전문 채용 위원장입니다. 마크다운 없이 평문으로만 답하십시오.[|endofturn|]
+[|user|]다음은 면접 영역별 분석 요약입니다. {ctx['company_name']}의 인재상({ctx['company_ideal']})을 고려하여, 강점은 극대화하고 약점은 성장의 기회로 전환할 수 있도록 시니어 위원장의 최종 한마디를 3문장 내외로 작성하십시오.
+
+{digest}[|endofturn|]
+[|assistant|]"""
+        summary_text = (get_exaone_llm().invoke(prompt, temperature=0.3, max_tokens=400) or "").strip()
+    except Exception as e:
+        logger.warning(f"⚠️ Summary text generation failed, using section digest: {e}")
+        summary_text = ""
+    if not summary_text:
+        best, worst = ranked[0], ranked[-1]
+        summary_text = f"{best.get('summary', '')} {worst.get('improvements', [''])[0] if worst.get('improvements') else ''}".strip()
+    result["summary_text"] = summary_text
+    return result
+
 @shared_task(name="tasks.evaluator.finalize_report_task")
 def finalize_report_task(prev_results, interview_id: int):
     """설명:
@@ -386,43 +917,10 @@ def finalize_report_task(prev_results, interview_id: int):
         transcripts = get_interview_transcripts(interview_id)
         logger.info(f"📊 Found {len(transcripts)} transcripts for Interview {interview_id}")
 
-        # 🧹 메모리 청소 (리포트 분석 전 공간 확보)
-        import gc
-        import torch
-        if torch.cuda.is_available():
-            torch.cuda.empty_cache()
-        gc.collect()
-        
         # 인터뷰 정보 및 회사 인재상 가져오기
-        with Session(engine) as session:
-            interview = session.get(Interview, interview_id)
-            position = interview.position if interview else "지원 직무"
-            company_name = "해당 기업"
-            company_ideal = "기본 인재상: 성실, 협업, 도전"
-
-            # 1. 인재상(ideal) 정보 로드
-            if interview:
-                from db import Company, Resume
-                # ① Interview에 직접 연결된 회사 확인
-                company_obj = None
-                if interview.company_id:
-                    company_obj = session.get(Company, interview.company_id)
-                
-                # ② 이력서의 target_company를 통한 검색 (fallback)
-                if not company_obj and interview.resume_id:
-                    resume_obj = session.get(Resume, interview.resume_id)
-                    if resume_obj and resume_obj.structured_data:
-                        target_co = resume_obj.structured_data.get("header", {}).get("target_company", "")
-                        if target_co:
-                            from sqlmodel import select as sql_select
-                            norm_name = target_co.replace(" ", "").lower()
-                            all_cos = session.exec(sql_select(Company)).all()
-                            company_obj = next((c for c in all_cos if c.company_name and c.company_name.replace(" ", "").lower() == norm_name), None)
-
-                if company_obj:
-                    company_name = company_obj.company_name
-                    company_ideal = company_obj.ideal or company_ideal
-                    logger.info(f"✅ 리포트 생성용 인재상 로드 완료: {company_name}")
+        ctx = _load_report_context(interview_id)
+        if ctx["company_name"] != "해당 기업":
+            logger.info(f"✅ 리포트 생성용 인재상 로드 완료: {ctx['company_name']}")
 
         if not transcripts:
             logger.warning("이 인터뷰에 대한 대화 내역을 찾을 수 없습니다.")
@@ -434,78 +932,35 @@ def finalize_report_task(prev_results, interview_id: int):
             )
             return
 
-        conversation = "\n".join([f"{t.speaker}: {t.text}" for t in transcripts])
-        if len(conversation) > 12000: # 대략 8000 토큰 내외로 자름 (안전 계수)
-            logger.info(f"⚠️ Conversation too long ({len(conversation)} chars). Truncating: front 3000 + tail 8000.")
-            # 중후반부(경험/문제해결/협업/가치관/성장 Q&A)를 최대한 보존하기 위해
-            # 앞 3000자(소개/도입)보다 마지막 8000자(핵심 역량) 위주로 유지
-            conversation = conversation[:3000] + "\n... (중략 - 도입부 생략) ...\n" + conversation[-8000:]
-
         try:
-            # LangChain Parser 설정
-            parser = JsonOutputParser(pydantic_object=FinalReportSchema)
-            
-            # [핵심] 전체 평가 루브릭 가져오기
-            full_rubric = {}
-            try:
-                full_rubric = create_evaluation_rubric()
-                logger.info("📋 Full Rubric loaded for Final Report")
-            except Exception as re_err:
-                logger.error(f"Failed to load full rubric: {re_err}")
-
-            logger.info(f"🤖 Starting [FINAL REPORT] LLM analysis for Interview {interview_id}...")
-            exaone = get_exaone_llm()
-            system_msg = f"""[|system|]당신은 대한민국 최고의 기술 기업에서 수만 명의 인재를 발굴해온 '{position}' 분야 전문 채용 위원장입니다.
-LG AI Research의 EXAONE으로서, 면접 전체 발화 로그와 [표준 평가 루브릭], 그리고 [기업 인재상]을 종합 분석하여 지원자의 최종 합격 여부를 판단할 수 있는 심층 기술 리포트를 작성하십시오.
-
-[핵심 평가 프로토콜]
-1. **역량별 매칭 분석**: 루브릭의 평가 지표와 지원자의 답변을 대조하여, 단순히 잘했다는 표현이 아닌 '근거 중심'의 성적표를 작성하십시오.
-2. **논리적 일관성 검증**: 인터뷰 전반에 걸쳐 지원자의 답변이 일관된 실무 철학과 기술적 원칙을 유지하고 있는지 체크하십시오.
-3. **인재상 정밀 검증**: 제공된 [기업 인재상] 키워드와 지원자의 가치관/책임감 답변(stage 11~14)을 비교 분석하여 {company_name}에 적합한 인재인지 'responsibility_feedback'과 'growth_feedback'에 상세히 서술하십시오.
-4. **STAR 기법 기반 검증**: 지원자가 성과를 설명할 때 상황(S)-과업(T)-행동(A)-결과(R) 구조를 갖추어 실질적인 기여도를 증명했는지 평가하십시오.
-5. **시니어의 제언**: 강점은 극대화하고 약점은 실천 가능한 성장의 기회로 전환할 수 있도록 시니어 전문가의 깊이 있는 조언(Summary)을 제공하십시오.
-6. **텍스트 정제 (No Markdown)**: 전 영역 피드백 및 강점/보완점 작성 시 볼트(**), 이탤릭(*), 리스트(-) 등의 마크다운 문법을 일절 사용하지 마십시오. 오직 순수한 평문(Plain Text)으로만 서술하십시오.
-7. **언어 일관성 및 중복 방지**: 전문적이고 정제된 어조를 유지하되, 동일한 문구나 수식어가 반복되어 가독성을 해치는 현상을 방지하십시오.[|endofturn|]"""
-
-            user_msg = f"""[|user|]다음 면접 대화 전문을 바탕으로 리포트를 생성하십시오.
-            
-[면접 대화 전문]
-{conversation}
-
-[표준 평가 루브릭]
-{json.dumps(full_rubric, ensure_ascii=False, indent=2)}
+            # [Map-Reduce] 섹션별 사전 요약(Map)은 면접 진행 중 섹션이 끝날 때마다 생성되어 DB에 캐시됨.
+            # 여기서는 누락/갱신된 섹션만 보충 요약한 뒤 병합(Reduce)하므로,
+            # 대화 전문을 한 번에 생성하던 방식 대비 지연이 면접 길이에 비례하지 않고 N_CTX 한도에도 걸리지 않음
+            section_answers = _collect_section_answers(transcripts)
+            cached = get_report_section_summaries(interview_id)
+            sections: Dict[str, dict] = {}
+            reused = 0
+            for section, qa_pairs in section_answers.items():
+                row = cached.get(section)
+                if row and sorted(row.source_transcript_ids or []) == sorted(p["transcript_id"] for p in qa_pairs):
+                    reused += 1
+                    sections[section] = {
+                        "score": row.score or 0,
+                        "summary": row.summary or "",
+                        "strengths": row.strengths or [],
+                        "improvements": row.improvements or [],
+                    }
+                else:
+                    logger.info(f"🧩 [MAP] Section '{section}' not cached yet. Summarizing now...")
+                    sections[section] = _summarize_section_logic(interview_id, section, qa_pairs, ctx)
 
-[기업 인재상]
-회사명: {company_name}
-인재상: {company_ideal}
+            if not sections:
+                raise ValueError("No answered sections to summarize")
 
-[출력 제약 사항]
-- 모든 분석은 반드시 루브릭의 세부 목표와 연동되어야 합니다.
-- 특히 'responsibility_feedback'은 지원자의 직업 윤리와 책임감을, 'growth_feedback'은 발전 가능성을 분리하여 상세히 작성하십시오.
-- **필수 사항**: 만약 가치관/책임감/성장 관련 특정 스테이지(11~14) 발화가 부족하거나 면접이 중도 종료되었다 하더라도, 면접 전체 발화에서 드러난 태도와 인재상의 정렬도를 바탕으로 추론하여 반드시 구체적인 분석 내용을 작성하십시오. 결코 공란이나 디폴트 문구로 남기지 마십시오.
-- strengths와 improvements 항목은 면접 중 특정 발화를 근거로 인용하여 2문장 이상의 서술형으로 작성하십시오.
-- 결과물은 반드시 지정된 JSON 포맷만 출력하며, 사족을 붙이지 마십시오.
+            logger.info(f"🤖 [REDUCE] Merging {len(sections)} section summaries for Interview {interview_id} "
+                        f"(cached: {reused})")
+            result = _merge_section_summaries(sections, ctx)
 
-{parser.get_format_instructions()}[|endofturn|]"""
-            
-            # 생성 및 파싱 (EXAONE 전용 포맷 사용)
-            prompt = f"{system_msg}\n{user_msg}\n[|assistant|]"
-            # 리포트는 내용이 길므로 max_tokens를 넉넉하게 설정
-            raw_output = exaone.invoke(prompt, temperature=0.3, max_tokens=3000)
-            
-            if not raw_output:
-                raise ValueError("LLM generated empty output (possibly context limit reached)")
-
-            try:
-                result = parser.parse(raw_output)
-            except Exception as parse_err:
-                logger.error(f"최종 리포트 파싱 실패: {parse_err}")
-                json_match = re.search(r'\{.*\}', raw_output, re.DOTALL)
-                if json_match:
-                    result = json.loads(json_match.group())
-                else:
-                    raise parse_err
-                
         except Exception as llm_err:
             logger.error(f"LLM Summary failed: {llm_err}")
             # 개별 답변들의 점수가 있다면 그것들의 평균으로 폴백
@@ -27,16 +27,13 @@ except ImportError as e:
 
 # -----------------------------------------------------------
 # [2. 도구 불러오기]
-# LangChain은 AI 앱을 만들기 위한 '레고 블록' 같은 도구입니다.
-# PGVector: PostgreSQL에 벡터를 저장하고 검색하게 해주는 레고 블록입니다.
+# [변경] LangChain PGVector(JSONB 메타데이터 필터, ANN 인덱스 없음) 대신
+# resume_id/chunk_type 컬럼과 HNSW 인덱스를 가진 resume_chunks 테이블에 직접 저장합니다.
 # -----------------------------------------------------------
-from langchain_community.vectorstores import PGVector
-from langchain_core.documents import Document
-
 try:
-    from .embedding import get_embedder # 현재 폴더에서 가져오기 시도
+    from .resume_chunk_store import replace_resume_chunks # 현재 폴더에서 가져오기 시도
 except ImportError:
-    from embedding import get_embedder    # 실패 시 그냥 가져오기
+    from resume_chunk_store import replace_resume_chunks    # 실패 시 그냥 가져오기
 
 # -----------------------------------------------------------
 # [3. 핵심 함수: store_embeddings]
@@ -45,68 +42,34 @@ except ImportError:
 # -----------------------------------------------------------
 def store_embeddings(resume_id, embedded_chunks):
     """설명:
-        [함수의 역할] 임베딩된 데이터 조각들을 Document 객체로 변환하여 DB에 저장합니다.
+        [함수의 역할] 임베딩된 데이터 조각들을 resume_chunks 테이블에 저장합니다.
+        embed_chunks에서 이미 계산한 벡터를 그대로 사용하므로 모델을 다시 돌리지 않습니다.
 
         Args:
-        resume_id: 파라미터 설명.
-        embedded_chunks: 파라미터 설명.
+        resume_id: 이력서 ID
+        embedded_chunks: embed_chunks 결과 [{'text', 'type', 'metadata', 'vector'}]
 
         Returns:
-        반환값 정보.
+        저장된 청크 수
 
         생성자: ejm
         생성일자: 2026-02-04
     """
     if not embedded_chunks:
         print("❌ 저장할 임베딩 데이터가 없습니다.")
-        return
+        return 0
 
     print(f"\n[STEP6] DB 저장 시작 (Resume ID: {resume_id})...")
 
-    # -------------------------------------------------------
-    # 3-1. 문서화 (Document 객체 생성)
-    # [존재 이유] LangChain DB 도구를 쓰려면 데이터를 'Document'라는 표준 형식으로 포장해야 합니다.
-    # -------------------------------------------------------
-    documents = []
-    for item in embedded_chunks:
-        # [해석] 메타데이터(Metadata)는 데이터의 '견출지'입니다.
-        # 나중에 수천 명의 이력서가 섞여 있어도 resume_id로 내 것만 쏙 골라낼 수 있습니다.
-        metadata = item.get("metadata", {})
-        metadata["resume_id"] = resume_id # 누구의 이력서인지 기록
-        metadata["chunk_type"] = item.get("type", "unknown") # 이게 학력인지 경력인지 기록
-        
-        doc = Document(
-            page_content=item["text"], # 실제 텍스트 내용
-            metadata=metadata          # 부가 정보(견출지)
-        )
-        documents.append(doc)
-
-    # -------------------------------------------------------
-    # 3-2. DB 연결 및 저장
-    # -------------------------------------------------------
-    # [문법] os.getenv: 환경 변수에서 DB 접속 정보를 가져옵니다. 보안을 위해 아이디/비번을 코드에 직접 적지 않습니다.
-    connection_string = os.getenv("DATABASE_URL", "postgresql+psycopg://postgres:1234@db:5432/interview_db")
-    
-    import torch
-    device = 'cuda' if torch.cuda.is_available() else 'cpu'
-    embeddings = get_embedder(device) # 저장할 때도 텍스트를 숫자로 바꿀 똑같은 모델이 필요합니다.
-
     try:
-        # [개선] connection_string과 함께 engine을 전달하여 커넥션 풀 공유 보장
-        from db import engine
-        vector_store = PGVector.from_documents(
-            documents,              # 1. 위치 인자
-            embeddings,             # 2. 위치 인자
-            collection_name="resume_all_embeddings",
-            connection_string=connection_string,
-            connection=engine,      # engine 객체 전달로 세션 꼬임 방지
-            pre_delete_collection=False
-        )
-        
-        print(f"[STEP6] ✅ 총 {len(documents)}개의 조각이 DB에 저장되었습니다.")
+        # [해석] 같은 이력서를 재처리하면 기존 청크를 지우고 새로 저장합니다 (중복 방지)
+        saved = replace_resume_chunks(resume_id, embedded_chunks)
+        print(f"[STEP6] ✅ 총 {saved}개의 조각이 DB에 저장되었습니다.")
+        return saved
 
     except Exception as e:
         print(f"\n❌ DB 저장 실패: {e}")
+        return 0
 
 # -----------------------------------------------------------
 # [4. 메인 실행부] 
@@ -2,9 +2,7 @@ import sys
 import os
 import re
 import json
-import gc 
 import logging
-import torch
 from datetime import datetime, timezone
 from celery import shared_task
 from langchain_core.prompts import PromptTemplate
@@ -49,15 +47,179 @@ def is_meaningless(text: str) -> bool:
     if re.fullmatch(r'[a-zA-Z]{1,5}', text): return True
     return False
 
+# [RAG 고정 쿼리] 인성 단계별 검색 쿼리 (면접과 무관하게 고정 → 워커 시작 시 쿼리 임베딩 캐시에 사전 적재)
+BEHAVIORAL_RAG_QUERIES = {
+    "communication": "협업 사례, 팀 프로젝트 중 갈등 조율, 팀워크 발휘, 소통 능력",
+    "growth": "자기계발 노력, 새로운 기술 학습 태도, 실패 극복 및 성장 사례",
+    "responsibility": "직업 윤리, 약속 이행, 정직함과 관련된 경험"
+}
+DEFAULT_BEHAVIORAL_QUERY = "본인의 강점, 성취감, 도전적인 경험 사례"
+RESPONSIBILITY_VALUES_QUERY = "지원자의 근본적인 가치관, 생활 신념, 직업 윤리, 정직함"
+
+def get_stage_rag_queries() -> list:
+    """설명:
+        질문 생성에서 사용하는 고정 RAG 쿼리 전체 목록을 반환합니다.
+
+    Returns:
+        list: 고정 검색 쿼리 목록.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    return list(BEHAVIORAL_RAG_QUERIES.values()) + [DEFAULT_BEHAVIORAL_QUERY, RESPONSIBILITY_VALUES_QUERY]
+
+# "싫다", "몰라" 등 지원자의 부정/회피 답변 키워드
+NEGATIVE_ANSWER_KEYWORDS = ["모르겠습니다", "모르겠어요", "아니요", "없습니다", "기억이 안 남", "잘 모름", "몰라요", "몰라", "싫어", "싫음", "싫다"]
+
+# [연속 저점수 감지] 아이스브레킹 난이도 하향 기준
+LOW_SCORE_THRESHOLD = 60   # 저점수 기준 (0-100점 척도)
+LOW_SCORE_CONSECUTIVE = 3  # 연속 저점수 횟수 임계값
+
+def is_negative_answer(text: str) -> bool:
+    """설명:
+        지원자의 답변이 무의미하거나 명시적인 거절/회피인지 체크합니다.
+
+    Args:
+        text (str): 지원자 답변.
+
+    Returns:
+        bool: 무의미/부정 답변 여부.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    u_text = (text or "").strip()
+    return is_meaningless(u_text) or any(kw in u_text for kw in NEGATIVE_ANSWER_KEYWORDS)
+
+def is_low_score_streak(session, interview_id: int) -> bool:
+    """설명:
+        최근 채점된 지원자 답변이 LOW_SCORE_CONSECUTIVE회 연속 저점수인지 확인합니다.
+
+    Args:
+        session: DB 세션.
+        interview_id (int): 면접 ID.
+
+    Returns:
+        bool: 연속 저점수 여부.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    from db import select, Transcript, Speaker
+    user_transcripts_scored = session.exec(
+        select(Transcript)
+        .where(
+            Transcript.interview_id == interview_id,
+            Transcript.speaker != Speaker.AI,
+            Transcript.sentiment_score.isnot(None),
+        )
+        .order_by(Transcript.id.desc())
+        .limit(LOW_SCORE_CONSECUTIVE)
+    ).all()
+
+    return (
+        len(user_transcripts_scored) >= LOW_SCORE_CONSECUTIVE
+        and all(
+            (t.sentiment_score or 0) < LOW_SCORE_THRESHOLD
+            for t in user_transcripts_scored
+        )
+    )
+
+def commit_speculative_question(session, interview_id: int, next_stage: dict, last_ai_transcript, last_user_transcript):
+    """설명:
+        지원자가 답변하는 동안 선행 생성해 둔 다음 질문을 꺼내, 여전히 유효하면 즉시 DB에 확정합니다.
+        기준 질문/스테이지가 달라졌거나, 답변 내용에 따라 프롬프트가 바뀌는 경우(무의미/부정 답변, 연속 저점수 상태 변화)에는 폐기합니다.
+
+    Args:
+        session: DB 세션.
+        interview_id (int): 면접 ID.
+        next_stage (dict): 실제 답변 기준으로 결정된 다음 스테이지.
+        last_ai_transcript: 지원자가 방금 답한 AI 발화.
+        last_user_transcript: 지원자의 마지막 답변.
+
+    Returns:
+        dict | None: 확정 결과 (확정하지 못했으면 None → 일반 생성 진행).
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    from db import save_generated_question
+    from tasks.tts import synthesize_task
+    from utils.question_stream import QuestionStreamPublisher
+    from utils.speculative_store import pop_speculative_question, discard_speculative_tts, get_speculative_tts_path
+
+    spec = pop_speculative_question(interview_id)
+    if not spec:
+        return None
+
+    base_qid = spec.get("base_question_id")
+    reason = None
+    if not last_ai_transcript or base_qid != last_ai_transcript.question_id or spec.get("stage") != next_stage['stage']:
+        reason = "기준 질문/스테이지 불일치"
+    elif spec.get("answer_sensitive"):
+        if last_user_transcript and is_negative_answer(last_user_transcript.text):
+            reason = "무의미/부정 답변"
+        elif is_low_score_streak(session, interview_id) != spec.get("low_score_streak", False):
+            reason = "연속 저점수 상태 변화"
+
+    if reason:
+        logger.info(f"🗑️ [Speculative] Interview {interview_id} 선행 생성 폐기 ({reason}, stage={spec.get('stage')})")
+        discard_speculative_tts(interview_id, base_qid)
+        return None
+
+    final_content = spec["text"]
+    logger.info(f"⚡ [Speculative] Interview {interview_id} 선행 생성 질문 확정 (Stage: {next_stage['stage']}, kind={spec.get('kind')})")
+    q_id = save_generated_question(
+        interview_id=interview_id,
+        content=final_content,
+        category=spec.get("category", "technical"),
+        stage=next_stage['stage'],
+        guide=next_stage.get('guide', ''),
+        session=session
+    )
+    QuestionStreamPublisher(interview_id).done(final_content, q_id)
+
+    # 선행 합성된 TTS가 준비되어 있으면 파일 이름만 바꿔 즉시 서빙 (아직이면 일반 합성)
+    if q_id:
+        spec_tts = get_speculative_tts_path(interview_id, base_qid)
+        q_tts = f"/app/uploads/tts/q_{q_id}.wav"
+        try:
+            if os.path.exists(spec_tts) and os.path.getsize(spec_tts) > 0:
+                os.replace(spec_tts, q_tts)
+                logger.info(f"🔊 [Speculative] Question {q_id}: 선행 합성 TTS 사용")
+            else:
+                synthesize_task.delay(spec.get("tts_text") or final_content, language="ko", question_id=q_id)
+        except OSError as e:
+            logger.warning(f"⚠️ [Speculative] TTS 파일 이동 실패 → 전체 합성: {e}")
+            synthesize_task.delay(spec.get("tts_text") or final_content, language="ko", question_id=q_id)
+    else:
+        discard_speculative_tts(interview_id, base_qid)
+
+    return {"status": "success", "stage": next_stage['stage'], "question": final_content, "question_id": q_id, "speculative": True}
+
 # ==========================================
 # 2. 페르소나 설정 (Prompt Engineering)
 # ==========================================
-PROMPT_TEMPLATE = """[|user|]당신은 전문적인 지식과 공정한 태도를 겸비한 베테랑 AI 면접관입니다.
+# [Prefix KV 캐시] 면접 내내 변하지 않는 블록 (페르소나, 직무/인재상, 출력 규칙)
+# ExaoneLLM이 이 블록까지 평가된 상태를 면접별로 재사용하므로, 고정 지침은 모두 여기에 두고
+# 매 턴 달라지는 필드(단계, 문맥, 임무)는 PROMPT_TEMPLATE에서 이 블록 뒤에만 붙임
+PROMPT_PERSONA_PREFIX = """[|user|]당신은 전문적인 지식과 공정한 태도를 겸비한 베테랑 AI 면접관입니다.
 다음 지침에 따라 지원자의 잠재력을 예리하게 파악할 수 있는 **단 하나의 질문**을 생성하십시오.
 
 ### [면접 전략 및 페르소나]
 - 평가 대상 직무: {target_role}
 - 핵심 인재상: {company_ideal}
+
+### [출력 규칙 - 반드시 준수]
+1. 인사말, 부연 설명, 자기소개, 가설 제시를 절대 하지 마십시오.
+2. "질문입니다", "다음 질문은" 등 서두를 일절 붙이지 마십시오.
+3. 오직 지원자에게 직접 던지는 **물음표(?)로 끝나는 단일 문장의 질문**만 출력하십시오.
+4. 전문적인 한국어 구어체(하십시오체)를 사용하십시오.
+5. 아래 [실시간 핵심 임무]의 수행 과업, 실행 상세, 전역 제약을 모두 따르십시오.
+"""
+
+PROMPT_TEMPLATE = PROMPT_PERSONA_PREFIX + """
+### [현재 면접 단계]
 - 면접 단계: {stage_name} ({guide})
 
 ### [참고 문맥: 지원자 정보 및 이전 답변]
@@ -66,13 +228,7 @@ PROMPT_TEMPLATE = """[|user|]당신은 전문적인 지식과 공정한 태도
 ### [실시간 핵심 임무]
 - 수행 과업: {mode_task_instruction}
 - 실행 상세: {mode_instruction}
-- 전역 제약: {global_constraint}
-
-### [출력 규칙 - 반드시 준수]
-1. 인사말, 부연 설명, 자기소개, 가설 제시를 절대 하지 마십시오.
-2. "질문입니다", "다음 질문은" 등 서두를 일절 붙이지 마십시오.
-3. 오직 지원자에게 직접 던지는 **물음표(?)로 끝나는 단일 문장의 질문**만 출력하십시오.
-4. 전문적인 한국어 구어체(하십시오체)를 사용하십시오.[|endofturn|]
+- 전역 제약: {global_constraint}[|endofturn|]
 [|assistant|]"""
 
 # ==========================================
@@ -80,9 +236,14 @@ PROMPT_TEMPLATE = """[|user|]당신은 전문적인 지식과 공정한 태도
 # ==========================================
 
 @shared_task(name="tasks.question_generation.preload_model")
-def preload_model_task():
+def preload_model_task(interview_id: int = None, resume_id: int = None):
     """설명:
         EXAONE 모델을 비동기로 미리 로드합니다. (면접 시작 시 호출)
+        resume_id가 주어지면 해당 이력서의 청크 벡터를 인메모리 인덱스로 함께 적재합니다.
+
+        Args:
+        interview_id: 면접 ID (인덱스 해제 기준)
+        resume_id: 이력서 ID
 
         Returns:
         반환값 정보.
@@ -91,22 +252,67 @@ def preload_model_task():
         생성일자: 2026-02-04
     """
     from utils.exaone_llm import get_exaone_llm
+    from utils.resume_vector_index import load_resume_index
     try:
         logger.info("🔥 [Preload] Starting EXAONE model preloading...")
         get_exaone_llm() # 싱글톤 인스턴스 생성 시 모델 로드됨
         logger.info("✅ [Preload] EXAONE model preloaded inside Celery worker.")
+        if resume_id:
+            # [인메모리 RAG] 면접 동안 이력서 검색이 Postgres를 거치지 않도록 청크 벡터 적재
+            try:
+                load_resume_index(resume_id, interview_id)
+            except Exception as index_err:
+                logger.warning(f"⚠️ [Preload] Resume {resume_id} 인덱스 적재 실패 (DB 검색 유지): {index_err}")
         return {"status": "success", "message": "Model preloaded"}
     except Exception as e:
         logger.error(f"❌ [Preload] Failed to preload model: {e}")
         return {"status": "error", "message": str(e)}
 
+@shared_task(name="tasks.question_generation.release_interview")
+def release_interview_task(interview_id: int):
+    """설명:
+        면접 종료 시 GPU 워커 프로세스가 보유한 면접 단위 자원을 해제합니다.
+        (이력서 인메모리 인덱스, RAG 문맥 캐시, 질문 생성용 Prefix KV 캐시)
+        인덱스는 gpu_queue 워커 메모리에 있으므로 반드시 이 큐에서 실행되어야 합니다.
+
+        Args:
+        interview_id: 면접 ID
+
+        Returns:
+        해제 결과 정보.
+
+        생성자: ejm
+        생성일자: 2026-10-17
+    """
+    from tasks.rag_retrieval import evict_interview_contexts
+    from utils.resume_vector_index import evict_resume_index
+
+    evict_interview_contexts(interview_id)
+    # [인메모리 RAG] 면접 종료 → 이력서 벡터 인덱스 해제
+    index_evicted = evict_resume_index(interview_id)
+    if index_evicted:
+        logger.info(f"📚 Resume vector index evicted for Interview {interview_id}")
+
+    # [Prefix KV 캐시] 질문 생성용 페르소나 상태 해제 및 적중률 기록
+    prefix_evicted = 0
+    try:
+        from utils.exaone_llm import ExaoneLLM
+        prefix_evicted = ExaoneLLM.evict_prefix_cache(interview_id)
+        logger.info(f"🧠 Prefix KV cache: evicted {prefix_evicted} entries for Interview {interview_id}, stats={ExaoneLLM.get_prefix_cache_stats()}")
+    except Exception as cache_err:
+        logger.warning(f"⚠️ Prefix KV cache eviction skipped: {cache_err}")
+    return {"status": "success", "resume_index_evicted": index_evicted, "prefix_cache_evicted": prefix_evicted}
+
 @shared_task(bind=True, name="tasks.question_generation.generate_next_question")
-def generate_next_question_task(self, interview_id: int):
+def generate_next_question_task(self, interview_id: int, speculative_for: int = None):
     """설명:
         인터뷰 진행 상황을 파악하고 다음 단계의 AI 질문을 생성합니다.
+        speculative_for가 주어지면 해당 질문에 대한 답변을 기다리는 동안 그 다음 질문을 선행 생성하여
+        저장하지 않고 Redis에 보관합니다 (답변과 무관한 템플릿/인성 스테이지만 대상).
 
         Args:
         interview_id: 파라미터 설명.
+        speculative_for: 선행 생성 기준 질문 ID (지원자가 현재 답하고 있는 질문).
 
         Returns:
         반환값 정보.
@@ -116,11 +322,16 @@ def generate_next_question_task(self, interview_id: int):
     """
     from db import engine, Session, select, Interview, Transcript, Speaker, Question, save_generated_question, Company, get_kst_now
     from utils.exaone_llm import get_exaone_llm
+    from utils.llm_client import PRIORITY_INTERACTIVE, PRIORITY_BATCH
     from tasks.tts import synthesize_task
     from utils.interview_helpers import check_if_transition
     from config.interview_scenario import get_next_stage as get_next_stage_normal
     from config.interview_scenario_transition import get_next_stage as get_next_stage_transition
-    from tasks.rag_retrieval import retrieve_context, retrieve_similar_questions
+    from tasks.rag_retrieval import retrieve_context, retrieve_similar_questions, retrieve_contexts_bulk
+    from utils.question_stream import QuestionStreamPublisher
+    from utils.tts_pipeline import SentenceTTSPipeline
+    from tasks.evaluator import summarize_report_section, get_report_section
+    from utils.speculative_store import SPECULATIVE_QUESTIONS, save_speculative_question, get_speculative_tts_path
     try:
         with Session(engine) as session:
             interview = session.get(Interview, interview_id)
@@ -157,6 +368,13 @@ def generate_next_question_task(self, interview_id: int):
                 ).order_by(Transcript.id.desc())
                 last_user_transcript = session.exec(stmt_user_any).first()
 
+            # [선행 생성] 기준 질문이 여전히 마지막 AI 질문이고 아직 답변 전일 때만 진행
+            if speculative_for:
+                if not last_ai_transcript or last_ai_transcript.question_id != speculative_for:
+                    return {"status": "speculative_skipped", "reason": "stale"}
+                if last_user_transcript and last_user_transcript.question_id == speculative_for:
+                    return {"status": "speculative_skipped", "reason": "already_answered"}
+
             # [삭제] 10초 이내 스킵 로직 (Race Condition 방지 목적이었으나 초기 템플릿 로드 시 방해됨)
 
             # [수정] 3. 전공/직무 기반 시나리오 결정
@@ -196,15 +414,23 @@ def generate_next_question_task(self, interview_id: int):
             logger.info(f"Current stage determined: {last_stage_name} (is_transition={is_transition})")
             next_stage = get_next_stage_func(last_stage_name)
 
+            if not next_stage and speculative_for:
+                return {"status": "speculative_skipped", "reason": "last_stage"}
+
             if not next_stage:
                 logger.info(f"Interview {interview_id} finished. Transitioning to COMPLETED.")
+                # [Map-Reduce 리포트] 마지막 섹션 요약 선행 생성
+                last_section = get_report_section(last_stage_name)
+                if last_section:
+                    summarize_report_section.delay(interview_id, last_section)
                 interview.status = "COMPLETED"
                 session.add(interview)
                 session.commit()
+                release_interview_task(interview_id)
                 return {"status": "completed"}
 
             # [수정] 동기화 및 스테이지 스킵 방지 로직 강화
-            if last_ai_transcript and last_user_transcript:
+            if not speculative_for and last_ai_transcript and last_user_transcript:
                 # 1. 만약 마지막 AI 질문이 방금 전(3초 이내)에 던져졌다면, 사용자 답변이 충분히 길지 않은 이상 다음 단계로 넘어가지 않음
                 #    (음성 인식 지연/지터로 인해 이전 답변이 새 질문 ID에 꽂히는 현상 방지)
                 time_since_ai = (get_kst_now() - last_ai_transcript.timestamp.replace(tzinfo=None)).total_seconds()
@@ -232,6 +458,30 @@ def generate_next_question_task(self, interview_id: int):
                         "question": last_ai_transcript.text,
                         "question_id": last_ai_transcript.question_id
                     }
+            # [Map-Reduce 리포트] 섹션이 바뀌는 시점 = 직전 섹션의 답변이 모두 끝난 시점
+            # 지원자가 다음 질문에 답하는 동안 GPU 워커가 직전 섹션 요약을 미리 만들어 둠
+            last_section = get_report_section(last_stage_name)
+            if not speculative_for and last_section and last_section != get_report_section(next_stage['stage']):
+                logger.info(f"🧩 Section '{last_section}' completed. Queueing section summary for Interview {interview_id}")
+                summarize_report_section.delay(interview_id, last_section)
+
+            if speculative_for:
+                # [선행 생성] 답변 내용이 프롬프트에 직접 들어가는 스테이지(꼬리질문, 일반 기술 질문)는 대상 아님
+                if next_stage.get("type") == "followup" or (
+                    next_stage.get("type") != "template" and next_stage.get("category", "technical") != "narrative"
+                ):
+                    return {"status": "speculative_skipped", "reason": "answer_dependent", "stage": next_stage['stage']}
+                logger.info(f"🔮 [Speculative] Interview {interview_id}: Q{speculative_for} 답변 대기 중 '{next_stage['stage']}' 선행 생성")
+            elif SPECULATIVE_QUESTIONS:
+                # [선행 생성] 답변 대기 중 만들어 둔 다음 질문이 유효하면 LLM/RAG/TTS 없이 즉시 확정
+                committed = commit_speculative_question(session, interview_id, next_stage, last_ai_transcript, last_user_transcript)
+                if committed:
+                    if committed.get("question_id"):
+                        generate_next_question_task.apply_async(
+                            args=[interview_id], kwargs={"speculative_for": committed["question_id"]}
+                        )
+                    return committed
+
             # [수정] 공통 정보 추출 (템플릿/AI/꼬리질문 모두 사용)
             candidate_name = "지원자"
             target_role = interview.position or "해당 직무"
@@ -258,6 +508,13 @@ def generate_next_question_task(self, interview_id: int):
                 company_ideal = db_company.ideal
                 logger.info(f"🏢 Dynamic Talent Image Loaded: {company_ideal[:30]}...")
 
+            # [스트리밍] 면접 단위 토큰 퍼블리셔 (Redis 미연결 시 자동 비활성화)
+            stream_publisher = QuestionStreamPublisher(interview_id)
+            tts_pipeline = SentenceTTSPipeline(interview_id, enabled=False if speculative_for else None)
+            if speculative_for:
+                # 선행 생성 결과는 확정 전까지 브라우저에 노출하지 않음
+                stream_publisher.enabled = False
+
             # [공통] 카테고리 및 DB 변수 선언 (NameError 방지)
             category_raw = next_stage.get("category", "technical")
             category_map = {"certification": "technical", "project": "technical", "narrative": "behavioral", "problem_solving": "situational"}
@@ -372,7 +629,10 @@ def generate_next_question_task(self, interview_id: int):
                             logger.error(f"Failed to extract self_intro values: {e}")
 
                         # 2. RAG 결과와 결합
-                        rag_results = retrieve_context("지원자의 근본적인 가치관, 생활 신념, 직업 윤리, 정직함", resume_id=interview.resume_id, top_k=2)
+                        # [일괄 RAG] 첫 인성 단계에서 모든 고정 쿼리를 한 번에 검색해 면접 캐시에 적재, 이후 단계는 캐시에서 읽음
+                        rag_results = retrieve_contexts_bulk(
+                            interview.resume_id, get_stage_rag_queries(), top_k=2, interview_id=interview_id
+                        ).get(RESPONSIBILITY_VALUES_QUERY, [])
                         rag_context = "\n".join([r['text'] for r in rag_results]) if rag_results else ""
                         
                         context_text = f"{values_text}\n\n[추가 참고 정보]:\n{rag_context}".strip()
@@ -380,16 +640,13 @@ def generate_next_question_task(self, interview_id: int):
                     else:
                         # [개선] 9-14번 인성 면접: 각 역량(협업, 성장, 책임감)에 특화된 RAG 수행
                         s_name = next_stage.get('stage', '')
-                        behavioral_keywords = {
-                            "communication": "협업 사례, 팀 프로젝트 중 갈등 조율, 팀워크 발휘, 소통 능력",
-                            "growth": "자기계발 노력, 새로운 기술 학습 태도, 실패 극복 및 성장 사례",
-                            "responsibility": "직업 윤리, 약속 이행, 정직함과 관련된 경험"
-                        }
                         # 해당 단계에 맞는 쿼리 선택 (없으면 기본 가치관 경험 검색)
-                        target_query = behavioral_keywords.get(s_name, "본인의 강점, 성취감, 도전적인 경험 사례")
+                        target_query = BEHAVIORAL_RAG_QUERIES.get(s_name, DEFAULT_BEHAVIORAL_QUERY)
                         
                         logger.info(f"✨ Behavioral RAG ({s_name}): Searching for '{target_query}'")
-                        rag_results = retrieve_context(target_query, resume_id=interview.resume_id, top_k=2)
+                        rag_results = retrieve_contexts_bulk(
+                            interview.resume_id, get_stage_rag_queries(), top_k=2, interview_id=interview_id
+                        ).get(target_query, [])
                         rag_context = "\n".join([r['text'] for r in rag_results]) if rag_results else ""
                         
                         context_text = (
@@ -428,7 +685,11 @@ def generate_next_question_task(self, interview_id: int):
 
                 llm = get_exaone_llm()
                 prompt = PromptTemplate.from_template(PROMPT_TEMPLATE)
-                chain = prompt | llm | StrOutputParser()
+                # [Prefix KV 캐시] 페르소나 블록 상태를 면접 단위로 재사용
+                cache_prefix = PROMPT_PERSONA_PREFIX.format(target_role=target_role, company_ideal=company_ideal)
+                # [우선순위] 실시간 다음 질문은 리포트 평가보다 먼저 처리 (선행 생성은 배치 취급)
+                priority = PRIORITY_BATCH if speculative_for else PRIORITY_INTERACTIVE
+                chain = prompt | llm.bind(cache_prefix=cache_prefix, cache_scope=interview_id, priority=priority) | StrOutputParser()
 
                 # 가이드 내 변수 치환
                 guide_raw = next_stage.get('guide', '')
@@ -438,27 +699,7 @@ def generate_next_question_task(self, interview_id: int):
                     guide_formatted = guide_raw
 
                 # ── [연속 저점수 감지] 아이스브레킹 난이도 하향 ─────────────────
-                LOW_SCORE_THRESHOLD = 60   # 저점수 기준 (0-100점 척도)
-                LOW_SCORE_CONSECUTIVE = 3  # 연속 저점수 횟수 임계값
-
-                user_transcripts_scored = session.exec(
-                    select(Transcript)
-                    .where(
-                        Transcript.interview_id == interview_id,
-                        Transcript.speaker != Speaker.AI,
-                        Transcript.sentiment_score.isnot(None),
-                    )
-                    .order_by(Transcript.id.desc())
-                    .limit(LOW_SCORE_CONSECUTIVE)
-                ).all()
-
-                is_low_score_streak = (
-                    len(user_transcripts_scored) >= LOW_SCORE_CONSECUTIVE
-                    and all(
-                        (t.sentiment_score or 0) < LOW_SCORE_THRESHOLD
-                        for t in user_transcripts_scored
-                    )
-                )
+                low_score_streak = is_low_score_streak(session, interview_id)
                 # ──────────────────────────────────────────────────────────────
 
                 # [추가] 단계별 맞춤형 전략 지침 결정 (지원자님 요청 반영)
@@ -491,7 +732,7 @@ def generate_next_question_task(self, interview_id: int):
                     mode_instruction = "이 단계는 꼬리질문입니다. 답변 요약과 질문을 하나의 문장으로 결합하여 딱 하나의 질문으로 생성하십시오."
                 
                 # ── [아이스브레킹 주입] 연속 저점수 시 격려 및 난이도 하향 ──────
-                if is_low_score_streak:
+                if low_score_streak:
                     mode_instruction += (
                         " [지원자 지원 모드] 지원자가 여러 차례 답변에 어려움을 겪고 있습니다."
                         " 이번 질문은 난이도를 한 단계 낮추어 생성하십시오."
@@ -505,18 +746,15 @@ def generate_next_question_task(self, interview_id: int):
                 # ──────────────────────────────────────────────────────────────
 
                 # [추가] 지원자의 부정적 답변 감지 및 특수 지시 (무지/회피 대응)
-                if last_user_transcript:
-                    u_text = last_user_transcript.text.strip()
-                    # "싫다", "몰라" 등 키워드 보강
-                    negative_keywords = ["모르겠습니다", "모르겠어요", "아니요", "없습니다", "기억이 안 남", "잘 모름", "몰라요", "몰라", "싫어", "싫음", "싫다"]
-                    
+                # (선행 생성 시점의 last_user_transcript는 이전 질문의 답변이므로 적용하지 않고, 확정 시점에 실제 답변으로 검증)
+                if last_user_transcript and not speculative_for:
                     # [전략 3] 무의미한 입력이거나 명시적 거절일 때 지시어 전환
-                    if is_meaningless(u_text) or any(kw in u_text for kw in negative_keywords):
+                    if is_negative_answer(last_user_transcript.text):
                         mode_task_instruction = "지원자가 답변을 하지 못하거나 의미 없는 입력을 했습니다. 이전 내용에 대한 요약이나 추측을 100% 생략하고, 정중하게 다시 설명을 요청하거나 다른 주제로 전환하십시오."
                         global_constraint = "이전 답변 요약을 **절대** 하지 마십시오. 답변을 지어내지 말고, '알겠습니다. 그렇다면 이번에는...'과 같이 자연스럽게 대화를 이어가십시오."
                         mode_instruction = "환각(Hallucination) 없이 담백하게 다음 질문으로 넘어가거나 재설명을 요청하십시오."
 
-                final_content = chain.invoke({
+                chain_inputs = {
                     "context": context_text,
                     "stage_name": next_stage['display_name'],
                     "company_ideal": company_ideal,
@@ -525,7 +763,39 @@ def generate_next_question_task(self, interview_id: int):
                     "mode_task_instruction": mode_task_instruction,
                     "global_constraint": global_constraint,
                     "target_role": target_role
-                })
+                }
+
+                intro_tpl = next_stage.get("intro_sentence", "")
+                intro_msg = ""
+                if next_stage['stage'] == 'skill' and 'cert_name' in intro_tpl:
+                    cert_name = "자료에 명시된"
+                    if rag_results:
+                        match = re.search(r'자격명:\s*([^,\(]+)', rag_results[0]['text'])
+                        if match: cert_name = match.group(1).strip()
+                    intro_msg = intro_tpl.format(candidate_name=candidate_name, cert_name=cert_name)
+                elif intro_tpl:
+                    try:
+                        intro_msg = intro_tpl.format(candidate_name=candidate_name)
+                    except:
+                        intro_msg = intro_tpl
+
+                # [문장 파이프라인 TTS] 인트로 문장은 LLM 출력과 무관하게 이미 정해져 있으므로 생성 시작 전에 합성 발행
+                tts_pipeline.lead(intro_msg)
+
+                # [스트리밍] 부분 토큰을 Redis Stream으로 발행하여 브라우저가 생성 과정을 바로 볼 수 있게 함
+                # (정제 전 원문이 흘러가며, 정제된 최종 질문은 저장 후 done 이벤트로 교체됨)
+                # [문장 파이프라인 TTS] 문장이 닫히는 즉시 세그먼트 합성을 발행하여 LLM 생성과 TTS를 겹침
+                if stream_publisher.enabled or tts_pipeline.enabled:
+                    stream_publisher.start(next_stage['stage'], lead=bool(tts_pipeline.lead_text))
+                    streamed_parts = []
+                    for token in chain.stream(chain_inputs):
+                        streamed_parts.append(token)
+                        stream_publisher.token(token)
+                        tts_pipeline.feed(token)
+                    tts_pipeline.flush()
+                    final_content = "".join(streamed_parts)
+                else:
+                    final_content = chain.invoke(chain_inputs)
 
                 # [정제 가속화 및 로직 강화]
                 final_content = final_content.strip()
@@ -609,20 +879,6 @@ def generate_next_question_task(self, interview_id: int):
                 
                 final_content = final_content.strip()
 
-                intro_tpl = next_stage.get("intro_sentence", "")
-                intro_msg = ""
-                if next_stage['stage'] == 'skill' and 'cert_name' in intro_tpl:
-                    cert_name = "자료에 명시된"
-                    if rag_results:
-                        match = re.search(r'자격명:\s*([^,\(]+)', rag_results[0]['text'])
-                        if match: cert_name = match.group(1).strip()
-                    intro_msg = intro_tpl.format(candidate_name=candidate_name, cert_name=cert_name)
-                elif intro_tpl:
-                    try:
-                        intro_msg = intro_tpl.format(candidate_name=candidate_name)
-                    except:
-                        intro_msg = intro_tpl
-                
                 # Follow-up은 intro_sentence를 무시하는 경향이 있으나 필요시 결합
                 if next_stage.get("type") == "followup":
                     # 팔로업은 흐름상 인트로를 최소화
@@ -728,6 +984,31 @@ def generate_next_question_task(self, interview_id: int):
             # 한 번 더 공백 정리
             final_content = re.sub(r'\s+', ' ', final_content).strip()
 
+            # [선행 생성] DB에 저장하지 않고 Redis에 보관 + TTS를 임시 파일로 미리 합성
+            if speculative_for:
+                is_template = next_stage.get("type") == "template"
+                clean_text = final_content
+                if final_content.startswith('[') and ']' in final_content:
+                    clean_text = final_content.split(']', 1)[-1].strip()
+                saved = save_speculative_question(interview_id, {
+                    "base_question_id": speculative_for,
+                    "stage": next_stage['stage'],
+                    "kind": "template" if is_template else "llm",
+                    "category": db_category,
+                    "text": final_content,
+                    "tts_text": clean_text,
+                    "answer_sensitive": not is_template,
+                    "low_score_streak": False if is_template else low_score_streak,
+                })
+                if saved:
+                    synthesize_task.delay(
+                        clean_text, language="ko",
+                        output_path=get_speculative_tts_path(interview_id, speculative_for),
+                        interview_id=interview_id, base_question_id=speculative_for
+                    )
+                    logger.info(f"🔮 [Speculative] Interview {interview_id}: '{next_stage['stage']}' 선행 생성 완료 → {final_content[:50]}...")
+                return {"status": "speculative_ready" if saved else "speculative_skipped", "stage": next_stage['stage']}
+
             # 7. DB 저장 (Question 및 Transcript)
                 # db_category는 최상단에서 이미 정의됨
 
@@ -741,13 +1022,6 @@ def generate_next_question_task(self, interview_id: int):
                 session=session
             )
 
-            # 8. 메모리 정리 (더 강력하게)
-            gc.collect()
-            if torch.cuda.is_available():
-                torch.cuda.empty_cache()
-                with torch.cuda.device(torch.cuda.current_device()):
-                    torch.cuda.empty_cache()
-            
             logger.info(f"✅ [SUCCESS] Next question generated for Interview {interview_id}: {final_content[:50]}...")
 
             # 9. TTS 생성 태스크 즉시 트리거
@@ -758,14 +1032,36 @@ def generate_next_question_task(self, interview_id: int):
                     clean_text = final_content
                     if final_content.startswith('[') and ']' in final_content:
                         clean_text = final_content.split(']', 1)[-1].strip()
-                    logger.info(f"🔊 Triggering TTS synthesis for Question ID: {q_id}")
-                    synthesize_task.delay(clean_text, language="ko", question_id=q_id)
+                    # 선행 합성된 문장 세그먼트가 최종 질문과 일치하면 조립만 수행 (불일치 시 전체 합성)
+                    if tts_pipeline.finalize(clean_text, q_id):
+                        logger.info(f"🔊 Assembling pipelined TTS segments for Question ID: {q_id}")
+                    else:
+                        logger.info(f"🔊 Triggering TTS synthesis for Question ID: {q_id}")
+                        synthesize_task.delay(clean_text, language="ko", question_id=q_id)
                 else:
                     logger.info(f"🔊 TTS file already exists for Question ID: {q_id}, skipping.")
+                    tts_pipeline.discard()
+            else:
+                tts_pipeline.discard()
+
+            # 브라우저는 audio_seqs에 해당하는 세그먼트만 이어 재생하고, 비어 있으면 q_{id}.wav 를 기다림
+            stream_publisher.done(final_content, q_id, audio_seqs=tts_pipeline.assembled_seqs)
+
+            # 10. [선행 생성] 지원자가 이 질문에 답하는 동안 그 다음 질문을 미리 준비
+            if q_id and SPECULATIVE_QUESTIONS:
+                generate_next_question_task.apply_async(args=[interview_id], kwargs={"speculative_for": q_id})
 
             return {"status": "success", "stage": next_stage['stage'], "question": final_content}
     except Exception as e:
+        if speculative_for:
+            # 선행 생성 실패는 면접 진행에 영향 없음 (재시도/폴백 질문 저장 금지)
+            logger.warning(f"⚠️ [Speculative] Interview {interview_id} 선행 생성 실패 (무시): {e}")
+            return {"status": "speculative_failed", "message": str(e)}
         logger.error(f"❌ 실시간 질문 생성 실패 (Retry: {self.request.retries}/3): {e}")
+        if 'stream_publisher' in locals():
+            stream_publisher.error()
+        if 'tts_pipeline' in locals():
+            tts_pipeline.discard()
         if self.request.retries >= 3:
             logger.warning("⚠️ 질문 생성 최대 재시도 횟수 초과. 스테이지별 폴백 질문을 생성합니다.")
             try:
@@ -802,11 +1098,10 @@ def generate_next_question_task(self, interview_id: int):
                     )
                     if q_id:
                         synthesize_task.delay(fallback_text, language="ko", question_id=q_id)
+                    QuestionStreamPublisher(interview_id).done(fallback_text, q_id)
                     return {"status": "success", "stage": fallback_stage_name, "question": fallback_text}
             except Exception as fallback_e:
                 logger.error(f"❌ 폴백 질문 생성 실패: {fallback_e}")
                 return {"status": "error", "message": "Fallback question failed"}
         else:
-            raise self.retry(exc=e, countdown=3)
-    finally:
-        gc.collect()
\ No newline at end of file
+            raise self.retry(exc=e, countdown=3)
\ No newline at end of file
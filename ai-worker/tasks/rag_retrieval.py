@@ -1,14 +1,10 @@
 import sys
 import os
+import json
+import hashlib
 import torch
 from sqlalchemy import text
 
-# 🚨 [최신 표준] langchain_huggingface 사용
-try:
-    from langchain_huggingface import HuggingFaceEmbeddings
-except ImportError:
-    from langchain_community.embeddings import HuggingFaceEmbeddings
-
 # -----------------------------------------------------------
 # [경로 설정]
 # -----------------------------------------------------------
@@ -29,6 +25,10 @@ except ImportError:
 # [모델 설정] Step 6(저장) 때 쓴 모델과 100% 일치해야 함!
 # -----------------------------------------------------------
 from .embedding import get_embedder as _get_central_embedder
+from .resume_chunk_store import search_resume_chunks, search_resume_chunks_bulk
+from utils.query_embedding_cache import CachedQueryEmbeddings, normalize_query
+from utils.redis_client import get_redis_client
+from utils.resume_vector_index import get_resume_index, load_resume_index
 
 def get_embedder():
     """설명:
@@ -44,10 +44,62 @@ def get_embedder():
     device = 'cuda' if torch.cuda.is_available() else 'cpu'
     return _get_central_embedder(device)
 
+_query_embedder = None
+
+def get_query_embedder():
+    """설명:
+        쿼리 벡터 캐시(LRU + Redis)를 앞단에 둔 검색용 임베더 반환 (싱글톤)
+
+        Returns:
+        CachedQueryEmbeddings | None: 캐시 래퍼 (임베딩 모델 로드 실패 시 None)
+
+        생성자: ejm
+        생성일자: 2026-10-17
+    """
+    global _query_embedder
+    if _query_embedder is None:
+        embedder = get_embedder()
+        if not embedder:
+            return None
+        # 캐시 키는 백엔드까지 포함한 model_id 사용 (torch/int8 벡터가 섞이지 않도록)
+        _query_embedder = CachedQueryEmbeddings(embedder, embedder.runtime.model_id)
+    return _query_embedder
+
+def warm_query_embeddings(queries):
+    """설명:
+        고정 검색 쿼리를 미리 임베딩하여 캐시에 적재 (워커 시작 시 호출)
+
+        Args:
+        queries: 사전 적재할 쿼리 목록.
+
+        Returns:
+        int: 새로 계산한 쿼리 수.
+
+        생성자: ejm
+        생성일자: 2026-10-17
+    """
+    query_embedder = get_query_embedder()
+    if not query_embedder:
+        return 0
+    computed = query_embedder.warm(queries)
+    logger.info(f"🔥 [QueryCache] 고정 쿼리 {len(queries)}건 사전 적재 (신규 계산 {computed}건) | {CachedQueryEmbeddings.get_stats()}")
+    return computed
+
+def get_query_embedding_cache_stats():
+    """설명:
+        쿼리 임베딩 캐시 적중률 통계 반환
+
+        Returns:
+        dict: memory_hits, redis_hits, misses, evictions, hit_rate, entries.
+
+        생성자: ejm
+        생성일자: 2026-10-17
+    """
+    return CachedQueryEmbeddings.get_stats()
+
 from langchain_community.vectorstores import PGVector
 
-# -----------------------------------------------------------
-# [핵심] 검색 인스턴스 싱글톤 관리
+# [핵심] 검색 인스턴스 싱글톤 관리 (질문 은행 전용 - 이력서 청크는 resume_chunks 직접 조회)
 # -----------------------------------------------------------
 _vector_stores = {}
 
@@ -66,7 +118,8 @@ def get_vector_store(collection_name):
     """
     global _vector_stores
     if collection_name not in _vector_stores:
-        embedder = get_embedder()
+        # [쿼리 캐시] 검색 시 embed_query가 캐시를 거치도록 래퍼를 주입
+        embedder = get_query_embedder()
         if not embedder:
             return None
         
@@ -82,7 +135,7 @@ def get_vector_store(collection_name):
     return _vector_stores[collection_name]
 
 # -----------------------------------------------------------
-# [핵심] 검색 함수 (LangChain PGVector 활용)
+# [핵심] 이력서 문맥 검색 함수 (resume_chunks 직접 조회)
 # -----------------------------------------------------------
 import logging
 
@@ -91,62 +144,48 @@ logger = logging.getLogger(__name__)
 
 def retrieve_context(query, resume_id=1, top_k=10, filter_type=None):
     """설명:
-        LangChain PGVector를 사용하여 관련 문맥을 검색합니다.
+        resume_chunks 테이블에서 쿼리와 가까운 이력서 문맥을 검색합니다.
+        (쿼리 임베딩은 캐시를 거치고, 검색은 resume_id/chunk_type 필터 + 코사인 거리 정렬 SQL 한 번)
 
         Args:
-        query: 파라미터 설명.
-        resume_id: 파라미터 설명.
-        top_k: 파라미터 설명.
-        filter_type: 파라미터 설명.
+        query: 검색 쿼리
+        resume_id: 이력서 ID
+        top_k: 반환할 최대 문맥 수
+        filter_type: 청크 분류 필터 (chunk_type)
 
         Returns:
-        반환값 정보.
+        list: [{'text', 'meta', 'score'}] (score는 코사인 거리)
 
         생성자: ejm
         생성일자: 2026-02-04
     """
     logger.info(f"🔍 [RAG 검색 시작] Query: '{query}' | ResumeID: {resume_id} | Filter: {filter_type}")
     
-    # 1. 임베딩 모델 및 연결 설정
-    embedder = get_embedder()
-    if not embedder:
+    # 1. 임베딩 모델 설정 (쿼리 캐시 래퍼)
+    query_embedder = get_query_embedder()
+    if not query_embedder:
         logger.error("❌ 임베딩 모델 로드 실패로 검색을 중단합니다.")
         return []
     
     try:
-        # 2. PGVector 인스턴스 가져오기 (캐싱 활용)
-        vector_store = get_vector_store("resume_all_embeddings")
-        if not vector_store:
-             return []
-
-        # 3. 필터 설정 (resume_id + chunk_type)
-        search_filter = {"resume_id": resume_id}
-        if filter_type:
-            search_filter["chunk_type"] = filter_type
-
-        # 4. 유사도 검색 수행
+        # 2. 쿼리 임베딩 (캐시 적중 시 모델 forward 생략)
         logger.debug(f"📐 쿼리 임베딩 및 유사도 계산 중...")
-        docs_with_scores = vector_store.similarity_search_with_score(
-            query, 
-            k=top_k,
-            filter=search_filter
-        )
-
-        # 5. 결과 가공 및 로깅
-        results = []
-        if not docs_with_scores:
-            logger.warning(f"⚠️ 검색 결과가 없습니다. (Filter: {search_filter})")
+        query_vector = query_embedder.embed_query(query)
+
+        # 3. 유사도 검색 수행 (면접 중 적재된 인메모리 인덱스 우선, 없으면 단일 SQL)
+        index = get_resume_index(resume_id)
+        if index is not None:
+            results = index.search(query_vector, top_k=top_k, chunk_type=filter_type)
+        else:
+            results = search_resume_chunks(query_vector, resume_id=resume_id, top_k=top_k, chunk_type=filter_type)
+
+        # 4. 결과 로깅
+        if not results:
+            logger.warning(f"⚠️ 검색 결과가 없습니다. (ResumeID: {resume_id}, Filter: {filter_type})")
             return []
 
-        logger.info(f"✅ 검색 완료: {len(docs_with_scores)}개의 문맥을 발견했습니다.")
-        for i, (doc, score) in enumerate(docs_with_scores):
-            res = {
-                'text': doc.page_content,
-                'meta': doc.metadata,
-                'score': float(score)
-            }
-            results.append(res)
-            
+        logger.info(f"✅ 검색 완료: {len(results)}개의 문맥을 발견했습니다. (쿼리 캐시 적중률: {CachedQueryEmbeddings.get_stats()['hit_rate']:.1%})")
+        for i, res in enumerate(results):
             # 검색 결과 상세 로그 출력
             preview = res['text'].replace('\n', ' ')[:100]
             c_type = res['meta'].get('chunk_type', 'N/A')
@@ -155,45 +194,139 @@ def retrieve_context(query, resume_id=1, top_k=10, filter_type=None):
         return results
 
     except Exception as e:
-        logger.error(f"❌ LangChain PGVector 검색 중 예외 발생: {str(e)}", exc_info=True)
+        logger.error(f"❌ resume_chunks 검색 중 예외 발생: {str(e)}", exc_info=True)
         return []
 
+# -----------------------------------------------------------
+# [핵심] 다중 쿼리 일괄 검색 (면접 단위 Redis 캐시)
+# -----------------------------------------------------------
+RAG_CONTEXT_KEY_TEMPLATE = "interview:{interview_id}:rag_contexts"
+RAG_CONTEXT_TTL = 3 * 3600  # 3시간 (면접 1회 길이보다 충분히 길게)
+
+def _rag_context_field(query, top_k):
+    """면접 캐시 해시 필드 (정규화 쿼리 + top_k)"""
+    return hashlib.sha1(f"{top_k}:{normalize_query(query)}".encode("utf-8")).hexdigest()
+
+def retrieve_contexts_bulk(resume_id, queries, top_k=2, interview_id=None):
+    """설명:
+        여러 스테이지 쿼리의 이력서 문맥을 한 번에 검색합니다.
+        쿼리 임베딩은 한 번의 배치로, 검색은 SQL 한 번(LATERAL)으로 수행하고,
+        interview_id가 주어지면 결과를 면접 단위로 Redis에 보관하여 이후 스테이지는 DB를 거치지 않습니다.
+
+        Args:
+        resume_id: 이력서 ID
+        queries: 검색 쿼리 목록
+        top_k: 쿼리별 반환할 최대 문맥 수
+        interview_id: 결과 캐시 범위 (None이면 캐시 미사용)
+
+        Returns:
+        dict: {쿼리: [{'text', 'meta', 'score'}]}
+
+        생성자: ejm
+        생성일자: 2026-10-17
+    """
+    queries = list(dict.fromkeys(q for q in queries if q))
+    if not queries or not resume_id:
+        return {}
+
+    results = {}
+    client = get_redis_client() if interview_id else None
+    cache_key = RAG_CONTEXT_KEY_TEMPLATE.format(interview_id=interview_id)
+    fields = {q: _rag_context_field(q, top_k) for q in queries}
+
+    # 1. 면접 캐시 조회
+    if client is not None:
+        try:
+            cached = client.hmget(cache_key, [fields[q] for q in queries])
+            for q, raw in zip(queries, cached):
+                if raw:
+                    results[q] = json.loads(raw)
+        except Exception as e:
+            logger.warning(f"⚠️ [RAG Bulk] Redis 조회 실패 (DB 검색으로 진행): {e}")
+
+    missing = [q for q in queries if q not in results]
+    if not missing:
+        logger.info(f"⚡ [RAG Bulk] Interview {interview_id}: {len(queries)}개 쿼리 모두 캐시 적중")
+        return results
+
+    query_embedder = get_query_embedder()
+    if not query_embedder:
+        logger.error("❌ 임베딩 모델 로드 실패로 검색을 중단합니다.")
+        return results
+
+    try:
+        # 2. 미스 쿼리만 배치 임베딩 + 검색 (인메모리 인덱스 행렬 곱 1회, 없으면 단일 SQL)
+        vectors = query_embedder.embed_queries(missing)
+        index = load_resume_index(resume_id, interview_id) if interview_id else get_resume_index(resume_id)
+        if index is not None:
+            fetched = index.search_many(vectors, top_k=top_k)
+        else:
+            fetched = search_resume_chunks_bulk(vectors, resume_id=resume_id, top_k=top_k)
+        results.update(zip(missing, fetched))
+        logger.info(f"✅ [RAG Bulk] ResumeID {resume_id}: {len(missing)}개 쿼리 일괄 검색 완료 (캐시 적중 {len(queries) - len(missing)}개)")
+    except Exception as e:
+        logger.error(f"❌ [RAG Bulk] 일괄 검색 중 예외 발생: {str(e)}", exc_info=True)
+        return results
+
+    # 3. 면접 캐시 저장
+    if client is not None:
+        try:
+            pipe = client.pipeline()
+            pipe.hset(cache_key, mapping={fields[q]: json.dumps(results[q], ensure_ascii=False) for q in missing})
+            pipe.expire(cache_key, RAG_CONTEXT_TTL)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"⚠️ [RAG Bulk] Redis 저장 실패: {e}")
+
+    return results
+
+def evict_interview_contexts(interview_id):
+    """설명:
+        면접 종료 시 면접 단위 문맥 캐시 삭제
+
+        Args:
+        interview_id: 면접 ID
+
+        생성자: ejm
+        생성일자: 2026-10-17
+    """
+    client = get_redis_client()
+    if client is None:
+        return
+    try:
+        client.delete(RAG_CONTEXT_KEY_TEMPLATE.format(interview_id=interview_id))
+    except Exception as e:
+        logger.warning(f"⚠️ [RAG Bulk] 캐시 삭제 실패: {e}")
+
 # -----------------------------------------------------------
 # [핵심] Retriever 생성 함수 (LangChain LCEL용)
 # -----------------------------------------------------------
 def get_retriever(resume_id=1, top_k=10, filter_type=None):
     """설명:
-        LangChain LCEL에서 사용할 수 있는 Retriever 객체를 반환합니다.
+        LangChain LCEL에서 사용할 수 있는 Retriever(Runnable)를 반환합니다.
 
         Args:
-        resume_id: 파라미터 설명.
-        top_k: 파라미터 설명.
-        filter_type: 파라미터 설명.
+        resume_id: 이력서 ID
+        top_k: 반환할 최대 문맥 수
+        filter_type: 청크 분류 필터 (chunk_type)
 
         Returns:
-        반환값 정보.
+        RunnableLambda: 쿼리 → Document 목록
 
         생성자: ejm
         생성일자: 2026-02-04
     """
-    embedder = get_embedder()
-    # 2. 인스턴스 가져오기
-    vector_store = get_vector_store("resume_all_embeddings")
-    if not vector_store:
-         return None
+    from langchain_core.documents import Document
+    from langchain_core.runnables import RunnableLambda
 
-    # 필터 설정
-    search_filter = {"resume_id": resume_id}
-    if filter_type:
-        search_filter["chunk_type"] = filter_type
+    def _retrieve(query):
+        return [
+            Document(page_content=r['text'], metadata=r['meta'])
+            for r in retrieve_context(query, resume_id=resume_id, top_k=top_k, filter_type=filter_type)
+        ]
 
     logger.info(f"📡 Retriever 생성 완료 (ResumeID: {resume_id}, Filter: {filter_type})")
-    return vector_store.as_retriever(
-        search_kwargs={
-            "k": top_k,
-            "filter": search_filter
-        }
-    )
+    return RunnableLambda(_retrieve)
 
 # -----------------------------------------------------------
 # [변경 완료] 질문 은행(questions 테이블) 검색 함수 (All LangChain 방식)
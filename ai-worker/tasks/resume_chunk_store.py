@@ -0,0 +1,163 @@
+"""
+resume_chunks 테이블 직접 접근 모듈 (LangChain PGVector 대체)
+검색은 resume_id/chunk_type 컬럼 필터 + 코사인 거리 정렬을 SQL 한 번으로 수행하고
+(여러 쿼리도 LATERAL 조인으로 한 번에), 저장은 이미 계산된 청크 벡터를 그대로 기록합니다 (재임베딩 없음).
+"""
+import logging
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import delete, insert, text as sql_text
+from sqlmodel import Session, select
+
+from db import engine, ResumeChunk
+
+logger = logging.getLogger(__name__)
+
+# 다중 행 INSERT 1문장에 담을 최대 청크 수 (이력서 1건은 보통 이 안에 들어가 INSERT 1회로 끝남)
+INSERT_BATCH_ROWS = 500
+# pg_advisory_xact_lock 네임스페이스 (resume_id와 조합하여 이력서 단위 잠금)
+RESUME_CHUNK_LOCK_NS = 20261017
+
+
+def _enable_iterative_scan(session: Session) -> None:
+    """HNSW 인덱스 스캔이 resume_id 필터로 걸러진 뒤에도 top_k를 채울 때까지 계속 탐색하도록 설정 (현재 트랜잭션 한정).
+    기본값(off)이면 ef_search(40)개 후보를 먼저 뽑고 필터하므로, 다른 이력서 청크가 많을수록 top_k보다 적게 반환됨.
+    relaxed_order는 결과 순서가 약간 어긋날 수 있으므로 호출부에서 거리 순으로 다시 정렬함 (pgvector 0.8+)."""
+    session.execute(sql_text("SET LOCAL hnsw.iterative_scan = relaxed_order"))
+
+
+def search_resume_chunks(query_vector: List[float], resume_id: int, top_k: int = 10, chunk_type: Optional[str] = None) -> List[Dict[str, Any]]:
+    """설명:
+        이력서 청크를 쿼리 벡터와의 코사인 거리 순으로 조회 (단일 SQL)
+
+    Args:
+        query_vector (list): 쿼리 임베딩 벡터 (1024차원)
+        resume_id (int): 검색 대상 이력서 ID
+        top_k (int): 반환할 최대 청크 수
+        chunk_type (str, optional): 청크 분류 필터
+
+    Returns:
+        list: [{'text', 'meta', 'score'}] (score는 코사인 거리, 작을수록 유사)
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    distance = ResumeChunk.embedding.cosine_distance(query_vector).label("distance")
+    stmt = select(
+        ResumeChunk.content, ResumeChunk.chunk_type, ResumeChunk.chunk_metadata, distance
+    ).where(
+        ResumeChunk.resume_id == resume_id,
+        ResumeChunk.embedding.isnot(None)
+    )
+    if chunk_type:
+        stmt = stmt.where(ResumeChunk.chunk_type == chunk_type)
+    stmt = stmt.order_by(distance).limit(top_k)
+
+    with Session(engine) as session:
+        _enable_iterative_scan(session)
+        rows = session.exec(stmt).all()
+
+    results = []
+    for content, c_type, meta, dist in sorted(rows, key=lambda row: row[3]):
+        results.append({
+            'text': content,
+            'meta': {**(meta or {}), 'resume_id': resume_id, 'chunk_type': c_type},
+            'score': float(dist)
+        })
+    return results
+
+
+def replace_resume_chunks(resume_id: int, embedded_chunks: List[Dict[str, Any]]) -> int:
+    """설명:
+        이력서의 기존 청크를 지우고 임베딩이 끝난 청크를 한 트랜잭션으로 저장 (재처리 시에도 중복 없음).
+        ORM 객체를 만들지 않고 이미 계산된 벡터를 다중 행 INSERT로 바로 기록하며,
+        같은 이력서를 동시에 재처리해도 청크가 섞이지 않도록 이력서 단위 advisory lock을 잡음.
+
+    Args:
+        resume_id (int): 이력서 ID
+        embedded_chunks (list): embed_chunks 결과 [{'text', 'type', 'metadata', 'vector'}]
+
+    Returns:
+        int: 저장된 청크 수
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    rows = [
+        {
+            "resume_id": resume_id,
+            "chunk_index": idx,
+            "chunk_type": item.get("type") or "unknown",
+            "content": item["text"],
+            "metadata": item.get("metadata") or {},
+            "embedding": item["vector"],
+        }
+        for idx, item in enumerate(embedded_chunks)
+    ]
+    table = ResumeChunk.__table__
+
+    with Session(engine) as session:
+        session.execute(
+            sql_text("SELECT pg_advisory_xact_lock(:ns, :resume_id)"),
+            {"ns": RESUME_CHUNK_LOCK_NS, "resume_id": resume_id}
+        )
+        session.execute(delete(table).where(table.c.resume_id == resume_id))
+        for start in range(0, len(rows), INSERT_BATCH_ROWS):
+            session.execute(insert(table).values(rows[start:start + INSERT_BATCH_ROWS]))
+        session.commit()
+
+    # 같은 워커에 적재된 인메모리 인덱스가 있으면 무효화
+    from utils.resume_vector_index import invalidate_resume_index
+    invalidate_resume_index(resume_id)
+    return len(embedded_chunks)
+
+
+def search_resume_chunks_bulk(query_vectors: List[List[float]], resume_id: int, top_k: int = 2) -> List[List[Dict[str, Any]]]:
+    """설명:
+        여러 쿼리 벡터의 top-k 청크를 SQL 한 번(VALUES + CROSS JOIN LATERAL)으로 조회
+
+    Args:
+        query_vectors (list): 쿼리 임베딩 벡터 목록
+        resume_id (int): 검색 대상 이력서 ID
+        top_k (int): 쿼리별 반환할 최대 청크 수
+
+    Returns:
+        list: 입력 순서대로 쿼리별 [{'text', 'meta', 'score'}] 목록
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    if not query_vectors:
+        return []
+
+    params: Dict[str, Any] = {"resume_id": resume_id, "top_k": top_k}
+    values = []
+    for idx, vector in enumerate(query_vectors):
+        params[f"v{idx}"] = "[" + ",".join(str(float(x)) for x in vector) + "]"
+        values.append(f"({idx}, CAST(:v{idx} AS vector))")
+
+    sql = sql_text(f"""
+        SELECT q.idx, rc.content, rc.chunk_type, rc.metadata, rc.distance
+        FROM (VALUES {", ".join(values)}) AS q(idx, vec)
+        CROSS JOIN LATERAL (
+            SELECT c.content, c.chunk_type, c.metadata, c.embedding <=> q.vec AS distance
+            FROM resume_chunks c
+            WHERE c.resume_id = :resume_id AND c.embedding IS NOT NULL
+            ORDER BY c.embedding <=> q.vec
+            LIMIT :top_k
+        ) rc
+        ORDER BY q.idx, rc.distance
+    """)
+
+    with Session(engine) as session:
+        _enable_iterative_scan(session)
+        rows = session.execute(sql, params).all()
+
+    results: List[List[Dict[str, Any]]] = [[] for _ in query_vectors]
+    for idx, content, c_type, meta, dist in rows:
+        results[idx].append({
+            'text': content,
+            'meta': {**(meta or {}), 'resume_id': resume_id, 'chunk_type': c_type},
+            'score': float(dist)
+        })
+    return results
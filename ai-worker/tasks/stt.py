@@ -17,8 +17,8 @@ logger = logging.getLogger("STT-Task")
 # 초기값으로 'None'(아무것도 없음)을 주어, 나중에 모델이 로드되었는지 확인하는 용도로 씁니다.
 stt_model = None
 
-# [문법] os.getenv(A, B): 환경변수 A를 찾고, 없으면 기본값 B를 사용하라는 뜻입니다.
-MODEL_SIZE = os.getenv("WHISPER_MODEL_SIZE", "large-v3-turbo")
+# 모델 크기/환각 문구는 상주 STT 서버(stt_server.py)와 공유하므로 config/stt_config.py에서 관리합니다.
+from config.stt_config import MODEL_SIZE, HALLUCINATION_PHRASES
 
 def load_stt_model():
     """설명:
@@ -91,7 +91,7 @@ def recognize_audio_task(audio_b64: str):
             return {"status": "error", "message": "Model loading failed"}
 
     # [문법] 리스트(List): 여러 개의 문자열을 대괄호 [] 안에 묶어 관리합니다.
-    HALLUCINATIONS = ["겨울이 이렇게", "넘치고 넘치고", "시청해 주셔서", "감사합니다", "청취해 주셔서"]
+    HALLUCINATIONS = HALLUCINATION_PHRASES
 
     input_path = None
     try:
@@ -197,4 +197,95 @@ def recognize_audio_task(audio_b64: str):
             try:
                 os.remove(input_path)
             except OSError:
-                pass
\ No newline at end of file
+                pass
+
+# ==========================================
+# 3. 바이너리 PCM 전송 경로 (base64/JSON 미사용)
+# ==========================================
+
+# media-server main.py 의 STT_PCM_KEY_PREFIX 와 반드시 동일해야 함
+# 값: 16kHz mono int16 little-endian raw PCM (헤더 없음)
+STT_PCM_KEY_PREFIX = "stt:pcm:"
+
+
+def _transcribe_array(audio_np: np.ndarray) -> str:
+    """설명:
+        float32 오디오 배열을 Faster-Whisper로 인식하고 환각 필터를 적용한 텍스트 반환.
+
+    Args:
+        audio_np (np.ndarray): -1.0 ~ 1.0 정규화된 16kHz mono float32 배열.
+
+    Returns:
+        str: 인식된 텍스트 (환각으로 판정되면 빈 문자열).
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    segments, info = stt_model.transcribe(
+        audio_np,
+        beam_size=1,
+        language="ko",
+        vad_filter=True,
+        vad_parameters=dict(
+            threshold=0.35,
+            min_speech_duration_ms=80,
+            min_silence_duration_ms=300,
+            speech_pad_ms=400,
+        ),
+        condition_on_previous_text=False
+    )
+    full_text = "".join([s.text for s in segments]).strip()
+    if any(h in full_text for h in HALLUCINATION_PHRASES) and len(full_text) < 15:
+        logger.warning(f"🚫 환각 감지: {full_text}")
+        return ""
+    return full_text
+
+
+@shared_task(name="tasks.stt.recognize_pcm")
+def recognize_pcm_task(audio_key: str):
+    """설명:
+        media-server가 Redis 바이너리 키에 한 번 써 둔 raw PCM을 핸들(키)로 받아 STT 수행.
+        Celery 메시지에는 키 문자열만 실리므로 브로커 메모리/직렬화 비용이 답변 길이와 무관함.
+        PCM은 GETDEL로 읽는 즉시 삭제되며, STT_SERVER_ADDR가 설정되어 있으면 상주 STT 서버로 넘김.
+
+    Args:
+        audio_key (str): STT_PCM_KEY_PREFIX로 시작하는 Redis 키.
+
+    Returns:
+        dict: {"status": "success", "text": ...} 또는 {"status": "error", "message": ...}.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    global stt_model
+
+    if not audio_key or not audio_key.startswith(STT_PCM_KEY_PREFIX):
+        return {"status": "error", "message": "Invalid audio handle"}
+
+    try:
+        from utils.redis_client import get_redis_binary_client
+        from utils.stt_client import transcribe_via_server
+        client = get_redis_binary_client()
+        if client is None:
+            return {"status": "error", "message": "Redis unavailable"}
+
+        pcm = client.getdel(audio_key)
+        if not pcm:
+            return {"status": "error", "message": "Audio expired or missing"}
+
+        # 상주 STT 서버(stt_server.py)가 설정되어 있으면 PCM을 그대로 넘겨 배치 처리에 합류
+        text = transcribe_via_server(pcm)
+        if text is not None:
+            return {"status": "success", "text": text}
+
+        # 서버 미설정/장애 시 워커 내 모델로 처리 (지연 로딩)
+        if stt_model is None:
+            success = load_stt_model()
+            if not success or stt_model is None:
+                return {"status": "error", "message": "Model loading failed"}
+
+        audio_np = np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+        return {"status": "success", "text": _transcribe_array(audio_np)}
+    except Exception as e:
+        logger.error(f"STT(PCM) 에러: {e}")
+        return {"status": "error", "message": str(e)}
@@ -9,6 +9,11 @@ import scipy.io.wavfile as wavfile
 from abc import ABC, abstractmethod
 from celery import shared_task
 
+from utils.tts_pipeline import (
+    TTS_DIR, TTS_SEGMENT_DIR, ASSEMBLY_LOCK_KEY_TEMPLATE, ASSEMBLY_PLAN_TTL,
+    segment_path, dispatch_assembly_if_ready, schedule_segment_cleanup
+)
+
 # 스레드 안전성 확보를 위한 락
 tts_lock = threading.Lock()
 
@@ -190,7 +195,7 @@ def synthesize_task(text: str, language="ko", speed=1.0, **kwargs):
         text (str): 변환할 텍스트
         language (str): 언어 코드 (기본값: "ko")
         speed (float): 음성 속도 (기본값: 1.0)
-        **kwargs: 추가 설정 (question_id 등)
+        **kwargs: 추가 설정 (question_id, 선행 생성용 output_path 등)
 
     Returns:
         dict: 상태(success/error), Base64 오디오 데이터, 합성 시간 등을 포함
@@ -256,7 +261,26 @@ def synthesize_task(text: str, language="ko", speed=1.0, **kwargs):
                 logger.info(f"💾 [파일 저장 성공] 경로: {out_path} (크기: {len(audio_bytes)} bytes)")
             except Exception as save_err:
                 logger.warning(f"⚠️ [파일 저장 실패] {save_err}")
-            
+        elif kwargs.get("output_path"):
+            # [선행 생성] 질문 ID가 정해지기 전 임시 경로에 저장 (확정 시 q_{id}.wav 로 이름 변경됨)
+            try:
+                out_path = kwargs["output_path"]
+                os.makedirs(os.path.dirname(out_path), exist_ok=True)
+                part_path = out_path[:-len(".wav")] + ".part.wav" if out_path.endswith(".wav") else out_path + ".part"
+                with open(part_path, "wb") as f:
+                    f.write(audio_bytes)
+                os.replace(part_path, out_path)
+                logger.info(f"💾 [파일 저장 성공] 경로: {out_path} (크기: {len(audio_bytes)} bytes)")
+                # 합성 도중 답변이 도착해 선행 생성이 이미 확정(전체 합성으로 대체)/폐기되었으면 파일을 남기지 않음
+                base_qid = kwargs.get("base_question_id")
+                if base_qid is not None:
+                    from utils.speculative_store import is_speculative_pending, discard_speculative_tts
+                    if not is_speculative_pending(kwargs.get("interview_id"), base_qid):
+                        discard_speculative_tts(kwargs.get("interview_id"), base_qid)
+                        logger.info(f"🗑️ [Speculative] 이미 소비된 선행 생성의 늦은 TTS 삭제: {out_path}")
+            except Exception as save_err:
+                logger.warning(f"⚠️ [파일 저장 실패] {save_err}")
+
         return {
             "status": "success", 
             # "audio_base64": audio_b64,  # 로그 스팸 방지를 위해 제거 (파일로 저장됨)
@@ -269,4 +293,159 @@ def synthesize_task(text: str, language="ko", speed=1.0, **kwargs):
     finally:
         if temp_path and os.path.exists(temp_path):
             try: os.remove(temp_path)
-            except: pass
\ No newline at end of file
+            except: pass
+
+# ==============================================================================
+# [문장 파이프라인] 세그먼트 합성 및 조립 (utils/tts_pipeline.py 참고)
+# ==============================================================================
+SEGMENT_GAP_SEC = 0.12           # 문장 사이 무음 간격
+
+
+def _notify_segment_done(segment_key: str):
+    """세그먼트 완료 후 조립 계획 확인 (실패해도 finalize가 예약한 기한부 조립이 처리)"""
+    try:
+        dispatch_assembly_if_ready(segment_key)
+    except Exception as e:
+        logger.warning(f"⚠️ [TTS 세그먼트] 조립 확인 실패 ({segment_key}): {e}")
+
+
+@shared_task(name="tasks.tts.synthesize_segment")
+def synthesize_segment_task(text: str, segment_key: str, seq: int, interview_id=None, language="ko"):
+    """설명:
+        스트리밍 중 완성된 문장 1개를 합성하여 세그먼트 WAV로 저장하는 Celery 태스크.
+        실패 시 .err 마커를 남기고, 어느 쪽이든 끝나면 조립 계획을 확인하여 마지막 세그먼트였으면 조립을 발행함.
+
+    Args:
+        text (str): 합성할 문장
+        segment_key (str): 세그먼트 디렉터리 키
+        seq (int): 세그먼트 순번
+        interview_id (int): 면접 ID (세그먼트 준비 이벤트 발행용)
+        language (str): 언어 코드 (기본값: "ko")
+
+    Returns:
+        dict: 상태 및 세그먼트 경로
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    out_path = segment_path(segment_key, seq)
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    tmp_path = segment_path(segment_key, seq, "part.wav")
+
+    # 엔진 로드/합성 중 어떤 실패든 .err 마커를 남겨 조립이 기한(ASSEMBLE_DEADLINE_SEC)까지 기다리지 않게 함
+    try:
+        if tts_engine is None:
+            load_tts_engine()
+        with tts_lock:
+            result = tts_engine.generate_speech(text, tmp_path, language=language)
+        if result["success"]:
+            # 조립 태스크가 쓰는 도중의 파일을 읽지 않도록 원자적 교체
+            os.replace(tmp_path, out_path)
+    except Exception as e:
+        result = {"success": False, "error": str(e)}
+
+    if not result["success"]:
+        logger.error(f"❌ [TTS 세그먼트 실패] {segment_key}#{seq}: {result.get('error')}")
+        open(segment_path(segment_key, seq, "err"), "w").close()
+        _notify_segment_done(segment_key)
+        return {"status": "error", "message": result.get("error")}
+
+    logger.info(f"🧩 [TTS 세그먼트 완료] {segment_key}#{seq} ({result.get('duration_ms', 0):.0f}ms): {text[:30]}")
+
+    if interview_id is not None:
+        from utils.question_stream import QuestionStreamPublisher
+        QuestionStreamPublisher(interview_id).audio_segment(
+            seq, f"/uploads/tts/segments/{segment_key}/{seq:03d}.wav"
+        )
+    _notify_segment_done(segment_key)
+    return {"status": "success", "path": out_path}
+
+
+@shared_task(name="tasks.tts.assemble_segments")
+def assemble_segments_task(segment_key: str, seqs: list, question_id: int, fallback_text: str):
+    """설명:
+        선행 합성된 세그먼트들을 순서대로 이어 붙여 q_{question_id}.wav 를 생성하는 Celery 태스크.
+        마지막 세그먼트 완료 시 발행되며(dispatch_assembly_if_ready), 같은 키로 여러 번 발행되어도 Redis 잠금으로 1회만 실행.
+        기한부 발행(세그먼트 유실) 시점까지 빠진 세그먼트가 있거나 세그먼트 실패 시에는 전체 합성(synthesize_task)으로 폴백.
+        어느 경우든 세그먼트 디렉터리는 정리 예약됨.
+
+    Args:
+        segment_key (str): 세그먼트 디렉터리 키
+        seqs (list): 조립할 세그먼트 순번 목록 (재생 순서)
+        question_id (int): 대상 질문 ID
+        fallback_text (str): 폴백 시 합성할 최종 질문 텍스트
+
+    Returns:
+        dict: 상태 및 결과 파일 크기
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    import numpy as np
+    from utils.redis_client import get_redis_client
+
+    final_path = os.path.join(TTS_DIR, f"q_{question_id}.wav")
+    if os.path.exists(final_path) and os.path.getsize(final_path) > 0:
+        logger.info(f"⏩ [TTS 조립 스킵] 파일 이미 존재: {final_path}")
+        return {"status": "success", "audio_size_bytes": os.path.getsize(final_path), "duration_ms": 0}
+
+    client = get_redis_client()
+    lock_key = ASSEMBLY_LOCK_KEY_TEMPLATE.format(segment_key=segment_key)
+    if client is not None and not client.set(lock_key, "1", nx=True, ex=ASSEMBLY_PLAN_TTL):
+        logger.info(f"⏩ [TTS 조립 스킵] 이미 조립 중/완료: {segment_key}")
+        return {"status": "skipped"}
+
+    try:
+        failed = any(os.path.exists(segment_path(segment_key, s, "err")) for s in seqs)
+        missing = [s for s in seqs if not os.path.exists(segment_path(segment_key, s))]
+        if missing and not failed:
+            logger.warning(f"⚠️ [TTS 조립] 기한 내 세그먼트 미완료 ({missing}) → 전체 합성으로 폴백")
+        if failed or missing:
+            return synthesize_task(fallback_text, language="ko", question_id=question_id)
+
+        try:
+            sample_rate, parts = None, []
+            for s in seqs:
+                sr, audio = wavfile.read(segment_path(segment_key, s))
+                if sample_rate is None:
+                    sample_rate = sr
+                elif sr != sample_rate:
+                    raise ValueError(f"sample rate mismatch ({sr} != {sample_rate})")
+                if parts:
+                    parts.append(np.zeros((int(sr * SEGMENT_GAP_SEC),) + audio.shape[1:], dtype=audio.dtype))
+                parts.append(audio)
+
+            os.makedirs(TTS_DIR, exist_ok=True)
+            tmp_path = os.path.join(TTS_DIR, f"q_{question_id}.part.wav")
+            wavfile.write(tmp_path, sample_rate, np.concatenate(parts))
+            os.replace(tmp_path, final_path)
+        except Exception as e:
+            logger.error(f"❌ [TTS 조립 실패] {e} → 전체 합성으로 폴백")
+            return synthesize_task(fallback_text, language="ko", question_id=question_id)
+
+        size = os.path.getsize(final_path)
+        logger.info(f"💾 [TTS 조립 완료] Question {question_id}: {len(seqs)}개 세그먼트 → {final_path} ({size} bytes)")
+        return {"status": "success", "audio_size_bytes": size, "duration_ms": 0}
+    finally:
+        schedule_segment_cleanup(segment_key)
+
+
+@shared_task(name="tasks.tts.cleanup_segments")
+def cleanup_segments_task(segment_key: str):
+    """설명:
+        조립/폴백이 끝난 세그먼트 디렉터리(.wav, .part.wav, .err 포함)를 삭제하는 Celery 태스크.
+
+    Args:
+        segment_key (str): 세그먼트 디렉터리 키
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    import shutil
+
+    seg_dir = os.path.join(TTS_SEGMENT_DIR, segment_key)
+    # 키는 "{interview_id}_{hex}" 형식이므로 세그먼트 루트 밖을 가리킬 수 없지만 방어적으로 확인
+    if os.path.dirname(os.path.abspath(seg_dir)) != os.path.abspath(TTS_SEGMENT_DIR):
+        return
+    shutil.rmtree(seg_dir, ignore_errors=True)
+    logger.info(f"🧹 [TTS 세그먼트 정리] {seg_dir}")
@@ -0,0 +1,238 @@
+"""
+LLM Scheduler Tests
+"""
+import pytest
+
+import llm_scheduler
+from llm_scheduler import SchedulingClass, LLMRequest, LLMScheduler
+
+
+@pytest.fixture(name="scheduler")
+def scheduler_fixture():
+    """interactive(선점 불가, 동시 2) + batch(선점 가능, 동시 1) 스케줄러"""
+    return LLMScheduler((
+        SchedulingClass("batch", 1, 1, preemptible=True),
+        SchedulingClass("interactive", 0, 2, preemptible=False),
+    ))
+
+
+def make_request(priority: str, prompt: str = "prompt") -> LLMRequest:
+    return LLMRequest({"prompt": prompt, "params": {"max_tokens": 100}}, future=None, priority=priority)
+
+
+def run_tokens(request: LLMRequest, count: int):
+    """추론 스레드가 count개 토큰을 생성한 상태를 흉내냄"""
+    request.generated += "t" * count
+    request.generated_tokens += count
+    request.tokens_since_resume += count
+
+
+def test_pick_prefers_higher_class(scheduler):
+    """Test interactive requests are picked before earlier batch requests"""
+    batch = make_request("batch")
+    interactive = make_request("interactive")
+    scheduler.submit(batch)
+    scheduler.submit(interactive)
+
+    assert scheduler._pick() is interactive
+    assert scheduler._pick() is batch
+    assert scheduler._pick() is None
+
+
+def test_pick_is_fifo_within_class(scheduler):
+    """Test requests of the same class are picked in submission order"""
+    first, second = make_request("interactive"), make_request("interactive")
+    scheduler.submit(first)
+    scheduler.submit(second)
+
+    assert scheduler._pick() is first
+    assert scheduler._pick() is second
+
+
+def test_pick_respects_concurrency_limit(scheduler):
+    """Test a class at its concurrency limit does not start new requests"""
+    requests = [make_request("interactive") for _ in range(3)]
+    for request in requests:
+        scheduler.submit(request)
+
+    assert scheduler._pick() is requests[0]
+    assert scheduler._pick() is requests[1]
+    assert scheduler._pick() is None
+    assert scheduler.classes["interactive"].in_progress == 2
+
+
+def test_pick_resumes_preempted_before_waiting(scheduler):
+    """Test a preempted request resumes before new requests of its class, without a new slot"""
+    scheduler.classes["batch"].max_concurrency = 2
+    running, waiting = make_request("batch"), make_request("batch")
+    scheduler.submit(running)
+    assert scheduler._pick() is running
+    scheduler.submit(waiting)
+    scheduler.preempt(running)
+
+    assert scheduler._pick() is running
+    assert scheduler.classes["batch"].in_progress == 1
+    assert scheduler._pick() is waiting
+
+
+def test_should_yield_when_higher_class_waits(scheduler):
+    """Test a batch request yields once it has generated the minimum tokens"""
+    batch = make_request("batch")
+    scheduler.submit(batch)
+    scheduler._pick()
+    scheduler.submit(make_request("interactive"))
+
+    run_tokens(batch, batch.min_tokens_before_yield() - 1)
+    assert scheduler.should_yield(batch) is False
+    run_tokens(batch, 1)
+    assert scheduler.should_yield(batch) is True
+
+
+def test_should_yield_without_higher_class_work(scheduler):
+    """Test a batch request keeps generating when no higher class request is ready"""
+    batch = make_request("batch")
+    scheduler.submit(batch)
+    scheduler._pick()
+    run_tokens(batch, 1000)
+
+    assert scheduler.should_yield(batch) is False
+
+
+def test_should_yield_never_for_interactive(scheduler):
+    """Test non-preemptible classes never yield"""
+    interactive = make_request("interactive")
+    scheduler.submit(interactive)
+    scheduler._pick()
+    scheduler.submit(make_request("interactive"))
+    run_tokens(interactive, 1000)
+
+    assert scheduler.should_yield(interactive) is False
+
+
+def test_should_yield_ignores_higher_class_at_limit(scheduler):
+    """Test a higher class waiting behind its own concurrency limit does not preempt"""
+    batch = make_request("batch")
+    scheduler.submit(batch)
+    scheduler._pick()
+    scheduler.classes["interactive"].in_progress = 2
+    scheduler.submit(make_request("interactive"))
+    run_tokens(batch, 1000)
+
+    assert scheduler.should_yield(batch) is False
+
+
+def test_min_tokens_grow_with_prompt_length():
+    """Test the minimum tokens before yielding scale with the re-prefill length"""
+    request = make_request("batch")
+    request.prompt_tokens = 10
+    assert request.min_tokens_before_yield() == llm_scheduler.LLM_PREEMPT_MIN_TOKENS
+
+    request.prompt_tokens = 4000
+    short_output = request.min_tokens_before_yield()
+    assert short_output == int(4000 * llm_scheduler.LLM_PREEMPT_PROMPT_RATIO)
+
+    request.generated_tokens = 2000
+    assert request.min_tokens_before_yield() > short_output
+
+
+def test_should_yield_counts_tokens_since_resume(scheduler):
+    """Test tokens generated before a preemption do not count toward the next yield"""
+    batch = make_request("batch")
+    scheduler.submit(batch)
+    scheduler._pick()
+    run_tokens(batch, 50)
+    scheduler.preempt(batch)
+    assert scheduler._pick() is batch
+    batch.tokens_since_resume = 0  # acquire()가 재개 시 초기화
+    scheduler.submit(make_request("interactive"))
+
+    assert scheduler.should_yield(batch) is False
+
+
+def test_preempt_caps_per_request(scheduler):
+    """Test a request stops yielding after LLM_PREEMPT_MAX_PER_REQUEST preemptions"""
+    batch = make_request("batch")
+    scheduler.submit(batch)
+    scheduler._pick()
+    for _ in range(llm_scheduler.LLM_PREEMPT_MAX_PER_REQUEST):
+        scheduler.preempt(batch)
+        assert scheduler._pick() is batch
+
+    scheduler.submit(make_request("interactive"))
+    run_tokens(batch, 1000)
+    assert batch.preemptions == llm_scheduler.LLM_PREEMPT_MAX_PER_REQUEST
+    assert scheduler.should_yield(batch) is False
+
+
+def test_preempt_pushes_to_front_and_counts(scheduler):
+    """Test preempted requests are resumed most-recent first and counted in stats"""
+    scheduler.classes["batch"].max_concurrency = 2
+    first, second = make_request("batch"), make_request("batch")
+    for request in (first, second):
+        scheduler.submit(request)
+        scheduler._pick()
+    scheduler.preempt(first)
+    scheduler.preempt(second)
+
+    assert scheduler._pick() is second
+    assert scheduler._pick() is first
+    assert scheduler.get_stats()["batch"]["preemptions"] == 2
+
+
+def test_finish_releases_slot_once(scheduler):
+    """Test finish frees the concurrency slot and is idempotent"""
+    scheduler.classes["interactive"].max_concurrency = 1
+    first, second = make_request("interactive"), make_request("interactive")
+    scheduler.submit(first)
+    scheduler.submit(second)
+    assert scheduler._pick() is first
+    assert scheduler._pick() is None
+
+    scheduler.finish(first)
+    scheduler.finish(first)
+    assert scheduler.classes["interactive"].in_progress == 0
+    assert scheduler._pick() is second
+
+
+def test_finish_ignores_unstarted_request(scheduler):
+    """Test finishing a request that never started does not change counters"""
+    scheduler.finish(make_request("batch"))
+
+    assert scheduler.classes["batch"].in_progress == 0
+
+
+def test_cancel_removes_waiting_request(scheduler):
+    """Test cancelling a queued request removes it and closes its sink"""
+    request = make_request("batch")
+    scheduler.submit(request)
+    scheduler.cancel(request)
+
+    assert request.cancelled is True
+    assert request.sink.get_nowait() is None
+    assert scheduler._pick() is None
+    assert scheduler.classes["batch"].in_progress == 0
+
+
+def test_cancel_releases_preempted_slot(scheduler):
+    """Test cancelling a preempted request frees its concurrency slot"""
+    request = make_request("batch")
+    scheduler.submit(request)
+    scheduler._pick()
+    scheduler.preempt(request)
+    scheduler.cancel(request)
+
+    assert scheduler.classes["batch"].in_progress == 0
+    assert scheduler._pick() is None
+
+
+def test_pick_skips_cancelled_requests(scheduler):
+    """Test requests flagged as cancelled are dropped by _pick without starting"""
+    cancelled, live = make_request("interactive"), make_request("interactive")
+    scheduler.submit(cancelled)
+    scheduler.submit(live)
+    cancelled.cancelled = True
+
+    assert scheduler._pick() is live
+    assert cancelled.sink.get_nowait() is None
+    assert scheduler.classes["interactive"].in_progress == 1
+
@@ -0,0 +1,129 @@
+"""
+KURE-v1 동적 배칭 (워커 프로세스 내 임베딩 서버 스레드)
+
+retrieve_context, retrieve_similar_questions, generate_question_embedding, generate_answer_embedding,
+이력서 청크 저장이 각자 batch=1 forward를 돌리지 않도록, 모든 encode 요청을 하나의 큐로 모아
+전용 스레드가 짧은 대기 창(EMBEDDING_BATCH_WAIT_MS) 동안 들어온 요청을 한 배치로 묶어 실행합니다.
+
+    - 요청 텍스트 1건 = Future 1개. 호출 스레드는 자신의 Future만 기다림
+    - 배치는 텍스트 길이 순으로 정렬해 패딩을 줄이고, 결과는 각 Future로 되돌림
+    - 쿼리(검색, 실시간 면접 경로)를 대량 문서 임베딩(이력서 저장)보다 먼저 배치에 채움
+    - 모델 forward는 이 스레드에서만 실행되므로 GPU 모델을 여러 태스크 스레드가 동시에 호출하지 않음
+"""
+import os
+import time
+import logging
+import threading
+from collections import deque
+from concurrent.futures import Future
+from typing import Callable, List
+
+logger = logging.getLogger("EmbeddingBatcher")
+
+# 첫 요청 도착 후 다른 요청을 기다리는 최대 시간과 forward 1회 최대 텍스트 수
+EMBEDDING_BATCH_WAIT_MS = float(os.getenv("EMBEDDING_BATCH_WAIT_MS", "5"))
+EMBEDDING_BATCH_MAX = int(os.getenv("EMBEDDING_BATCH_MAX", "64"))
+
+KIND_QUERY = "query"
+KIND_PASSAGE = "passage"
+
+
+class EmbeddingBatcher:
+    """설명:
+        encode 요청을 모아 길이 정렬된 배치로 실행하는 백그라운드 스레드.
+        스레드는 첫 submit 시 시작함 (Celery 워커 프로세스 안에서 생성되도록).
+
+    Attributes:
+        encode_fn (Callable): 텍스트 목록(접두어 적용 완료)을 받아 벡터 목록을 반환하는 함수.
+        wait_ms (float): 배치 수집 대기 창 (밀리초).
+        max_batch (int): forward 1회 최대 텍스트 수.
+        stats (dict): 누적 요청 수/배치 수/텍스트 수.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+
+    def __init__(self, encode_fn: Callable[[List[str]], List[List[float]]],
+                 wait_ms: float = EMBEDDING_BATCH_WAIT_MS, max_batch: int = EMBEDDING_BATCH_MAX):
+        self.encode_fn = encode_fn
+        self.wait_ms = wait_ms
+        self.max_batch = max(1, max_batch)
+        self._pending = {KIND_QUERY: deque(), KIND_PASSAGE: deque()}
+        self._cond = threading.Condition()
+        self._thread = None
+        self.stats = {"requests": 0, "batches": 0, "texts": 0}
+
+    def _ensure_started(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._loop, name="embedding-batcher", daemon=True)
+            self._thread.start()
+
+    def submit(self, texts: List[str], kind: str = KIND_PASSAGE) -> List[Future]:
+        """설명:
+            텍스트 목록을 배치 큐에 넣고 텍스트별 Future를 반환.
+
+        Args:
+            texts (list): 접두어가 이미 적용된 입력 텍스트.
+            kind (str): query / passage (query가 배치에 먼저 채워짐).
+
+        Returns:
+            list: 입력 순서와 같은 Future 목록 (result()는 list[float]).
+
+        생성자: ejm
+        생성일자: 2026-10-17
+        """
+        futures = [Future() for _ in texts]
+        if not texts:
+            return futures
+        with self._cond:
+            self._ensure_started()
+            self._pending[kind].extend(zip(texts, futures))
+            self.stats["requests"] += 1
+            self._cond.notify()
+        return futures
+
+    def encode(self, texts: List[str], kind: str = KIND_PASSAGE) -> List[List[float]]:
+        """submit 후 모든 결과를 기다려 벡터 목록으로 반환 (배치 실패 시 예외 전파)"""
+        return [future.result() for future in self.submit(texts, kind)]
+
+    def _pending_count(self) -> int:
+        return len(self._pending[KIND_QUERY]) + len(self._pending[KIND_PASSAGE])
+
+    def _take_batch(self) -> list:
+        """대기 창이 끝나거나 max_batch가 찰 때까지 기다린 뒤 쿼리 우선으로 최대 max_batch건을 꺼냄"""
+        with self._cond:
+            while self._pending_count() == 0:
+                self._cond.wait()
+            deadline = time.monotonic() + self.wait_ms / 1000.0
+            while self._pending_count() < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+            batch = []
+            for kind in (KIND_QUERY, KIND_PASSAGE):
+                queue = self._pending[kind]
+                while queue and len(batch) < self.max_batch:
+                    batch.append(queue.popleft())
+        return batch
+
+    def _loop(self) -> None:
+        while True:
+            batch = self._take_batch()
+            # 길이 순 정렬 → 한 배치 안의 패딩 최소화
+            batch.sort(key=lambda item: len(item[0]))
+            live = [(text, future) for text, future in batch if future.set_running_or_notify_cancel()]
+            if not live:
+                continue
+            try:
+                vectors = self.encode_fn([text for text, _ in live])
+            except Exception as e:
+                logger.error(f"❌ 임베딩 배치 실패 ({len(live)}건): {e}")
+                for _, future in live:
+                    future.set_exception(e)
+                continue
+            for (_, future), vector in zip(live, vectors):
+                future.set_result(vector)
+            self.stats["batches"] += 1
+            self.stats["texts"] += len(live)
@@ -0,0 +1,108 @@
+"""
+내용 주소 기반 임베딩 캐시 (Postgres embedding_cache 테이블)
+
+여러 이력서에 반복되는 청크(자격증, 학교명 등), 같은 파일의 재처리, 질문 은행 일괄 임포트/재임베딩에서
+이미 계산한 텍스트는 KURE-v1 forward 없이 저장된 벡터를 재사용합니다.
+
+키: SHA-256(접두어 + 정규화 텍스트) + 모델 식별자(EmbeddingRuntime.model_id)
+    - 정규화는 NFC + 공백 축약이므로 공백/유니코드 표기만 다른 텍스트는 같은 벡터를 공유
+    - 접두어 정책이나 백엔드(torch/onnx-int8)가 바뀌면 키가 달라져 자동으로 새로 계산됨
+
+DB 조회/저장이 실패하면 경고만 남기고 모델로 직접 임베딩합니다 (캐시는 성능 최적화일 뿐 정합성에 관여하지 않음).
+"""
+import os
+import hashlib
+import logging
+from typing import Dict, List
+
+from .embedding_batcher import KIND_QUERY
+from .embedding_runtime import PASSAGE_PREFIX, QUERY_PREFIX, EmbeddingRuntime
+from .query_embedding_cache import normalize_query
+
+logger = logging.getLogger("EmbeddingCache")
+
+EMBEDDING_CACHE_ENABLED = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+# IN 조회 1회당 최대 해시 수
+LOOKUP_BATCH_ROWS = 1000
+
+
+def content_hash(text: str, prefix: str = "") -> str:
+    """캐시 키용 SHA-256 (접두어 + 정규화 텍스트)"""
+    return hashlib.sha256((prefix + normalize_query(text)).encode("utf-8")).hexdigest()
+
+
+def _lookup(model_id: str, hashes: List[str]) -> Dict[str, List[float]]:
+    from sqlalchemy import select
+    from db import engine, EmbeddingCache
+
+    table = EmbeddingCache.__table__
+    found = {}
+    with engine.connect() as conn:
+        for start in range(0, len(hashes), LOOKUP_BATCH_ROWS):
+            stmt = select(table.c.content_hash, table.c.embedding).where(
+                table.c.model_id == model_id,
+                table.c.content_hash.in_(hashes[start:start + LOOKUP_BATCH_ROWS]),
+            )
+            for digest, embedding in conn.execute(stmt):
+                found[digest] = embedding.tolist() if hasattr(embedding, "tolist") else list(embedding)
+    return found
+
+
+def _store(model_id: str, vectors: Dict[str, List[float]]) -> None:
+    from sqlalchemy.dialects.postgresql import insert
+    from db import engine, EmbeddingCache
+
+    rows = [{"content_hash": digest, "model_id": model_id, "embedding": vector} for digest, vector in vectors.items()]
+    table = EmbeddingCache.__table__
+    with engine.begin() as conn:
+        for start in range(0, len(rows), LOOKUP_BATCH_ROWS):
+            # 동시에 같은 텍스트를 계산한 다른 워커가 먼저 저장했으면 그대로 둠
+            conn.execute(insert(table).values(rows[start:start + LOOKUP_BATCH_ROWS]).on_conflict_do_nothing())
+
+
+def encode_cached(runtime: EmbeddingRuntime, texts: List[str], kind: str) -> List[List[float]]:
+    """설명:
+        캐시를 먼저 조회하고, 처음 보는 텍스트만 (배치 내 중복 제거 후) 임베딩하여 캐시에 저장.
+
+    Args:
+        runtime (EmbeddingRuntime): 임베딩 런타임 (model_id가 캐시 키에 포함됨).
+        texts (list): 입력 텍스트.
+        kind (str): query / passage (접두어 선택).
+
+    Returns:
+        list: 입력 순서와 같은 벡터 목록.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    if not texts:
+        return []
+    encode = runtime.encode_queries if kind == KIND_QUERY else runtime.encode_passages
+    if not EMBEDDING_CACHE_ENABLED:
+        return encode(texts)
+
+    prefix = QUERY_PREFIX if kind == KIND_QUERY else PASSAGE_PREFIX
+    hashes = [content_hash(t, prefix) for t in texts]
+    model_id = runtime.model_id
+
+    try:
+        cached = _lookup(model_id, list(set(hashes)))
+    except Exception as e:
+        logger.warning(f"⚠️ 임베딩 캐시 조회 실패 (직접 임베딩): {e}")
+        return encode(texts)
+
+    # 캐시에 없는 텍스트는 해시당 1번만 계산
+    missing = {}
+    for digest, text in zip(hashes, texts):
+        if digest not in cached and digest not in missing:
+            missing[digest] = text
+    if missing:
+        computed = dict(zip(missing.keys(), encode(list(missing.values()))))
+        try:
+            _store(model_id, computed)
+        except Exception as e:
+            logger.warning(f"⚠️ 임베딩 캐시 저장 실패: {e}")
+        cached.update(computed)
+
+    logger.info(f"🗃️ 임베딩 캐시: {len(texts)}건 중 {len(texts) - len(missing)}건 재사용, {len(missing)}건 신규 계산")
+    return [cached[digest] for digest in hashes]
@@ -0,0 +1,195 @@
+"""
+KURE-v1 ONNX Runtime int8 백엔드 (CPU 전용 워커용)
+
+EMBEDDING_BACKEND=onnx-int8 이면 EmbeddingRuntime이 SentenceTransformer 대신 이 모델을 사용합니다.
+최초 사용 시 torch 모델을 ONNX로 내보내고 동적 int8 양자화(가중치 QInt8)를 적용해 캐시 폴더에 저장하며,
+이후에는 저장된 int8 모델만 ONNX Runtime으로 로드합니다 (torch 가중치를 메모리에 올리지 않음).
+
+정확도/처리량 확인: scripts/benchmark_embedding_backends.py
+"""
+import os
+import json
+import shutil
+import logging
+import tempfile
+from typing import List
+
+import numpy as np
+
+logger = logging.getLogger("EmbeddingONNX")
+
+# ONNX Runtime 연산 스레드 수 (CPU 워커의 코어 할당에 맞춤)
+EMBEDDING_ONNX_THREADS = int(os.getenv("EMBEDDING_ONNX_THREADS", "4"))
+ONNX_MODEL_FILE = "model.int8.onnx"
+ONNX_META_FILE = "embedding_meta.json"
+
+
+def onnx_model_dir(cache_dir: str, model_name: str) -> str:
+    """모델별 int8 ONNX 저장 폴더"""
+    return os.path.join(cache_dir, "onnx-int8", model_name.replace("/", "__"))
+
+
+def export_onnx_int8(model_name: str, cache_dir: str, target_dir: str) -> None:
+    """설명:
+        SentenceTransformer 모델을 ONNX로 내보내고 동적 int8 양자화하여 target_dir에 저장.
+        여러 워커가 동시에 내보내도 깨진 파일이 보이지 않도록 임시 폴더에서 만든 뒤 rename으로 교체.
+
+    Args:
+        model_name (str): HuggingFace 모델 ID.
+        cache_dir (str): 원본 모델 캐시 폴더.
+        target_dir (str): int8 모델 저장 폴더.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    import torch
+    from sentence_transformers import SentenceTransformer
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    logger.info(f"🛠️ [ONNX] {model_name} int8 변환 시작 (최초 1회)")
+    st_model = SentenceTransformer(model_name, device="cpu", cache_folder=cache_dir, trust_remote_code=True)
+    transformer, pooling = st_model[0], st_model[1]
+    pooling_mode = "cls" if pooling.pooling_mode_cls_token else "mean"
+
+    class _Encoder(torch.nn.Module):
+        """ONNX 그래프 출력을 last_hidden_state 하나로 고정"""
+
+        def __init__(self, auto_model):
+            super().__init__()
+            self.auto_model = auto_model
+
+        def forward(self, input_ids, attention_mask):
+            return self.auto_model(input_ids=input_ids, attention_mask=attention_mask).last_hidden_state
+
+    parent = os.path.dirname(target_dir)
+    os.makedirs(parent, exist_ok=True)
+    work_dir = tempfile.mkdtemp(prefix="export-", dir=parent)
+    try:
+        # fp32 원본(XLM-R large, 2GB 초과)은 외부 데이터 형식으로 임시 폴더에만 저장
+        fp32_dir = os.path.join(work_dir, "fp32")
+        os.makedirs(fp32_dir)
+        fp32_path = os.path.join(fp32_dir, "model.onnx")
+        dummy = transformer.tokenizer(["임베딩 변환용 예시 문장입니다."], return_tensors="pt")
+        dynamic = {0: "batch", 1: "sequence"}
+        with torch.no_grad():
+            torch.onnx.export(
+                _Encoder(transformer.auto_model.eval()),
+                (dummy["input_ids"], dummy["attention_mask"]),
+                fp32_path,
+                input_names=["input_ids", "attention_mask"],
+                output_names=["last_hidden_state"],
+                dynamic_axes={"input_ids": dynamic, "attention_mask": dynamic, "last_hidden_state": dynamic},
+                opset_version=17,
+            )
+
+        out_dir = os.path.join(work_dir, "out")
+        os.makedirs(out_dir)
+        quantize_dynamic(fp32_path, os.path.join(out_dir, ONNX_MODEL_FILE), weight_type=QuantType.QInt8)
+        transformer.tokenizer.save_pretrained(out_dir)
+        with open(os.path.join(out_dir, ONNX_META_FILE), "w", encoding="utf-8") as f:
+            json.dump({
+                "model": model_name,
+                "pooling": pooling_mode,
+                "max_seq_length": st_model.max_seq_length,
+                "dim": st_model.get_sentence_embedding_dimension(),
+            }, f)
+
+        try:
+            os.rename(out_dir, target_dir)
+        except OSError:
+            # 다른 프로세스가 먼저 완료함 → 그쪽 결과 사용
+            logger.info("[ONNX] 다른 워커가 먼저 변환을 완료하여 해당 모델을 사용합니다.")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    logger.info(f"✅ [ONNX] int8 모델 저장 완료: {target_dir}")
+
+
+class OnnxEmbeddingModel:
+    """설명:
+        int8 ONNX KURE-v1 추론기. EmbeddingRuntime이 사용하는 SentenceTransformer.encode 인자 부분집합을 지원함.
+        배치는 텍스트 길이 순으로 묶어 패딩을 줄이고, 결과는 입력 순서로 되돌림.
+
+    Attributes:
+        pooling (str): 문장 벡터 풀링 방식 (cls / mean, 원본 모델 설정을 따름).
+        max_seq_length (int): 최대 토큰 길이.
+        dim (int): 출력 차원.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+
+    def __init__(self, model_dir: str, threads: int = EMBEDDING_ONNX_THREADS):
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        with open(os.path.join(model_dir, ONNX_META_FILE), encoding="utf-8") as f:
+            meta = json.load(f)
+        self.pooling = meta["pooling"]
+        self.max_seq_length = meta["max_seq_length"]
+        self.dim = meta["dim"]
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = threads
+        options.inter_op_num_threads = 1
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(
+            os.path.join(model_dir, ONNX_MODEL_FILE), options, providers=["CPUExecutionProvider"]
+        )
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        logger.info(f"✅ [ONNX] int8 임베딩 모델 로드 (threads={threads}, pooling={self.pooling})")
+
+    def _pool(self, hidden: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        if self.pooling == "cls":
+            return hidden[:, 0]
+        weights = mask[..., None].astype(np.float32)
+        return (hidden * weights).sum(axis=1) / np.clip(weights.sum(axis=1), 1e-9, None)
+
+    def encode(self, texts: List[str], batch_size: int = 32, normalize_embeddings: bool = True, **_) -> np.ndarray:
+        """설명:
+            텍스트 목록을 임베딩 (SentenceTransformer.encode 호환 반환형: (N, dim) float32 배열).
+
+        Args:
+            texts (list): 입력 텍스트.
+            batch_size (int): 세션 실행 1회당 텍스트 수.
+            normalize_embeddings (bool): L2 정규화 여부.
+
+        Returns:
+            np.ndarray: 입력 순서와 같은 임베딩 행렬.
+
+        생성자: ejm
+        생성일자: 2026-10-17
+        """
+        out = np.empty((len(texts), self.dim), dtype=np.float32)
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        for start in range(0, len(order), batch_size):
+            idx = order[start:start + batch_size]
+            enc = self.tokenizer(
+                [texts[i] for i in idx], padding=True, truncation=True,
+                max_length=self.max_seq_length, return_tensors="np"
+            )
+            mask = enc["attention_mask"].astype(np.int64)
+            hidden = self.session.run(None, {"input_ids": enc["input_ids"].astype(np.int64), "attention_mask": mask})[0]
+            out[idx] = self._pool(hidden, mask)
+        if normalize_embeddings:
+            out /= np.clip(np.linalg.norm(out, axis=1, keepdims=True), 1e-12, None)
+        return out
+
+
+def load_onnx_int8_model(model_name: str, cache_dir: str) -> OnnxEmbeddingModel:
+    """설명:
+        int8 ONNX 모델 로드 (없으면 먼저 변환).
+
+    Args:
+        model_name (str): HuggingFace 모델 ID.
+        cache_dir (str): 모델 캐시 폴더.
+
+    Returns:
+        OnnxEmbeddingModel: 추론기.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    model_dir = onnx_model_dir(cache_dir, model_name)
+    if not os.path.exists(os.path.join(model_dir, ONNX_MODEL_FILE)):
+        export_onnx_int8(model_name, cache_dir, model_dir)
+    return OnnxEmbeddingModel(model_dir)
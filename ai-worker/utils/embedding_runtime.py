@@ -0,0 +1,211 @@
+"""
+KURE-v1 임베딩 런타임 (프로세스당 모델 1개)
+
+이력서 청크 저장, RAG 검색(LangChain), 질문 은행 임베딩(batch_embed_questions, ResumeEmbedder)이
+모두 이 모듈의 단일 SentenceTransformer 인스턴스를 사용하므로, 워커 프로세스가 같은 가중치를 두 번 올리지 않고
+저장 벡터와 검색 벡터가 항상 같은 방식(접두어/정규화)으로 계산됩니다.
+
+API:
+    get_embedding_runtime().encode_queries(texts) / encode_passages(texts)   - 배치
+    get_embedding_runtime().encode_query(text) / encode_passage(text)        - 단건
+    RuntimeEmbeddings(runtime)                                               - LangChain Embeddings 어댑터
+
+백엔드 (EMBEDDING_BACKEND):
+    torch     - SentenceTransformer (기본, GPU/CPU)
+    onnx-int8 - ONNX Runtime 동적 int8 양자화 모델 (CPU 전용 워커용, utils/embedding_onnx.py)
+
+동적 배칭 (EMBEDDING_DYNAMIC_BATCHING, 기본 true):
+    encode_* 호출은 utils/embedding_batcher.py의 배칭 스레드를 거치며, 동시에 들어온 여러 태스크의 요청이
+    한 번의 길이 정렬된 forward로 묶임
+"""
+import os
+import logging
+import threading
+from typing import List, Optional
+
+from langchain_core.embeddings import Embeddings
+
+from .embedding_batcher import KIND_PASSAGE, KIND_QUERY, EmbeddingBatcher
+
+logger = logging.getLogger("EmbeddingRuntime")
+
+EMBEDDING_MODEL = "nlpai-lab/KURE-v1"
+EMBEDDING_DIM = 1024
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "32"))
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "torch").lower()
+EMBEDDING_BACKENDS = ("torch", "onnx-int8")
+EMBEDDING_DYNAMIC_BATCHING = os.getenv("EMBEDDING_DYNAMIC_BATCHING", "true").lower() == "true"
+
+# KURE-v1(BGE-M3 계열)은 쿼리/문서 접두어 없이 학습되었으므로 둘 다 빈 문자열.
+# 접두어 정책은 이 두 상수로만 정하며, 바꾸면 저장된 벡터를 모두 다시 계산해야 함
+QUERY_PREFIX = ""
+PASSAGE_PREFIX = ""
+
+
+class EmbeddingRuntime:
+    """설명:
+        KURE-v1 임베딩 모델 싱글톤 (torch SentenceTransformer 또는 ONNX int8). 첫 호출 시 한 번만 로드하며(스레드 안전),
+        모든 출력은 L2 정규화된 1024차원 벡터(list[float])임.
+
+    Attributes:
+        model_name (str): 모델 식별자.
+        backend (str): 추론 백엔드 (torch / onnx-int8).
+        device (str): 추론 장치 (cuda / cpu, onnx-int8은 항상 cpu).
+        batcher (EmbeddingBatcher | None): 동적 배칭 스레드 (비활성화 시 None, 호출 스레드에서 직접 forward).
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    _instance: Optional["EmbeddingRuntime"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, device: Optional[str] = None, backend: str = EMBEDDING_BACKEND,
+                 dynamic_batching: bool = EMBEDDING_DYNAMIC_BATCHING):
+        if backend not in EMBEDDING_BACKENDS:
+            raise ValueError(f"Unknown EMBEDDING_BACKEND: {backend} (expected one of {EMBEDDING_BACKENDS})")
+        self.model_name = EMBEDDING_MODEL
+        self.backend = backend
+        self.device = "cpu" if backend == "onnx-int8" else device
+        self._model = None
+        self._load_lock = threading.Lock()
+        self.batcher = EmbeddingBatcher(self._forward) if dynamic_batching else None
+
+    @classmethod
+    def instance(cls, device: Optional[str] = None) -> "EmbeddingRuntime":
+        """프로세스 전역 런타임 반환 (device는 최초 생성 시에만 반영)"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls(device)
+        return cls._instance
+
+    @property
+    def model_id(self) -> str:
+        """벡터 캐시 키용 식별자 (int8 벡터는 torch 벡터와 미세하게 다르므로 백엔드를 구분)"""
+        return self.model_name if self.backend == "torch" else f"{self.model_name}@{self.backend}"
+
+    @property
+    def model(self):
+        if self._model is None:
+            with self._load_lock:
+                if self._model is None:
+                    self._model = self._load()
+        return self._model
+
+    def _load(self):
+        """백엔드별 모델 로드 (torch는 장치 미지정 시 GPU 우선)"""
+        cache_dir = "/app/models/embeddings" if os.path.exists("/app/models") else "./models/embeddings"
+        os.makedirs(cache_dir, exist_ok=True)
+
+        if self.backend == "onnx-int8":
+            from .embedding_onnx import load_onnx_int8_model
+            return load_onnx_int8_model(self.model_name, cache_dir)
+
+        import torch
+        from sentence_transformers import SentenceTransformer
+
+        if self.device is None:
+            self.device = "cuda" if torch.cuda.is_available() else "cpu"
+
+        logger.info(f"🚀 임베딩 모델 로드 시작 ({self.model_name}, device={self.device}, cache={cache_dir})")
+        model = SentenceTransformer(self.model_name, device=self.device, cache_folder=cache_dir, trust_remote_code=True)
+        logger.info("✅ 임베딩 모델 메모리 상주 완료")
+        return model
+
+    def _forward(self, texts: List[str], batch_size: Optional[int] = None) -> List[List[float]]:
+        """접두어가 적용된 텍스트를 모델에 통과 (배칭 스레드는 모은 배치 전체를 forward 1회로 실행)"""
+        vectors = self.model.encode(
+            texts,
+            batch_size=batch_size or len(texts),
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        return vectors.tolist()
+
+    def _encode(self, texts: List[str], prefix: str, batch_size: int, kind: str) -> List[List[float]]:
+        if not texts:
+            return []
+        prefixed = [prefix + t for t in texts]
+        if self.batcher is not None:
+            return self.batcher.encode(prefixed, kind)
+        return self._forward(prefixed, batch_size)
+
+    def encode_queries(self, texts: List[str], batch_size: int = EMBEDDING_BATCH_SIZE) -> List[List[float]]:
+        """설명:
+            검색 쿼리 배치 임베딩.
+
+        Args:
+            texts (list): 쿼리 목록.
+            batch_size (int): 모델 forward 배치 크기 (동적 배칭 시에는 EMBEDDING_BATCH_MAX를 따름).
+
+        Returns:
+            list: 입력 순서와 같은 벡터 목록.
+
+        생성자: ejm
+        생성일자: 2026-10-17
+        """
+        return self._encode(texts, QUERY_PREFIX, batch_size, KIND_QUERY)
+
+    def encode_passages(self, texts: List[str], batch_size: int = EMBEDDING_BATCH_SIZE) -> List[List[float]]:
+        """설명:
+            저장/검색 대상 문서(이력서 청크, 질문 은행, 답변) 배치 임베딩.
+
+        Args:
+            texts (list): 문서 목록.
+            batch_size (int): 모델 forward 배치 크기 (동적 배칭 시에는 EMBEDDING_BATCH_MAX를 따름).
+
+        Returns:
+            list: 입력 순서와 같은 벡터 목록.
+
+        생성자: ejm
+        생성일자: 2026-10-17
+        """
+        return self._encode(texts, PASSAGE_PREFIX, batch_size, KIND_PASSAGE)
+
+    def encode_query(self, text: str) -> List[float]:
+        return self.encode_queries([text])[0]
+
+    def encode_passage(self, text: str) -> List[float]:
+        return self.encode_passages([text])[0]
+
+
+def get_embedding_runtime(device: Optional[str] = None) -> EmbeddingRuntime:
+    """설명:
+        프로세스 전역 임베딩 런타임 반환 (모델은 첫 encode 시 로드).
+
+    Args:
+        device (str, optional): 추론 장치 (None이면 GPU 우선 자동 선택).
+
+    Returns:
+        EmbeddingRuntime: 싱글톤 런타임.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    return EmbeddingRuntime.instance(device)
+
+
+class RuntimeEmbeddings(Embeddings):
+    """설명:
+        EmbeddingRuntime을 LangChain Embeddings 인터페이스로 노출하는 어댑터 (PGVector, 쿼리 캐시 등).
+
+    Attributes:
+        runtime (EmbeddingRuntime): 실제 임베딩 런타임.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+
+    def __init__(self, runtime: EmbeddingRuntime):
+        self.runtime = runtime
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.runtime.encode_passages(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.runtime.encode_query(text)
+
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """쿼리 여러 건을 한 번의 배치 forward로 임베딩"""
+        return self.runtime.encode_queries(texts)
@@ -3,7 +3,10 @@ EXAONE-3.5-7.8B-Instruct 순수 LLM 엔진 모듈 (GGUF 버전)
 프롬프트나 비즈니스 로직 없이, 모델 로딩 및 텍스트 생성 기능만 제공합니다.
 """
 import os
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
 # from llama_cpp import Llama (Moved inside ExaoneLLM.__init__)
 
 logger = logging.getLogger("EXAONE-ENGINE")
@@ -11,9 +14,18 @@ logger = logging.getLogger("EXAONE-ENGINE")
 # 모델 경로 (컨테이너 내부 경로)
 MODEL_PATH = "/app/models/EXAONE-3.5-7.8B-Instruct-Q4_K_M.gguf"
 
+# [Prefix KV 캐시] 고정 페르소나 블록 평가 후의 llama 상태를 보관하는 LRU 크기
+# (항목당 프리픽스 길이만큼의 KV 캐시 수십 MB 수준)
+PREFIX_CACHE_SIZE = int(os.getenv("EXAONE_PREFIX_CACHE_SIZE", "8"))
+# 이보다 짧은 프리픽스는 저장/복원 비용이 더 크므로 캐시하지 않음
+PREFIX_CACHE_MIN_TOKENS = 32
+
 from typing import Any, List, Optional, ClassVar
 from langchain_core.language_models.llms import LLM
 from langchain_core.callbacks.manager import CallbackManagerForLLMRun
+from langchain_core.outputs import GenerationChunk
+
+from .llm_client import LLM_SERVER_ADDR, generate_via_server, stream_via_server, call_server
 # from llama_cpp import Llama (Moved inside ExaoneLLM.__init__)
 
 class ExaoneLLM(LLM):
@@ -26,6 +38,12 @@ class ExaoneLLM(LLM):
     _instance: ClassVar[Optional["ExaoneLLM"]] = None
     llm: ClassVar[Any] = None
     _initialized: ClassVar[bool] = False
+    # [Prefix KV 캐시] (scope, prefix_hash) -> LlamaState, LRU 순서 유지
+    _prefix_cache: ClassVar["OrderedDict"] = OrderedDict()
+    _prefix_stats: ClassVar[dict] = {"hits": 0, "misses": 0, "evictions": 0, "saved_prefill_tokens": 0}
+    # [로컬 모드] llama-cpp 컨텍스트는 동시 호출이 불가하므로 모델 로드/생성/프리픽스 캐시를 직렬화
+    # (ai-worker-gpu는 threads 풀이라 LLM_SERVER_ADDR 없이 띄우면 여러 태스크 스레드가 같은 엔진을 호출함)
+    _engine_lock: ClassVar[threading.RLock] = threading.RLock()
     
     def __new__(cls, **kwargs):
         """설명:
@@ -56,6 +74,23 @@ class ExaoneLLM(LLM):
         super().__init__(**kwargs)
         if hasattr(self, "_initialized") and self._initialized:
             return
+
+        with ExaoneLLM._engine_lock:
+            if not ExaoneLLM._initialized:
+                self._load_engine()
+
+    def _load_engine(self):
+        """설명:
+            서빙 프로세스 사용 여부/GPU 설정에 따라 GGUF 모델을 로드 (_engine_lock 안에서 1회만 호출).
+
+        생성자: ejm
+        생성일자: 2026-10-17
+        """
+        # [상주 서빙] 노드의 EXAONE 서빙 프로세스(llm_server.py)가 모델을 보유 → 워커는 요청만 전달
+        if LLM_SERVER_ADDR:
+            logger.info(f"🔗 EXAONE 서빙 프로세스 사용 ({LLM_SERVER_ADDR}) - 이 워커에서는 모델을 로드하지 않습니다.")
+            ExaoneLLM._initialized = True
+            return
         
         # CPU 환경에서도 GGUF는 실행 가능하므로 로딩 허용
         use_gpu = os.getenv("USE_GPU", "true").lower() == "true"
@@ -121,6 +156,13 @@ class ExaoneLLM(LLM):
             생성자: ejm
             생성일자: 2026-02-04
         """
+        if LLM_SERVER_ADDR:
+            try:
+                return generate_via_server(prompt, stop, kwargs).strip()
+            except Exception as e:
+                logger.error(f"EXAONE 서빙 프로세스 요청 실패: {e}")
+                return ""
+
         if ExaoneLLM.llm is None:
             logger.error("❌ EXAONE 모델이 로드되지 않았습니다. (CPU 모드이거나 로딩 실패)")
             raise RuntimeError("EXAONE engine is not initialized. Check if this is a GPU worker.")
@@ -128,14 +170,18 @@ class ExaoneLLM(LLM):
         try:
             # stop 시퀀스 기본값 설정
             stop_sequences = ["[|endofturn|]", "[|user|]"] if stop is None else stop
-            
-            output = ExaoneLLM.llm(
-                prompt,
-                max_tokens=kwargs.get("max_tokens", 2048),
-                stop=stop_sequences,
-                temperature=kwargs.get("temperature", 0.7),
-                echo=False
-            )
+
+            with ExaoneLLM._engine_lock:
+                # [Prefix KV 캐시] 고정 페르소나 블록의 상태를 복원하여 가변 부분만 prefill
+                self._restore_prefix(prompt, kwargs.get("cache_prefix"), kwargs.get("cache_scope"))
+
+                output = ExaoneLLM.llm(
+                    prompt,
+                    max_tokens=kwargs.get("max_tokens", 2048),
+                    stop=stop_sequences,
+                    temperature=kwargs.get("temperature", 0.7),
+                    echo=False
+                )
             return output['choices'][0]['text'].strip()
         except Exception as e:
             logger.error(f"생성 도중 오류 발생: {e}")
@@ -162,30 +208,144 @@ class ExaoneLLM(LLM):
             생성자: ejm
             생성일자: 2026-02-04
         """
+        if LLM_SERVER_ADDR:
+            try:
+                for chunk in stream_via_server(prompt, stop, kwargs):
+                    if run_manager:
+                        run_manager.on_llm_new_token(chunk)
+                    yield GenerationChunk(text=chunk)
+            except Exception as e:
+                logger.error(f"EXAONE 서빙 프로세스 스트리밍 실패: {e}")
+            return
+
         if ExaoneLLM.llm is None:
             raise RuntimeError("EXAONE engine is not initialized.")
 
         try:
             stop_sequences = ["[|endofturn|]", "[|user|]"] if stop is None else stop
-            
-            # stream=True 옵션으로 llama-cpp 호출
-            responses = ExaoneLLM.llm(
-                prompt,
-                max_tokens=kwargs.get("max_tokens", 2048),
-                stop=stop_sequences,
-                temperature=kwargs.get("temperature", 0.7),
-                stream=True
-            )
 
-            from langchain_core.outputs import GenerationChunk
-            for response in responses:
-                chunk = response['choices'][0]['text']
-                if chunk:
-                    yield GenerationChunk(text=chunk)
+            # 스트림이 끝나거나 소비 측이 닫을 때까지 엔진을 점유
+            with ExaoneLLM._engine_lock:
+                # [Prefix KV 캐시] 고정 페르소나 블록의 상태를 복원하여 가변 부분만 prefill
+                self._restore_prefix(prompt, kwargs.get("cache_prefix"), kwargs.get("cache_scope"))
+
+                # stream=True 옵션으로 llama-cpp 호출
+                responses = ExaoneLLM.llm(
+                    prompt,
+                    max_tokens=kwargs.get("max_tokens", 2048),
+                    stop=stop_sequences,
+                    temperature=kwargs.get("temperature", 0.7),
+                    stream=True
+                )
+
+                for response in responses:
+                    chunk = response['choices'][0]['text']
+                    if chunk:
+                        if run_manager:
+                            run_manager.on_llm_new_token(chunk)
+                        yield GenerationChunk(text=chunk)
                     
         except Exception as e:
+            # [수정] 에러 문구를 토큰으로 내보내면 질문 텍스트에 섞여 브라우저까지 전달됨
+            # _call과 동일하게 빈 출력으로 끝내고, 호출 측의 폴백 로직에 맡김
             logger.error(f"스트리밍 도중 오류 발생: {e}")
-            yield GenerationChunk(text=f"Error: {str(e)}")
+            return
+
+    def _restore_prefix(self, prompt: str, cache_prefix: Optional[str], cache_scope: Any = None) -> None:
+        """설명:
+            프롬프트가 고정 프리픽스(페르소나 블록)로 시작하면, 해당 프리픽스까지 평가된 llama 상태를 복원.
+            캐시에 없으면 프리픽스만 먼저 평가한 뒤 상태를 저장 (LRU).
+            복원 후 llama-cpp의 prefix-match가 일치 구간을 건너뛰므로 가변 부분만 prefill 됨.
+
+        Args:
+            prompt (str): 전체 프롬프트.
+            cache_prefix (str): 프롬프트 앞부분의 고정 블록 (None이면 캐시 미사용).
+            cache_scope (Any): 캐시 소유 범위 (면접 ID 등, 종료 시 evict_prefix_cache로 일괄 제거).
+
+        생성자: ejm
+        생성일자: 2026-10-17
+        """
+        if not cache_prefix or PREFIX_CACHE_SIZE <= 0 or not prompt.startswith(cache_prefix):
+            return
+
+        cache = ExaoneLLM._prefix_cache
+        stats = ExaoneLLM._prefix_stats
+        key = (str(cache_scope), hashlib.sha1(cache_prefix.encode("utf-8")).hexdigest())
+
+        try:
+            state = cache.get(key)
+            if state is not None:
+                cache.move_to_end(key)
+                ExaoneLLM.llm.load_state(state)
+                stats["hits"] += 1
+                stats["saved_prefill_tokens"] += state.n_tokens
+                return
+
+            # create_completion과 동일한 방식(BOS, special token)으로 토큰화
+            tokens = ExaoneLLM.llm.tokenize(cache_prefix.encode("utf-8"), add_bos=True, special=True)
+            if len(tokens) < PREFIX_CACHE_MIN_TOKENS:
+                return
+
+            stats["misses"] += 1
+            ExaoneLLM.llm.reset()
+            ExaoneLLM.llm.eval(tokens)
+            state = ExaoneLLM.llm.save_state()
+            # logits_all=False 이므로 마지막 행 외의 scores는 사용되지 않음 → 1행만 보관하여 메모리 절감
+            # (load_state의 슬라이스 대입 시 브로드캐스트됨)
+            state.scores = state.scores[-1:].copy()
+            cache[key] = state
+
+            while len(cache) > PREFIX_CACHE_SIZE:
+                cache.popitem(last=False)
+                stats["evictions"] += 1
+        except Exception as e:
+            # 캐시 실패는 생성 자체를 막지 않음 (llama-cpp가 처음부터 prefill)
+            logger.warning(f"⚠️ Prefix KV 캐시 처리 실패 (scope={cache_scope}): {e}")
+
+    @classmethod
+    def evict_prefix_cache(cls, cache_scope: Any) -> int:
+        """설명:
+            특정 범위(면접 ID 등)의 프리픽스 상태를 캐시에서 제거.
+
+        Args:
+            cache_scope (Any): 제거할 캐시 범위.
+
+        Returns:
+            int: 제거된 항목 수.
+
+        생성자: ejm
+        생성일자: 2026-10-17
+        """
+        if LLM_SERVER_ADDR:
+            return call_server("evict", scope=str(cache_scope)).get("evicted", 0)
+
+        scope = str(cache_scope)
+        with cls._engine_lock:
+            keys = [k for k in cls._prefix_cache if k[0] == scope]
+            for k in keys:
+                del cls._prefix_cache[k]
+            cls._prefix_stats["evictions"] += len(keys)
+        return len(keys)
+
+    @classmethod
+    def get_prefix_cache_stats(cls) -> dict:
+        """설명:
+            프리픽스 캐시 적중/미스 카운터와 절감된 prefill 토큰 수 반환.
+
+        Returns:
+            dict: hits, misses, evictions, saved_prefill_tokens, hit_rate, entries.
+
+        생성자: ejm
+        생성일자: 2026-10-17
+        """
+        if LLM_SERVER_ADDR:
+            return call_server("stats").get("prefix_cache", {})
+
+        stats = dict(cls._prefix_stats)
+        total = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / total, 3) if total else 0.0
+        stats["entries"] = len(cls._prefix_cache)
+        return stats
 
     @property
     def _llm_type(self) -> str:
@@ -0,0 +1,113 @@
+"""
+EXAONE 서빙 프로세스(llm_server.py) 클라이언트
+Celery 태스크가 GGUF 모델을 직접 로드하지 않고, 노드에 상주하는 서빙 프로세스에 생성 요청을 보냅니다.
+
+프로토콜 (TCP, 연결 1개 = 요청 1건, 모든 프레임은 [4바이트 big-endian 길이][UTF-8 JSON]):
+    요청: {"op": "generate", "prompt", "stop", "params", "priority", "stream"}
+          {"op": "evict", "scope"} / {"op": "stats"}
+    응답: 스트리밍이면 {"token": ...} 프레임 여러 개 후 {"done": true},
+          아니면 {"text": ...} 1개. 실패 시 {"error": ...}
+"""
+import os
+import json
+import socket
+import logging
+from typing import Any, Iterator, List, Optional
+
+from .stt_client import HEADER, recv_exact
+
+logger = logging.getLogger("LLM-Client")
+
+# "host:port" (비어 있으면 서빙 프로세스를 사용하지 않고 워커 내에서 모델을 로드)
+LLM_SERVER_ADDR = os.getenv("LLM_SERVER_ADDR", "")
+LLM_SERVER_TIMEOUT = float(os.getenv("LLM_SERVER_TIMEOUT", "600"))
+
+# 우선순위 클래스: 실시간 면접 질문 생성이 리포트 평가보다 먼저 처리되며, batch는 생성 도중에도 양보함
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BATCH = "batch"
+
+# 서빙 프로세스로 전달하는 생성 파라미터 (그 외 LangChain kwargs는 전달하지 않음)
+GENERATION_PARAMS = ("max_tokens", "temperature", "cache_prefix", "cache_scope")
+
+
+def send_frame(sock: socket.socket, message: dict) -> None:
+    payload = json.dumps(message, ensure_ascii=False).encode("utf-8")
+    sock.sendall(HEADER.pack(len(payload)) + payload)
+
+
+def recv_frame(sock: socket.socket) -> dict:
+    (size,) = HEADER.unpack(recv_exact(sock, HEADER.size))
+    message = json.loads(recv_exact(sock, size).decode("utf-8"))
+    if "error" in message:
+        raise RuntimeError(f"LLM server error: {message['error']}")
+    return message
+
+
+def _connect(request: dict) -> socket.socket:
+    host, _, port = LLM_SERVER_ADDR.rpartition(":")
+    sock = socket.create_connection((host, int(port)), timeout=LLM_SERVER_TIMEOUT)
+    send_frame(sock, request)
+    return sock
+
+
+def _generate_request(prompt: str, stop: Optional[List[str]], kwargs: dict, stream: bool) -> dict:
+    return {
+        "op": "generate",
+        "prompt": prompt,
+        "stop": stop,
+        "params": {k: kwargs[k] for k in GENERATION_PARAMS if kwargs.get(k) is not None},
+        "priority": kwargs.get("priority") or PRIORITY_BATCH,
+        "stream": stream,
+    }
+
+
+def generate_via_server(prompt: str, stop: Optional[List[str]], kwargs: dict) -> str:
+    """설명:
+        서빙 프로세스에 생성 요청을 보내고 완성된 텍스트를 받음.
+
+    Args:
+        prompt (str): 전체 프롬프트.
+        stop (list): stop 시퀀스 (None이면 서버 기본값).
+        kwargs (dict): ExaoneLLM._call kwargs (max_tokens, temperature, cache_prefix, cache_scope, priority).
+
+    Returns:
+        str: 생성 텍스트.
+
+    Raises:
+        ConnectionError, RuntimeError: 연결 실패 또는 서버 오류.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    with _connect(_generate_request(prompt, stop, kwargs, stream=False)) as sock:
+        return recv_frame(sock).get("text", "")
+
+
+def stream_via_server(prompt: str, stop: Optional[List[str]], kwargs: dict) -> Iterator[str]:
+    """설명:
+        서빙 프로세스에 스트리밍 생성 요청을 보내고 토큰을 도착 순서대로 반환.
+        소비를 중단하면 연결이 닫히고 서버는 다음 토큰에서 생성을 멈춤.
+
+    Args:
+        prompt (str): 전체 프롬프트.
+        stop (list): stop 시퀀스 (None이면 서버 기본값).
+        kwargs (dict): ExaoneLLM._stream kwargs.
+
+    Yields:
+        str: 생성 토큰 조각.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    with _connect(_generate_request(prompt, stop, kwargs, stream=True)) as sock:
+        while True:
+            message = recv_frame(sock)
+            if message.get("done"):
+                return
+            yield message["token"]
+
+
+def call_server(op: str, **fields: Any) -> dict:
+    """관리 요청(evict/stats)을 보내고 응답 프레임 반환"""
+    with _connect({"op": op, **fields}) as sock:
+        return recv_frame(sock)
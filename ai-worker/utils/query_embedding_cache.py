@@ -0,0 +1,225 @@
+"""
+RAG 검색용 쿼리 임베딩 캐시
+retrieve_context는 면접마다 같은 고정 쿼리(인성 단계 키워드 등)를 반복 검색하므로,
+KURE-v1 forward 결과를 (모델명, 정규화된 쿼리) 키로 보관하여 재사용합니다.
+
+계층:
+    1. 프로세스 내 LRU (OrderedDict, 최대 QUERY_EMBED_CACHE_SIZE 건)
+    2. Redis (선택, 워커 재시작/다른 GPU 워커 간 공유) - float32 바이트를 base64로 저장
+"""
+import os
+import re
+import base64
+import hashlib
+import logging
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import List, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from .redis_client import get_redis_client
+
+logger = logging.getLogger("QueryEmbeddingCache")
+
+QUERY_EMBED_CACHE_SIZE = int(os.getenv("QUERY_EMBED_CACHE_SIZE", "512"))
+QUERY_EMBED_REDIS_CACHE = os.getenv("QUERY_EMBED_REDIS_CACHE", "true").lower() == "true"
+QUERY_EMBED_REDIS_TTL = 7 * 24 * 3600  # 7일 (모델이 바뀌면 키가 달라지므로 길게 유지)
+QUERY_EMBED_KEY_TEMPLATE = "rag:qemb:{model}:{digest}"
+
+
+def normalize_query(text: str) -> str:
+    """설명:
+        캐시 키용 쿼리 정규화 (유니코드 NFC, 앞뒤 공백 제거, 연속 공백 축약).
+
+    Args:
+        text (str): 원본 쿼리.
+
+    Returns:
+        str: 정규화된 쿼리.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    return re.sub(r'\s+', ' ', unicodedata.normalize("NFC", text or "")).strip()
+
+
+class CachedQueryEmbeddings(Embeddings):
+    """설명:
+        임베딩 모델 앞단의 쿼리 벡터 캐시 래퍼 (LangChain Embeddings 호환).
+        embed_query만 캐시하고, 문서 임베딩(embed_documents)은 그대로 위임함.
+
+    Attributes:
+        embedder (Embeddings): 실제 임베딩 모델.
+        model_name (str): 캐시 키에 포함되는 모델 식별자.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    _lru: "OrderedDict[str, List[float]]" = OrderedDict()
+    _stats: dict = {"memory_hits": 0, "redis_hits": 0, "misses": 0, "evictions": 0}
+    _lock = threading.Lock()
+
+    def __init__(self, embedder: Embeddings, model_name: str):
+        self.embedder = embedder
+        self.model_name = model_name
+
+    def _cache_key(self, normalized: str) -> str:
+        """(모델명, 정규화 쿼리) → 캐시 키"""
+        digest = hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+        return QUERY_EMBED_KEY_TEMPLATE.format(model=self.model_name, digest=digest)
+
+    def _remember(self, key: str, vector: List[float]):
+        """LRU에 저장 (용량 초과 시 가장 오래된 항목 제거)"""
+        cls = CachedQueryEmbeddings
+        with cls._lock:
+            cls._lru[key] = vector
+            cls._lru.move_to_end(key)
+            while len(cls._lru) > QUERY_EMBED_CACHE_SIZE:
+                cls._lru.popitem(last=False)
+                cls._stats["evictions"] += 1
+
+    def _redis_get(self, key: str) -> Optional[List[float]]:
+        """Redis에서 벡터 조회 (비활성/실패 시 None)"""
+        client = get_redis_client() if QUERY_EMBED_REDIS_CACHE else None
+        if client is None:
+            return None
+        try:
+            raw = client.get(key)
+            if not raw:
+                return None
+            return np.frombuffer(base64.b64decode(raw), dtype=np.float32).tolist()
+        except Exception as e:
+            logger.warning(f"⚠️ [QueryCache] Redis 조회 실패: {e}")
+            return None
+
+    def _redis_set(self, key: str, vector: List[float]):
+        """Redis에 벡터 저장 (float32 → base64)"""
+        client = get_redis_client() if QUERY_EMBED_REDIS_CACHE else None
+        if client is None:
+            return
+        try:
+            payload = base64.b64encode(np.asarray(vector, dtype=np.float32).tobytes()).decode("ascii")
+            client.set(key, payload, ex=QUERY_EMBED_REDIS_TTL)
+        except Exception as e:
+            logger.warning(f"⚠️ [QueryCache] Redis 저장 실패: {e}")
+
+    def embed_query(self, text: str) -> List[float]:
+        """설명:
+            캐시를 거쳐 쿼리 벡터 반환 (LRU → Redis → 모델 순).
+
+        Args:
+            text (str): 검색 쿼리.
+
+        Returns:
+            list: 쿼리 임베딩 벡터.
+
+        생성자: ejm
+        생성일자: 2026-10-17
+        """
+        cls = CachedQueryEmbeddings
+        normalized = normalize_query(text)
+        key = self._cache_key(normalized)
+
+        vector = self._lookup(key)
+        if vector is not None:
+            return vector
+
+        vector = self.embedder.embed_query(normalized)
+        with cls._lock:
+            cls._stats["misses"] += 1
+        self._remember(key, vector)
+        self._redis_set(key, vector)
+        return vector
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """문서 임베딩은 캐시 없이 그대로 위임"""
+        return self.embedder.embed_documents(texts)
+
+    def _lookup(self, key: str) -> Optional[List[float]]:
+        """LRU → Redis 순으로 조회 (적중 카운터 갱신)"""
+        cls = CachedQueryEmbeddings
+        with cls._lock:
+            vector = cls._lru.get(key)
+            if vector is not None:
+                cls._lru.move_to_end(key)
+                cls._stats["memory_hits"] += 1
+                return vector
+        vector = self._redis_get(key)
+        if vector is not None:
+            with cls._lock:
+                cls._stats["redis_hits"] += 1
+            self._remember(key, vector)
+        return vector
+
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """설명:
+            여러 쿼리 벡터를 한 번에 반환. 캐시 미스 항목만 모아 한 번의 배치 forward로 계산함.
+
+        Args:
+            texts (list): 검색 쿼리 목록.
+
+        Returns:
+            list: 입력 순서와 같은 쿼리 임베딩 벡터 목록.
+
+        생성자: ejm
+        생성일자: 2026-10-17
+        """
+        cls = CachedQueryEmbeddings
+        normalized = [normalize_query(t) for t in texts]
+        keys = [self._cache_key(n) for n in normalized]
+        vectors: List[Optional[List[float]]] = [self._lookup(k) for k in keys]
+
+        pending = {}
+        for key, norm, vector in zip(keys, normalized, vectors):
+            if vector is None and key not in pending:
+                pending[key] = norm
+
+        if pending:
+            # 쿼리 배치 API가 있으면 사용 (없으면 문서 배치 임베딩으로 대체)
+            embed_batch = getattr(self.embedder, "embed_queries", self.embedder.embed_documents)
+            computed = dict(zip(pending.keys(), embed_batch(list(pending.values()))))
+            with cls._lock:
+                cls._stats["misses"] += len(computed)
+            for key, vector in computed.items():
+                self._remember(key, vector)
+                self._redis_set(key, vector)
+            vectors = [v if v is not None else computed[k] for k, v in zip(keys, vectors)]
+        return vectors
+
+    def warm(self, queries: List[str]) -> int:
+        """설명:
+            고정 쿼리 목록을 미리 임베딩하여 캐시에 적재 (워커 시작 시 호출).
+
+        Args:
+            queries (list): 사전 적재할 쿼리 목록.
+
+        Returns:
+            int: 새로 계산한 쿼리 수.
+
+        생성자: ejm
+        생성일자: 2026-10-17
+        """
+        before = CachedQueryEmbeddings.get_stats()["misses"]
+        self.embed_queries([q for q in queries if normalize_query(q)])
+        return CachedQueryEmbeddings.get_stats()["misses"] - before
+
+    @classmethod
+    def get_stats(cls) -> dict:
+        """설명:
+            쿼리 캐시 적중/미스 카운터 반환.
+
+        Returns:
+            dict: memory_hits, redis_hits, misses, evictions, hit_rate, entries.
+
+        생성자: ejm
+        생성일자: 2026-10-17
+        """
+        with cls._lock:
+            stats = dict(cls._stats)
+            stats["entries"] = len(cls._lru)
+        total = stats["memory_hits"] + stats["redis_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["memory_hits"] + stats["redis_hits"]) / total, 3) if total else 0.0
+        return stats
@@ -0,0 +1,118 @@
+"""
+질문 생성 토큰 스트리밍 (Redis Stream 발행)
+EXAONE이 생성하는 부분 토큰을 면접(interview) 단위 Redis Stream에 발행하고,
+media-server가 이를 구독하여 /ws/{session_id} WebSocket으로 브라우저에 전달합니다.
+
+이벤트 형식 (Stream 필드):
+    type=start  stage=<stage>
+    type=token  token=<부분 텍스트>
+    type=done   text=<정제된 최종 질문> question_id=<id>
+    type=audio  seq=<순번> url=<세그먼트 WAV 경로>   (문장 파이프라인 TTS)
+    type=error
+"""
+import os
+import logging
+
+from .redis_client import get_redis_client
+
+logger = logging.getLogger("QuestionStream")
+
+# 스트리밍 모드 ON/OFF (기본 ON)
+QUESTION_STREAMING = os.getenv("QUESTION_STREAMING", "true").lower() == "true"
+
+# 스트림 키는 media-server와 반드시 동일해야 함
+STREAM_KEY_TEMPLATE = "interview:{interview_id}:question_stream"
+STREAM_MAXLEN = 2000   # 질문 1개당 수백 토큰 수준이므로 충분
+STREAM_TTL = 600       # 10분 (면접이 끝나면 자연 만료)
+
+
+def get_stream_key(interview_id: int) -> str:
+    """설명:
+        면접 ID에 해당하는 질문 토큰 스트림 키 반환.
+
+    Args:
+        interview_id (int): 면접 ID.
+
+    Returns:
+        str: Redis Stream 키.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    return STREAM_KEY_TEMPLATE.format(interview_id=interview_id)
+
+
+class QuestionStreamPublisher:
+    """설명:
+        한 번의 질문 생성 동안 토큰을 Redis Stream에 발행하는 퍼블리셔.
+        Redis가 없거나 발행에 실패해도 질문 생성 자체는 막지 않음 (best-effort).
+
+    Attributes:
+        interview_id (int): 대상 면접 ID.
+        key (str): Redis Stream 키.
+        enabled (bool): 발행 가능 여부.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+
+    def __init__(self, interview_id: int):
+        self.interview_id = interview_id
+        self.key = get_stream_key(interview_id)
+        self.client = get_redis_client() if QUESTION_STREAMING else None
+        self.enabled = self.client is not None
+        self.token_count = 0
+
+    def _publish(self, fields: dict):
+        """설명:
+            스트림에 이벤트 1건을 XADD (실패 시 이후 발행 중단).
+
+        Args:
+            fields (dict): 스트림 필드.
+
+        생성자: ejm
+        생성일자: 2026-10-17
+        """
+        if not self.enabled:
+            return
+        try:
+            self.client.xadd(self.key, fields, maxlen=STREAM_MAXLEN, approximate=True)
+        except Exception as e:
+            logger.warning(f"⚠️ [Stream] Interview {self.interview_id} 발행 실패, 스트리밍 중단: {e}")
+            self.enabled = False
+
+    def start(self, stage: str, lead: bool = False):
+        """질문 생성 시작 알림 (lead: 0번 인트로 TTS 세그먼트가 발행되었는지 → 브라우저 재생 시작 순번)"""
+        self._publish({"type": "start", "stage": stage or "", "lead": "1" if lead else "0"})
+        if self.enabled:
+            try:
+                self.client.expire(self.key, STREAM_TTL)
+            except Exception:
+                pass
+
+    def token(self, text: str):
+        """부분 토큰 발행"""
+        if not text:
+            return
+        self.token_count += 1
+        self._publish({"type": "token", "token": text})
+
+    def done(self, final_text: str, question_id=None, audio_seqs=None):
+        """정제가 끝난 최종 질문 발행 (브라우저는 스트리밍 텍스트를 이 값으로 교체)
+        audio_seqs: 최종 질문 음성을 이루는 TTS 세그먼트 순번 (비어 있으면 q_{id}.wav 전체 합성을 사용)"""
+        self._publish({
+            "type": "done",
+            "text": final_text or "",
+            "question_id": "" if question_id is None else str(question_id),
+            "audio_seqs": ",".join(str(s) for s in audio_seqs or [])
+        })
+        if self.token_count:
+            logger.info(f"📡 [Stream] Interview {self.interview_id}: {self.token_count} tokens published")
+
+    def audio_segment(self, seq: int, url: str):
+        """문장 단위 TTS 세그먼트 준비 알림 (seq 순서대로 재생 가능)"""
+        self._publish({"type": "audio", "seq": str(seq), "url": url})
+
+    def error(self):
+        """생성 실패 알림 (브라우저는 스트리밍 슬롯을 비움)"""
+        self._publish({"type": "error"})
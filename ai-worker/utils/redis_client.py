@@ -0,0 +1,90 @@
+"""
+AI-Worker 공용 Redis 클라이언트
+Celery 브로커와 별개로, 워커가 직접 Redis에 데이터를 쓰거나 읽어야 할 때 사용합니다.
+(질문 토큰 스트리밍, 캐시 등)
+"""
+import os
+import time
+import logging
+from typing import Optional
+
+logger = logging.getLogger("AI-Worker-Redis")
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379/0")
+# 연결 실패 후 재시도까지 대기 시간 (초). Redis 장애 중 매 호출이 연결 타임아웃(2초)을 다시 기다리지 않도록 함
+REDIS_RETRY_BACKOFF_SEC = float(os.getenv("REDIS_RETRY_BACKOFF_SEC", "30"))
+
+# 클라이언트 종류별 다음 연결 재시도 가능 시각 (time.monotonic 기준)
+_retry_after = {"text": 0.0, "binary": 0.0}
+
+_redis_client = None
+
+
+def get_redis_client() -> Optional["redis.Redis"]:
+    """설명:
+        문자열 응답(decode_responses=True)을 사용하는 Redis 클라이언트 싱글톤 반환.
+        연결 실패 시 None을 반환하여 호출 측에서 Redis 없이도 동작하도록 하며,
+        실패 후 REDIS_RETRY_BACKOFF_SEC 동안은 연결을 다시 시도하지 않고 바로 None을 반환함.
+
+    Returns:
+        redis.Redis | None: 연결된 클라이언트 또는 None.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    global _redis_client
+    if _redis_client is None:
+        if time.monotonic() < _retry_after["text"]:
+            return None
+        try:
+            import redis
+            client = redis.Redis.from_url(
+                REDIS_URL,
+                decode_responses=True,
+                socket_connect_timeout=2,
+                socket_timeout=2
+            )
+            client.ping()
+            _redis_client = client
+            logger.info(f"✅ Redis connected: {REDIS_URL}")
+        except Exception as e:
+            _retry_after["text"] = time.monotonic() + REDIS_RETRY_BACKOFF_SEC
+            logger.warning(f"⚠️ Redis 연결 실패 (Redis 의존 기능 {REDIS_RETRY_BACKOFF_SEC:.0f}초간 비활성화): {e}")
+            return None
+    return _redis_client
+
+
+_redis_binary_client = None
+
+
+def get_redis_binary_client() -> Optional["redis.Redis"]:
+    """설명:
+        바이트 응답(decode_responses=False)을 사용하는 Redis 클라이언트 싱글톤 반환.
+        STT용 raw PCM처럼 base64 없이 바이너리 값을 그대로 읽고 쓸 때 사용함.
+        연결 실패 시 get_redis_client와 같은 방식으로 REDIS_RETRY_BACKOFF_SEC 동안 재시도하지 않음.
+
+    Returns:
+        redis.Redis | None: 연결된 클라이언트 또는 None.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    global _redis_binary_client
+    if _redis_binary_client is None:
+        if time.monotonic() < _retry_after["binary"]:
+            return None
+        try:
+            import redis
+            client = redis.Redis.from_url(
+                REDIS_URL,
+                decode_responses=False,
+                socket_connect_timeout=2,
+                socket_timeout=5
+            )
+            client.ping()
+            _redis_binary_client = client
+        except Exception as e:
+            _retry_after["binary"] = time.monotonic() + REDIS_RETRY_BACKOFF_SEC
+            logger.warning(f"⚠️ Redis(binary) 연결 실패 ({REDIS_RETRY_BACKOFF_SEC:.0f}초 후 재시도): {e}")
+            return None
+    return _redis_binary_client
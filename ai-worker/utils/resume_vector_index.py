@@ -0,0 +1,227 @@
+"""
+면접 단위 이력서 벡터 인덱스 (프로세스 내 메모리)
+이력서 한 건의 청크는 수십 개 수준이므로, 면접 시작(preload_model) 시 resume_chunks에서 한 번 읽어
+연속된 float32 NumPy 행렬로 보관하고, top-k 검색은 행렬-벡터 곱 한 번으로 처리합니다.
+면접 진행 중 RAG 검색이 Postgres를 거치지 않으며, 면접이 끝나면 인덱스를 해제합니다.
+"""
+import os
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger("ResumeVectorIndex")
+
+# 동시에 메모리에 둘 최대 이력서 인덱스 수 (이력서당 수십 청크 x 1024 x 4B ≈ 수백 KB)
+RESUME_INDEX_MAX_ENTRIES = int(os.getenv("RESUME_INDEX_MAX_ENTRIES", "64"))
+
+
+class ResumeVectorIndex:
+    """설명:
+        이력서 한 건의 청크 벡터를 담은 인메모리 인덱스.
+        벡터는 L2 정규화되어 있으므로 내적 = 코사인 유사도, score(거리) = 1 - 유사도 (pgvector <=> 와 동일 척도).
+
+    Attributes:
+        resume_id (int): 이력서 ID.
+        matrix (np.ndarray): (청크 수, 차원) float32 C-contiguous 행렬.
+        texts (list): 청크 본문.
+        chunk_types (np.ndarray): 청크 분류 (필터용).
+        metas (list): 청크 메타데이터.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    __slots__ = ("resume_id", "matrix", "texts", "chunk_types", "metas")
+
+    def __init__(self, resume_id: int, vectors: List[Any], texts: List[str], chunk_types: List[str], metas: List[dict]):
+        self.resume_id = resume_id
+        matrix = np.ascontiguousarray(np.asarray(vectors, dtype=np.float32).reshape(len(texts), -1))
+        # 저장 시 정규화되어 있지만, 외부 유입 데이터 대비 한 번 더 정규화 (로드 시 1회)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self.matrix = matrix / norms
+        self.texts = texts
+        self.chunk_types = np.asarray(chunk_types, dtype=object)
+        self.metas = metas
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def _top_k(self, sims: np.ndarray, top_k: int, chunk_type: Optional[str]) -> List[Dict[str, Any]]:
+        """유사도 벡터에서 top-k 결과 구성 (argpartition 후 부분 정렬)"""
+        if chunk_type:
+            sims = np.where(self.chunk_types == chunk_type, sims, -np.inf)
+        k = min(top_k, len(sims))
+        if k <= 0:
+            return []
+        idx = np.argpartition(-sims, k - 1)[:k]
+        idx = idx[np.argsort(-sims[idx])]
+        results = []
+        for i in idx:
+            if not np.isfinite(sims[i]):
+                continue
+            results.append({
+                'text': self.texts[i],
+                'meta': {**(self.metas[i] or {}), 'resume_id': self.resume_id, 'chunk_type': self.chunk_types[i]},
+                'score': float(1.0 - sims[i])
+            })
+        return results
+
+    def search(self, query_vector: List[float], top_k: int = 10, chunk_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """설명:
+            단일 쿼리 top-k 검색 (행렬-벡터 곱 1회).
+
+        Args:
+            query_vector (list): 쿼리 임베딩 벡터.
+            top_k (int): 반환할 최대 청크 수.
+            chunk_type (str, optional): 청크 분류 필터.
+
+        Returns:
+            list: [{'text', 'meta', 'score'}] (score는 코사인 거리).
+
+        생성자: ejm
+        생성일자: 2026-10-17
+        """
+        q = np.asarray(query_vector, dtype=np.float32)
+        q = q / (np.linalg.norm(q) or 1.0)
+        return self._top_k(self.matrix @ q, top_k, chunk_type)
+
+    def search_many(self, query_vectors: List[List[float]], top_k: int = 2) -> List[List[Dict[str, Any]]]:
+        """설명:
+            여러 쿼리 top-k 검색 (행렬-행렬 곱 1회).
+
+        Args:
+            query_vectors (list): 쿼리 임베딩 벡터 목록.
+            top_k (int): 쿼리별 반환할 최대 청크 수.
+
+        Returns:
+            list: 입력 순서대로 쿼리별 결과 목록.
+
+        생성자: ejm
+        생성일자: 2026-10-17
+        """
+        if not query_vectors:
+            return []
+        Q = np.asarray(query_vectors, dtype=np.float32)
+        norms = np.linalg.norm(Q, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        sims = (Q / norms) @ self.matrix.T
+        return [self._top_k(row, top_k, None) for row in sims]
+
+
+# resume_id -> ResumeVectorIndex (LRU), interview_id -> resume_id
+_indexes: "OrderedDict[int, ResumeVectorIndex]" = OrderedDict()
+_interview_resume: Dict[int, int] = {}
+_lock = threading.Lock()
+
+
+def load_resume_index(resume_id: int, interview_id: Optional[int] = None) -> Optional[ResumeVectorIndex]:
+    """설명:
+        resume_chunks에서 이력서 청크를 한 번 읽어 인메모리 인덱스를 생성/등록 (이미 있으면 재사용).
+
+    Args:
+        resume_id (int): 이력서 ID.
+        interview_id (int, optional): 인덱스를 사용하는 면접 ID (종료 시 해제 기준).
+
+    Returns:
+        ResumeVectorIndex | None: 인덱스 (청크가 없으면 None).
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    if not resume_id:
+        return None
+    with _lock:
+        if interview_id is not None:
+            _interview_resume[interview_id] = resume_id
+        index = _indexes.get(resume_id)
+        if index is not None:
+            _indexes.move_to_end(resume_id)
+            return index
+
+    from sqlmodel import Session, select
+    from db import engine, ResumeChunk
+
+    with Session(engine) as session:
+        rows = session.exec(
+            select(ResumeChunk.content, ResumeChunk.chunk_type, ResumeChunk.chunk_metadata, ResumeChunk.embedding)
+            .where(ResumeChunk.resume_id == resume_id, ResumeChunk.embedding.isnot(None))
+            .order_by(ResumeChunk.chunk_index)
+        ).all()
+
+    if not rows:
+        logger.info(f"📭 [ResumeIndex] Resume {resume_id}: 청크 없음 → DB 검색 유지")
+        return None
+
+    index = ResumeVectorIndex(
+        resume_id,
+        vectors=[r[3] for r in rows],
+        texts=[r[0] for r in rows],
+        chunk_types=[r[1] for r in rows],
+        metas=[r[2] for r in rows],
+    )
+    with _lock:
+        _indexes[resume_id] = index
+        _indexes.move_to_end(resume_id)
+        while len(_indexes) > RESUME_INDEX_MAX_ENTRIES:
+            old_id, _ = _indexes.popitem(last=False)
+            for iid in [i for i, r in _interview_resume.items() if r == old_id]:
+                _interview_resume.pop(iid, None)
+    logger.info(f"📚 [ResumeIndex] Resume {resume_id}: {len(index)}개 청크 인덱스 적재 (shape={index.matrix.shape})")
+    return index
+
+
+def get_resume_index(resume_id: int) -> Optional[ResumeVectorIndex]:
+    """설명:
+        적재된 이력서 인덱스 조회 (없으면 None → 호출 측에서 DB 검색).
+
+    Args:
+        resume_id (int): 이력서 ID.
+
+    Returns:
+        ResumeVectorIndex | None: 인덱스.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    with _lock:
+        index = _indexes.get(resume_id)
+        if index is not None:
+            _indexes.move_to_end(resume_id)
+        return index
+
+
+def evict_resume_index(interview_id: int) -> bool:
+    """설명:
+        면접 종료 시 해당 면접의 이력서 인덱스 해제 (같은 이력서로 진행 중인 다른 면접이 있으면 유지).
+
+    Args:
+        interview_id (int): 면접 ID.
+
+    Returns:
+        bool: 인덱스를 실제로 해제했는지 여부.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    with _lock:
+        resume_id = _interview_resume.pop(interview_id, None)
+        if resume_id is None or resume_id in _interview_resume.values():
+            return False
+        return _indexes.pop(resume_id, None) is not None
+
+
+def invalidate_resume_index(resume_id: int):
+    """설명:
+        이력서 청크가 다시 저장되면 기존 인덱스를 버림 (다음 검색 시 재적재).
+
+    Args:
+        resume_id (int): 이력서 ID.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    with _lock:
+        _indexes.pop(resume_id, None)
@@ -0,0 +1,144 @@
+"""
+다음 질문 선행 생성(Speculative) 결과 저장소
+지원자가 현재 질문에 답하는 동안 미리 만들어 둔 다음 질문(텍스트/TTS)을 Redis에 보관하고,
+실제 답변(create_transcript → generate_next_question)이 도착하면 꺼내서 즉시 확정합니다.
+
+저장 형식 (JSON):
+    base_question_id : 선행 생성 당시 지원자가 답하고 있던 질문 ID (이 질문에 대한 답변일 때만 유효)
+    stage            : 선행 생성된 다음 스테이지 이름
+    kind             : "template" | "llm"
+    text             : 정제된 최종 질문
+    answer_sensitive : 답변 내용(무의미/부정 답변)에 따라 무효화되어야 하는지 여부
+    low_score_streak : 선행 생성 당시 연속 저점수 여부 (확정 시점과 다르면 무효화)
+"""
+import os
+import json
+import logging
+from typing import Optional
+
+from .redis_client import get_redis_client
+
+logger = logging.getLogger("SpeculativeStore")
+
+# 선행 생성 ON/OFF (기본 ON)
+SPECULATIVE_QUESTIONS = os.getenv("SPECULATIVE_QUESTIONS", "true").lower() == "true"
+
+SPECULATIVE_KEY_TEMPLATE = "interview:{interview_id}:speculative_question"
+SPECULATIVE_TTL = 1800  # 30분 (답변이 오지 않으면 자연 만료)
+SPECULATIVE_TTS_DIR = "/app/uploads/tts"
+
+
+def get_speculative_tts_path(interview_id: int, base_question_id: int) -> str:
+    """설명:
+        선행 합성된 TTS 파일 경로 반환 (확정 시 q_{id}.wav 로 이름 변경)
+
+    Args:
+        interview_id (int): 면접 ID.
+        base_question_id (int): 선행 생성 기준 질문 ID.
+
+    Returns:
+        str: WAV 파일 경로.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    return os.path.join(SPECULATIVE_TTS_DIR, f"spec_{interview_id}_{base_question_id}.wav")
+
+
+def save_speculative_question(interview_id: int, payload: dict) -> bool:
+    """설명:
+        선행 생성된 다음 질문을 저장 (면접당 1건, 기존 항목은 덮어씀)
+
+    Args:
+        interview_id (int): 면접 ID.
+        payload (dict): 저장할 선행 생성 결과 (모듈 docstring 참고).
+
+    Returns:
+        bool: 저장 성공 여부.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    client = get_redis_client()
+    if client is None:
+        return False
+    try:
+        key = SPECULATIVE_KEY_TEMPLATE.format(interview_id=interview_id)
+        client.set(key, json.dumps(payload, ensure_ascii=False), ex=SPECULATIVE_TTL)
+        return True
+    except Exception as e:
+        logger.warning(f"⚠️ [Speculative] Interview {interview_id} 저장 실패: {e}")
+        return False
+
+
+def pop_speculative_question(interview_id: int) -> Optional[dict]:
+    """설명:
+        선행 생성 결과를 꺼내고 삭제 (확정/폐기 여부와 무관하게 1회만 소비됨)
+
+    Args:
+        interview_id (int): 면접 ID.
+
+    Returns:
+        dict | None: 저장된 선행 생성 결과.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    client = get_redis_client()
+    if client is None:
+        return None
+    try:
+        key = SPECULATIVE_KEY_TEMPLATE.format(interview_id=interview_id)
+        pipe = client.pipeline()
+        pipe.get(key)
+        pipe.delete(key)
+        raw, _ = pipe.execute()
+        return json.loads(raw) if raw else None
+    except Exception as e:
+        logger.warning(f"⚠️ [Speculative] Interview {interview_id} 조회 실패: {e}")
+        return None
+
+
+def is_speculative_pending(interview_id: int, base_question_id: int) -> bool:
+    """설명:
+        해당 기준 질문의 선행 생성 결과가 아직 확정/폐기되지 않고 남아 있는지 확인.
+        늦게 끝난 선행 TTS 합성이 이미 소비된 항목의 파일을 남기지 않도록 저장 직후 확인하는 용도.
+
+    Args:
+        interview_id (int): 면접 ID.
+        base_question_id (int): 선행 생성 기준 질문 ID.
+
+    Returns:
+        bool: 아직 대기 중이면 True (Redis를 확인할 수 없으면 파일을 지우지 않도록 True).
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    client = get_redis_client()
+    if client is None:
+        return True
+    try:
+        raw = client.get(SPECULATIVE_KEY_TEMPLATE.format(interview_id=interview_id))
+        return bool(raw) and json.loads(raw).get("base_question_id") == base_question_id
+    except Exception as e:
+        logger.warning(f"⚠️ [Speculative] Interview {interview_id} 상태 확인 실패: {e}")
+        return True
+
+
+def discard_speculative_tts(interview_id: int, base_question_id: int):
+    """설명:
+        폐기된 선행 생성 결과의 TTS 파일 삭제
+
+    Args:
+        interview_id (int): 면접 ID.
+        base_question_id (int): 선행 생성 기준 질문 ID.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    path = get_speculative_tts_path(interview_id, base_question_id)
+    try:
+        if os.path.exists(path):
+            os.remove(path)
+    except OSError:
+        pass
@@ -0,0 +1,67 @@
+"""
+STT 추론 서버(stt_server.py) 클라이언트
+Celery STT 태스크가 모델을 직접 로드하지 않고, 상주 STT 서버에 raw PCM을 보내 결과만 받습니다.
+
+프로토콜 (TCP, 요청/응답 모두 길이 접두):
+    요청: [4바이트 big-endian 길이][16kHz mono int16 raw PCM]
+    응답: [4바이트 big-endian 길이][UTF-8 JSON {"text": ...} 또는 {"error": ...}]
+"""
+import os
+import json
+import socket
+import struct
+import logging
+from typing import Optional
+
+logger = logging.getLogger("STT-Client")
+
+# "host:port" (비어 있으면 STT 서버를 사용하지 않고 워커 내 모델로 처리)
+STT_SERVER_ADDR = os.getenv("STT_SERVER_ADDR", "")
+STT_SERVER_TIMEOUT = float(os.getenv("STT_SERVER_TIMEOUT", "120"))
+
+HEADER = struct.Struct(">I")
+
+
+def recv_exact(sock: socket.socket, size: int) -> bytes:
+    """소켓에서 정확히 size 바이트를 읽음 (연결이 끊기면 ConnectionError)"""
+    buf = bytearray(size)
+    view = memoryview(buf)
+    received = 0
+    while received < size:
+        n = sock.recv_into(view[received:], size - received)
+        if n == 0:
+            raise ConnectionError("server closed connection")
+        received += n
+    return bytes(buf)
+
+
+def transcribe_via_server(pcm: bytes) -> Optional[str]:
+    """설명:
+        STT 서버에 raw PCM을 보내 인식 텍스트를 받음.
+
+    Args:
+        pcm (bytes): 16kHz mono int16 raw PCM.
+
+    Returns:
+        str | None: 인식된 텍스트. 서버 미설정/연결 실패 시 None (호출 측에서 로컬 모델로 대체).
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    if not STT_SERVER_ADDR:
+        return None
+    host, _, port = STT_SERVER_ADDR.rpartition(":")
+    try:
+        with socket.create_connection((host, int(port)), timeout=STT_SERVER_TIMEOUT) as sock:
+            sock.sendall(HEADER.pack(len(pcm)))
+            sock.sendall(pcm)
+            (size,) = HEADER.unpack(recv_exact(sock, HEADER.size))
+            response = json.loads(recv_exact(sock, size).decode("utf-8"))
+    except Exception as e:
+        logger.warning(f"⚠️ STT 서버({STT_SERVER_ADDR}) 요청 실패, 로컬 모델로 대체: {e}")
+        return None
+
+    if "error" in response:
+        logger.warning(f"⚠️ STT 서버 오류: {response['error']}")
+        return None
+    return response.get("text", "")
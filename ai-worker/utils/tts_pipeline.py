@@ -0,0 +1,349 @@
+"""
+문장 단위 파이프라인 TTS
+EXAONE 스트리밍 출력을 문장 경계에서 잘라, 문장이 닫히는 즉시 TTS 세그먼트 합성을 요청합니다.
+LLM 생성 시간과 TTS 합성 시간이 직렬로 더해지던 구조를 겹치게(overlap) 만들어 턴 사이 공백을 줄입니다.
+
+흐름:
+    0. lead(text)   : LLM 호출 전에 이미 정해진 인트로 문장을 0번 세그먼트로 먼저 발행
+    1. feed(token)  : 토큰 누적 → 문장 완성 시 tasks.tts.synthesize_segment 발행 (cpu_queue)
+    2. flush()      : 생성 종료 후 남은 꼬리 문장 발행
+    3. finalize()   : 정제된 최종 질문과 세그먼트를 대조하여 일치하면 조립 계획을 Redis에 기록,
+                      불일치하면 False (전체 합성으로 폴백)
+    4. 세그먼트 태스크가 끝날 때마다 dispatch_assembly_if_ready()로 계획을 확인하여,
+       필요한 세그먼트가 모두 준비된 순간 tasks.tts.assemble_segments 를 1회 발행 (폴링 없음)
+    5. 조립/폴백 후 세그먼트 디렉터리는 tasks.tts.cleanup_segments 가 삭제
+"""
+import os
+import re
+import json
+import uuid
+import logging
+from typing import List, Optional, Tuple
+
+from celery import current_app
+
+from .redis_client import get_redis_client
+
+logger = logging.getLogger("TTS-Pipeline")
+
+# 문장 파이프라인 ON/OFF (기본 ON)
+TTS_SENTENCE_PIPELINE = os.getenv("TTS_SENTENCE_PIPELINE", "true").lower() == "true"
+
+TTS_DIR = "/app/uploads/tts"
+TTS_SEGMENT_DIR = os.path.join(TTS_DIR, "segments")
+
+# 조립 계획 (Redis): 세그먼트 태스크가 완료 시 확인
+ASSEMBLY_PLAN_KEY_TEMPLATE = "tts:segplan:{segment_key}"
+ASSEMBLY_LOCK_KEY_TEMPLATE = "tts:segassemble:{segment_key}"
+ASSEMBLY_PLAN_TTL = 600
+# 세그먼트 태스크가 유실되어도 질문 음성이 만들어지도록, 이 시간이 지나면 남은 세그먼트 없이 조립/폴백
+ASSEMBLE_DEADLINE_SEC = 40
+# 조립/폴백 후 세그먼트 디렉터리 보존 시간 (브라우저가 마지막 세그먼트 알림을 받고 내려받을 여유)
+SEGMENT_RETENTION_SEC = 60
+
+# 너무 짧은 조각("네." 등)은 다음 문장과 합쳐서 합성 (호출 오버헤드 및 부자연스러운 끊김 방지)
+MIN_SENTENCE_CHARS = 10
+
+# 문장 종결 부호(+닫는 따옴표) 뒤 공백, 또는 줄바꿈을 경계로 사용 ("3.5" 같은 소수점은 제외됨)
+_BOUNDARY_RE = re.compile(r'[\.\?\!…]+["\'”’\)]*\s+|\n+')
+
+# 문장 서두 레이블 (question_generator 정제 규칙과 동일한 계열)
+_LABEL_RE = re.compile(
+    r'^\**(지원자의?\s*답변\s*요약\s*(및\s*꼬리질문)?|심층\s*질문|핵심\s*요약|꼬리질문|요약|질문|[QA])\s*:\**\s*',
+    re.IGNORECASE
+)
+
+# question_generator [전역 정제]와 동일한 허용 문자 집합
+_DISALLOWED_RE = re.compile(r'[^ㄱ-ㅎㅏ-ㅣ가-힣a-zA-Z0-9\s,\?\.\!\(\)\~\"\'\:]')
+
+# 세그먼트-최종 질문 대조용 (발음에 영향을 주는 문자만 남김)
+_NORMALIZE_RE = re.compile(r'[^ㄱ-ㅎㅏ-ㅣ가-힣a-zA-Z0-9]')
+
+
+def segment_path(segment_key: str, seq: int, ext: str = "wav") -> str:
+    """세그먼트 파일 경로 (/app/uploads/tts/segments/{key}/{seq:03d}.{ext})"""
+    return os.path.join(TTS_SEGMENT_DIR, segment_key, f"{seq:03d}.{ext}")
+
+
+def schedule_segment_cleanup(segment_key: str, countdown: float = SEGMENT_RETENTION_SEC):
+    """세그먼트 디렉터리 삭제 태스크 예약 (실패해도 무시)"""
+    try:
+        current_app.send_task(
+            "tasks.tts.cleanup_segments", args=[segment_key], queue="cpu_queue", countdown=countdown
+        )
+    except Exception as e:
+        logger.warning(f"⚠️ [TTS Pipeline] 세그먼트 정리 예약 실패 ({segment_key}): {e}")
+
+
+def dispatch_assembly_if_ready(segment_key: str, deadline: bool = False) -> bool:
+    """설명:
+        조립 계획이 있고 필요한 세그먼트가 모두 끝났으면(성공 또는 .err) 조립 태스크를 발행.
+        세그먼트 태스크 완료 시점과 finalize() 양쪽에서 호출되며, 둘 다 자신의 결과를 먼저 기록한 뒤 확인하므로
+        마지막으로 끝난 쪽이 반드시 조립을 발행함 (중복 발행은 조립 태스크의 Redis 잠금으로 1회만 실행).
+
+    Args:
+        segment_key (str): 세그먼트 디렉터리 키.
+        deadline (bool): True면 준비 여부와 관계없이 지연 발행 (ASSEMBLE_DEADLINE_SEC 뒤 실행).
+
+    Returns:
+        bool: 조립 태스크를 발행했으면 True.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    client = get_redis_client()
+    raw = client.get(ASSEMBLY_PLAN_KEY_TEMPLATE.format(segment_key=segment_key)) if client else None
+    if not raw:
+        return False
+    plan = json.loads(raw)
+    seqs = plan["seqs"]
+
+    if not deadline:
+        done = [
+            os.path.exists(segment_path(segment_key, s)) or os.path.exists(segment_path(segment_key, s, "err"))
+            for s in seqs
+        ]
+        if not all(done):
+            return False
+
+    current_app.send_task(
+        "tasks.tts.assemble_segments",
+        args=[segment_key, seqs, plan["question_id"], plan["fallback_text"]],
+        queue="cpu_queue",
+        countdown=ASSEMBLE_DEADLINE_SEC if deadline else None,
+    )
+    return True
+
+
+def normalize_for_match(text: str) -> str:
+    """설명:
+        문장 부호/공백을 제거하여 세그먼트와 최종 질문을 비교할 수 있는 형태로 변환.
+
+    Args:
+        text (str): 원문.
+
+    Returns:
+        str: 정규화된 문자열.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    return _NORMALIZE_RE.sub('', text or '')
+
+
+def clean_sentence(sentence: str) -> str:
+    """설명:
+        스트리밍 원문 문장을 TTS에 넣을 수 있도록 가볍게 정제 (마크다운, 레이블, 특수문자 제거).
+
+    Args:
+        sentence (str): 원문 문장.
+
+    Returns:
+        str: 정제된 문장 (합성할 내용이 없으면 빈 문자열).
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    s = sentence.replace("**", "").strip()
+    s = re.sub(r'^#+\s*', '', s)
+    s = _LABEL_RE.sub('', s)
+    s = re.sub(r'^["\'“”\s]+|["\'“”\s]+$', '', s)
+    s = _DISALLOWED_RE.sub('', s)
+    return re.sub(r'\s+', ' ', s).strip()
+
+
+class SentenceTTSPipeline:
+    """설명:
+        한 번의 질문 생성 동안 스트리밍 토큰을 문장으로 묶어 세그먼트 TTS를 선행 발행하는 파이프라인.
+        question_id는 저장 후에야 정해지므로 세그먼트는 임시 키(segment_key) 디렉터리에 쌓이고,
+        finalize()에서 최종 질문 ID의 q_{id}.wav 로 조립됨.
+
+    Attributes:
+        interview_id (int): 대상 면접 ID.
+        segment_key (str): 세그먼트 저장 디렉터리 키.
+        enabled (bool): 파이프라인 동작 여부.
+        segments (list): 발행된 (seq, 정제 문장) 목록.
+        lead_text (str): 0번 세그먼트로 발행한 인트로 문장 (없으면 빈 문자열).
+        assembled_seqs (list): finalize()가 조립하기로 한 세그먼트 순번 (브라우저 재생 범위, 폴백이면 빈 목록).
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+
+    def __init__(self, interview_id: int, enabled: Optional[bool] = None):
+        self.interview_id = interview_id
+        self.segment_key = f"{interview_id}_{uuid.uuid4().hex[:12]}"
+        self.enabled = TTS_SENTENCE_PIPELINE if enabled is None else enabled
+        self.segments: List[Tuple[int, str]] = []
+        self.lead_text = ""
+        self.assembled_seqs: List[int] = []
+        self._buffer = ""
+        self._pending = ""
+
+    def _dispatch(self, seq: int, text: str):
+        """설명:
+            세그먼트 합성 태스크를 cpu_queue로 발행.
+
+        Args:
+            seq (int): 세그먼트 순번 (0은 인트로 문장 전용).
+            text (str): 합성할 문장.
+
+        생성자: ejm
+        생성일자: 2026-10-17
+        """
+        current_app.send_task(
+            "tasks.tts.synthesize_segment",
+            args=[text],
+            kwargs={"segment_key": self.segment_key, "seq": seq, "interview_id": self.interview_id},
+            queue="cpu_queue"
+        )
+
+    def _emit(self, sentence: str):
+        """정제 후 합성할 내용이 있으면 다음 순번으로 세그먼트 발행"""
+        text = clean_sentence(sentence)
+        if not normalize_for_match(text):
+            return
+        seq = len(self.segments) + 1
+        self.segments.append((seq, text))
+        try:
+            self._dispatch(seq, text)
+        except Exception as e:
+            logger.warning(f"⚠️ [TTS Pipeline] 세그먼트 발행 실패, 파이프라인 중단: {e}")
+            self.enabled = False
+
+    def lead(self, text: str):
+        """설명:
+            인트로 문장을 LLM 스트리밍 시작 전에 0번 세그먼트로 합성 발행 (첫 음성을 LLM 생성과 겹쳐 준비).
+
+        Args:
+            text (str): 인트로 문장 (템플릿 치환 완료).
+
+        생성자: ejm
+        생성일자: 2026-10-17
+        """
+        if not self.enabled or not text:
+            return
+        cleaned = clean_sentence(text)
+        if not normalize_for_match(cleaned):
+            return
+        try:
+            self._dispatch(0, cleaned)
+            self.lead_text = cleaned
+        except Exception as e:
+            logger.warning(f"⚠️ [TTS Pipeline] 인트로 세그먼트 발행 실패, 파이프라인 중단: {e}")
+            self.enabled = False
+
+    def discard(self):
+        """조립 없이 종료되는 경우(폴백/오류) 이미 합성된 세그먼트 디렉터리 정리 예약"""
+        if self.segments or self.lead_text:
+            schedule_segment_cleanup(self.segment_key)
+
+    def feed(self, token: str):
+        """설명:
+            스트리밍 토큰을 누적하고, 문장이 닫힐 때마다 세그먼트 합성을 발행.
+
+        Args:
+            token (str): LLM 부분 토큰.
+
+        생성자: ejm
+        생성일자: 2026-10-17
+        """
+        if not self.enabled or not token:
+            return
+        self._buffer += token
+        while True:
+            match = _BOUNDARY_RE.search(self._buffer)
+            if not match:
+                break
+            sentence = self._buffer[:match.end()].strip()
+            self._buffer = self._buffer[match.end():]
+            self._pending = f"{self._pending} {sentence}".strip() if self._pending else sentence
+            if len(normalize_for_match(self._pending)) >= MIN_SENTENCE_CHARS:
+                self._emit(self._pending)
+                self._pending = ""
+
+    def flush(self):
+        """생성 종료 후 남아 있는 꼬리 문장 발행"""
+        if not self.enabled:
+            return
+        tail = f"{self._pending} {self._buffer}".strip()
+        self._pending, self._buffer = "", ""
+        if tail:
+            self._emit(tail)
+
+    def _match_segments(self, body: str) -> Optional[List[int]]:
+        """설명:
+            정규화된 최종 질문 본문과 정확히 일치하는 연속 세그먼트 구간을 탐색.
+            정제 과정에서 앞뒤 메타 문장("이 질문은 ~")이 잘려 나간 경우도 구간으로 흡수됨.
+
+        Args:
+            body (str): 정규화된 최종 질문 본문.
+
+        Returns:
+            list | None: 사용할 세그먼트 순번 목록, 일치 구간이 없으면 None.
+
+        생성자: ejm
+        생성일자: 2026-10-17
+        """
+        norms = [normalize_for_match(text) for _, text in self.segments]
+        for i in range(len(norms)):
+            if not body.startswith(norms[i]):
+                continue
+            acc = ""
+            for j in range(i, len(norms)):
+                acc += norms[j]
+                if acc == body:
+                    return [seq for seq, _ in self.segments[i:j + 1]]
+                if not body.startswith(acc):
+                    break
+        return None
+
+    def finalize(self, final_text: str, question_id: int) -> bool:
+        """설명:
+            최종 질문과 선행 합성된 세그먼트를 대조하여, 일치하면 조립 계획을 Redis에 기록.
+            조립 태스크는 마지막 세그먼트가 끝나는 순간 발행되며, 세그먼트 태스크 유실에 대비해 기한부 조립도 예약함.
+
+        Args:
+            final_text (str): 정제되어 DB에 저장된 최종 질문 (TTS 대상 텍스트).
+            question_id (int): 저장된 질문 ID.
+
+        Returns:
+            bool: 세그먼트 조립을 예약했으면 True, 전체 합성으로 폴백해야 하면 False.
+
+        생성자: ejm
+        생성일자: 2026-10-17
+        """
+        self.assembled_seqs = []
+        client = get_redis_client()
+        if not self.enabled or not self.segments or not question_id or client is None:
+            self.discard()
+            return False
+
+        target = normalize_for_match(final_text)
+        lead = normalize_for_match(self.lead_text)
+        has_lead = bool(lead) and target.startswith(lead)
+        body = target[len(lead):] if has_lead else target
+        seqs = self._match_segments(body) if body else None
+        if seqs is None:
+            logger.info(f"🔁 [TTS Pipeline] Interview {self.interview_id}: 정제 후 텍스트가 세그먼트와 불일치 → 전체 합성으로 폴백")
+            self.discard()
+            return False
+        if has_lead:
+            seqs = [0] + seqs
+
+        try:
+            client.set(
+                ASSEMBLY_PLAN_KEY_TEMPLATE.format(segment_key=self.segment_key),
+                json.dumps({"seqs": seqs, "question_id": question_id, "fallback_text": final_text}, ensure_ascii=False),
+                ex=ASSEMBLY_PLAN_TTL,
+            )
+            dispatch_assembly_if_ready(self.segment_key)
+            dispatch_assembly_if_ready(self.segment_key, deadline=True)
+        except Exception as e:
+            logger.warning(f"⚠️ [TTS Pipeline] 조립 예약 실패 → 전체 합성으로 폴백: {e}")
+            self.discard()
+            return False
+
+        self.assembled_seqs = seqs
+        logger.info(f"🧩 [TTS Pipeline] Question {question_id}: {len(seqs)}개 세그먼트 조립 예약 (key={self.segment_key})")
+        return True
@@ -1,27 +1,30 @@
 """
 벡터 임베딩 생성 유틸리티
 Question 및 AnswerBank의 텍스트를 벡터로 변환
+(모델/접두어/정규화는 utils/embedding_runtime의 프로세스 전역 런타임을 그대로 사용)
 """
-from sentence_transformers import SentenceTransformer
-from typing import List
-import os
+from typing import List, Tuple
 import logging
 
+import numpy as np
+
+from .embedding_runtime import EMBEDDING_MODEL, EMBEDDING_DIM, get_embedding_runtime
+from .embedding_batcher import KIND_PASSAGE, KIND_QUERY
+from .embedding_cache import encode_cached
+
 logger = logging.getLogger("VectorUtils")
 
 # 한국어 특화 모델 (KURE-v1)
-# 질문/답변/문서 등 용도에 따라 prefix 필요 ("query: ", "passage: ")
-MODEL_NAME = "nlpai-lab/KURE-v1"
+MODEL_NAME = EMBEDDING_MODEL
 
 class EmbeddingGenerator:
     """설명:
-        싱글톤 패턴의 임베딩 생성기
+        싱글톤 패턴의 임베딩 생성기 (EmbeddingRuntime 위의 기존 호환 API)
 
         생성자: ejm
         생성일자: 2026-02-04
     """
     _instance = None
-    _model = None
     
     def __new__(cls):
         """설명:
@@ -40,26 +43,12 @@ class EmbeddingGenerator:
     
     def __init__(self):
         """설명:
-            KURE-v1 임베딩 모델을 로드하고 캐시 디렉토리를 설정.
-            싱글톤 패턴으로 한 번만 실행되며 모델이 이미 로드된 경우 초기화를 건너뜀.
+            프로세스 전역 임베딩 런타임에 연결 (모델은 런타임이 한 번만 로드).
 
         생성자: ejm
         생성일자: 2026-02-04
         """
-        if self._model is None:
-            cache_dir = "/app/models/embeddings" if os.path.exists("/app/models") else "./models/embeddings"
-            os.makedirs(cache_dir, exist_ok=True)
-            
-            logger.info(f"Loading embedding model: {MODEL_NAME}")
-            logger.info(f"📂 Cache path: {cache_dir}")
-            
-            # trust_remote_code=True 권장 (KURE 모델)
-            self._model = SentenceTransformer(
-                MODEL_NAME, 
-                trust_remote_code=True,
-                cache_folder=cache_dir
-            )
-            logger.info("✅ Embedding model loaded")
+        self.runtime = get_embedding_runtime()
     
     def encode(self, text: str, is_query: bool = True) -> List[float]:
         """설명:
@@ -67,7 +56,7 @@ class EmbeddingGenerator:
 
             Args:
             text: 변환할 텍스트
-            is_query: 쿼리(질문/검색어) 여부. True면 "query: ", False면 "passage: " 접두어 사용
+            is_query: 쿼리(질문/검색어) 여부. True면 query API, False면 passage API 사용
 
             Returns:
             
@@ -78,18 +67,15 @@ class EmbeddingGenerator:
         if not text or len(text.strip()) == 0:
             logger.warning("Empty text provided for encoding")
             # KURE-v1 output dimension typically 1024.
-            return [0.0] * 1024
+            return [0.0] * EMBEDDING_DIM
         
-        prefix = "query: " if is_query else "passage: "
-        # 텍스트 앞부분에 접두어 추가
-        full_text = prefix + text
-        
-        embedding = self._model.encode(full_text, convert_to_tensor=False)
-        return embedding.tolist()
+        if is_query:
+            return self.runtime.encode_query(text)
+        return self.runtime.encode_passage(text)
     
     def encode_passage(self, text: str) -> List[float]:
         """설명:
-            문서(Passage) 임베딩 생성 ("passage: " 접두어 사용)
+            문서(Passage) 임베딩 생성
 
             Args:
             text: 파라미터 설명.
@@ -104,7 +90,7 @@ class EmbeddingGenerator:
 
     def encode_query(self, text: str) -> List[float]:
         """설명:
-            질문(Query) 임베딩 생성 ("query: " 접두어 사용)
+            질문(Query) 임베딩 생성
 
             Args:
             text: 파라미터 설명.
@@ -134,11 +120,8 @@ class EmbeddingGenerator:
         if not texts:
             return []
         
-        prefix = "query: " if is_query else "passage: "
-        prefixed_texts = [prefix + t for t in texts]
-        
-        embeddings = self._model.encode(prefixed_texts, convert_to_tensor=False, show_progress_bar=True)
-        return [emb.tolist() for emb in embeddings]
+        # 질문 은행 일괄 임베딩/임포트: 이미 계산한 텍스트는 embedding_cache에서 재사용
+        return encode_cached(self.runtime, texts, KIND_QUERY if is_query else KIND_PASSAGE)
 
 
 # 전역 인스턴스
@@ -193,3 +176,41 @@ def generate_answer_embedding(answer_text: str) -> List[float]:
     generator = get_embedding_generator()
     # 답변은 검색 대상이므로 Passage로 취급
     return generator.encode_passage(answer_text)
+
+
+def find_stale_question_embeddings(sample_size: int = 16, min_similarity: float = 0.99) -> Tuple[int, int]:
+    """설명:
+        질문 은행(questions.embedding)의 저장 벡터가 현재 임베딩 정책(모델/접두어/정규화)으로 계산한 벡터와
+        일치하는지 표본 검사. 예전 "query: " 접두어 시절 벡터가 남아 있으면 검색 품질이 조용히 떨어지므로
+        워커 시작 시 확인하여 batch_embed_questions.py --reembed 실행이 필요한지 알림.
+
+    Args:
+        sample_size (int): 무작위로 다시 계산해 볼 질문 수.
+        min_similarity (float): 이보다 코사인 유사도가 낮으면 불일치로 판단.
+
+    Returns:
+        tuple: (불일치 건수, 검사 건수).
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    from sqlmodel import Session, select, func
+    from db import engine, Question
+
+    with Session(engine) as session:
+        rows = session.exec(
+            select(Question.content, Question.embedding)
+            .where(Question.embedding != None)
+            .order_by(func.random())
+            .limit(sample_size)
+        ).all()
+    if not rows:
+        return 0, 0
+
+    stored = np.asarray([list(embedding) for _, embedding in rows], dtype=np.float32)
+    current = np.asarray(get_embedding_runtime().encode_passages([content for content, _ in rows]), dtype=np.float32)
+    similarity = np.sum(stored * current, axis=1) / (
+        np.linalg.norm(stored, axis=1) * np.linalg.norm(current, axis=1) + 1e-12
+    )
+    return int(np.sum(similarity < min_similarity)), len(rows)
+
@@ -25,9 +25,13 @@ celery_app.conf.update(
         'tasks.question_generator.*': {'queue': 'gpu_queue'},
         'tasks.resume_pipeline.generate_embeddings': {'queue': 'gpu_queue'},
         'tasks.resume_embedding.*': {'queue': 'gpu_queue'},
-        'tasks.evaluator.generate_final_report': {'queue': 'gpu_queue'},
-        'tasks.evaluator.analyze_answer': {'queue': 'gpu_queue'},
-        'tasks.evaluator.finalize_report_task': {'queue': 'gpu_queue'},
+
+        # 리포트 평가 태스크 (EXAONE batch 클래스): 실시간 질문 생성과 같은 큐에서 앞을 막지 않도록 분리
+        'tasks.evaluator.generate_final_report': {'queue': 'report_queue'},
+        'tasks.evaluator.analyze_answer': {'queue': 'report_queue'},
+        'tasks.evaluator.analyze_answers_batch': {'queue': 'report_queue'},
+        'tasks.evaluator.summarize_report_section': {'queue': 'report_queue'},
+        'tasks.evaluator.finalize_report_task': {'queue': 'report_queue'},
         
         # CPU 사용 태스크 (파싱, STT, TTS, 비전)
         'tasks.resume_pipeline.parse_pdf': {'queue': 'cpu_queue'},
@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field, Column, Relationship
+from sqlalchemy import UniqueConstraint, Index
 from sqlalchemy.dialects.postgresql import JSONB, ARRAY, TEXT, JSON
 from pgvector.sqlalchemy import Vector  # pgvector 지원
 from typing import Optional, Dict, Any, List
@@ -150,6 +151,50 @@ class Resume(SQLModel, table=True):
     interviews: List["Interview"] = Relationship(back_populates="resume")
 
 
+class ResumeChunk(SQLModel, table=True):
+    """설명:
+        이력서 청크 테이블 (RAG 검색용).
+        resume_id/chunk_type을 정식 컬럼으로 두어 복합 B-tree로 필터링하고,
+        embedding에는 HNSW(코사인) 인덱스를 두어 이력서 수가 늘어나도 검색 지연이 일정하게 유지되도록 함
+
+        생성자: ejm
+        생성일자: 2026-10-17
+    """
+    __tablename__ = "resume_chunks"
+    __table_args__ = (
+        Index("ix_resume_chunks_resume_id_chunk_type", "resume_id", "chunk_type"),
+        Index(
+            "ix_resume_chunks_embedding_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+        ),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    resume_id: int = Field(foreign_key="resumes.id")
+    chunk_index: int = Field(default=0, description="청크 순서 (0부터 시작)")
+    chunk_type: str = Field(default="unknown", description="청크 분류 (profile, education, experience, project, narrative 등)")
+
+    # 청크 내용
+    content: str = Field(sa_column=Column(TEXT, nullable=False), description="잘게 쪼개진 이력서 텍스트 조각")
+    chunk_metadata: Optional[Dict[str, Any]] = Field(
+        default=None,
+        sa_column=Column("metadata", JSONB),
+        description="청크 출처 정보 (source, category, org 등)"
+    )
+
+    # 벡터 임베딩 (1024차원 - KURE-v1)
+    embedding: Any = Field(
+        default=None,
+        sa_column=Column(Vector(1024)),
+        description="청크의 벡터 임베딩 (유사도 검색용)"
+    )
+
+    created_at: datetime = Field(default_factory=datetime.now)
+
+
 class Company(SQLModel, table=True):
     """설명:
         회사 정보 테이블 (벡터 검색 지원)
@@ -335,6 +380,49 @@ class EvaluationReport(SQLModel, table=True):
     # Relationship
     interview: Interview = Relationship(back_populates="evaluation_report")
 
+class ReportSectionSummary(SQLModel, table=True):
+    """설명:
+        리포트 섹션(스테이지 묶음)별 사전 요약 테이블.
+        각 섹션이 끝나는 즉시 생성되어, 최종 리포트 단계에서는 이 요약들만 병합함 (Map-Reduce의 Map 결과 캐시)
+
+        생성자: ejm
+        생성일자: 2026-10-17
+    """
+    __tablename__ = "report_section_summaries"
+    __table_args__ = (UniqueConstraint("interview_id", "section", name="uq_report_section_summaries_interview_section"),)
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    interview_id: int = Field(foreign_key="interviews.id", index=True)
+    section: str  # technical, experience, problem_solving, communication 등
+
+    # 섹션 평가 결과
+    score: Optional[float] = None  # 0-100
+    summary: Optional[str] = None
+    strengths: Optional[List[str]] = Field(default=None, sa_column=Column(JSONB))
+    improvements: Optional[List[str]] = Field(default=None, sa_column=Column(JSONB))
+
+    # 요약에 사용된 답변 Transcript ID 목록 (답변이 추가/변경되면 재요약)
+    source_transcript_ids: Optional[List[int]] = Field(default=None, sa_column=Column(JSONB))
+
+    created_at: datetime = Field(default_factory=datetime.now)
+    updated_at: datetime = Field(default_factory=datetime.now)
+
+class EmbeddingCache(SQLModel, table=True):
+    """설명:
+        내용 주소 기반 임베딩 캐시 테이블.
+        (정규화된 텍스트의 SHA-256, 모델 식별자)를 키로 벡터를 보관하여, 여러 이력서에 반복되는 청크(자격증, 학교명 등)나
+        재처리·질문 은행 일괄 임포트 시 이미 계산한 텍스트는 다시 임베딩하지 않음
+
+        생성자: ejm
+        생성일자: 2026-10-17
+    """
+    __tablename__ = "embedding_cache"
+
+    content_hash: str = Field(primary_key=True, max_length=64, description="접두어 + 정규화 텍스트의 SHA-256 (hex)")
+    model_id: str = Field(primary_key=True, max_length=128, description="임베딩 모델 식별자 (백엔드 포함)")
+    embedding: Any = Field(sa_column=Column(Vector(1024), nullable=False))
+    created_at: datetime = Field(default_factory=datetime.now)
+
 class AnswerBank(SQLModel, table=True):
     """설명:
         우수 답변 은행 (벡터 검색용)
@@ -224,6 +224,7 @@ async def create_interview(
         try:
             celery_app.send_task(
                 "tasks.question_generation.preload_model",
+                kwargs={"interview_id": interview_id, "resume_id": new_interview.resume_id},
                 queue="gpu_queue"
             )
             logger.info("🔥 [Preload] EXAONE 모델 사전 로딩 태스크 발사 완료 (비동기)")
@@ -433,8 +434,17 @@ async def complete_interview(
     celery_app.send_task(
         "tasks.evaluator.generate_final_report",
         args=[interview_id],
-        queue='gpu_queue'
+        queue='report_queue'
     )
+    # [인메모리 RAG] 이력서 인덱스/Prefix KV 캐시는 GPU 워커 메모리에 있으므로 gpu_queue에서 해제
+    try:
+        celery_app.send_task(
+            "tasks.question_generation.release_interview",
+            args=[interview_id],
+            queue="gpu_queue"
+        )
+    except Exception as e:
+        logger.warning(f"[Release] 면접 자원 해제 태스크 전송 실패 (무시): {e}")
     return {"status": "completed", "interview_id": interview_id}
 
 # 행동 분석 점수 저장
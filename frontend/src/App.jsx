@@ -15,6 +15,11 @@ import {
   recognizeAudio
 } from './api/interview';
 
+// [문장 파이프라인 TTS] 세그먼트 음성 파일은 백엔드 정적 경로(/uploads/tts/segments)에서 제공됨
+const UPLOAD_BASE_URL = 'http://localhost:8000';
+// 다음 세그먼트가 이 시간 안에 도착하지 않으면 세그먼트 재생을 중단하고 q_{id}.wav 전체 재생으로 폴백
+const SEGMENT_STALL_MS = 15000;
+
 // Layout & UI
 import Header from './components/layout/Header';
 import MainPage from './pages/main/MainPage';
@@ -108,7 +113,6 @@ function App() {
   const videoRef = useRef(null);
   const pcRef = useRef(null);
   const wsRef = useRef(null);
-  const aiStreamWsRef = useRef(null); // AI 질문 스트리밍용 WS
   const currentIdxRef = useRef(0); // stale closure 방지용 : currentIdx 최신값 동기화
   const mediaRecorderRef = useRef(null);
   const isRecordingRef = useRef(false);
@@ -133,6 +137,11 @@ function App() {
   const nextQAbortControllerRef = useRef(null);
   const reportAbortControllerRef = useRef(null);
 
+  // [문장 파이프라인 TTS] 다음 질문의 문장 세그먼트를 생성 도중 도착 순번대로 이어 재생
+  // status: 'playing'(재생 중) / 'finished'(재생 완료 → q_{id}.wav 재생 생략) / 'failed'(q_{id}.wav 전체 재생)
+  const [pipelinedAudio, setPipelinedAudio] = useState({ questionId: null, status: null });
+  const segmentPlayerRef = useRef(null);
+
   useEffect(() => {
     isLoadingRef.current = isLoading;
   }, [isLoading]);
@@ -506,6 +515,16 @@ function App() {
         } else if (data.type === 'vision_analysis') {
           // [NEW] Update Vision Data State
           setVisionData(data.data);
+        } else if (
+          (data.type === 'ai_token' && data.token) ||
+          (data.type === 'ai_question_done' && data.text) ||
+          data.type === 'ai_question_start' ||
+          data.type === 'ai_question_error'
+        ) {
+          handleAiStreamMessage(data);
+          handleSegmentStreamMessage(data);
+        } else if (data.type === 'ai_audio_segment') {
+          handleAudioSegment(data);
         }
       } catch (err) {
         console.error('[WebSocket] Parse error:', err);
@@ -517,45 +536,160 @@ function App() {
   };
 
 
-  const setupAiStreamWebSocket = (interviewId) => {
-    // 백엔드 코어(8000)의 스트리밍 채널에 연결
-    const ws = new WebSocket(`ws://localhost:8000/interviews/ws/${interviewId}`);
-    aiStreamWsRef.current = ws;
+  // [질문 스트리밍] media-server(/ws)가 중계하는 AI 질문 생성 토큰 처리
+  // 생성되는 건 '다음 질문'이므로 현재 인덱스 + 1 자리에 스트리밍 (실제 질문은 폴링으로 교체됨)
+  const handleAiStreamMessage = (data) => {
+    setQuestions(prev => {
+      // currentIdxRef.current 로 항상 최신 인덱스 참조 (stale closure 방지)
+      const nextSlot = currentIdxRef.current + 1;
+      const slot = prev[nextSlot];
 
-    ws.onmessage = (event) => {
-      try {
-        const data = JSON.parse(event.data);
-        if (data.type === 'ai_token' && data.token) {
-          const token = data.token;
-
-          setQuestions(prev => {
-            // currentIdxRef.current 로 항상 최신 인덱스 참조 (stale closure 방지)
-            // 생성되는 건 '다음 질문'이므로 현재 인덱스 + 1 자리에 스트리밍
-            const nextSlot = currentIdxRef.current + 1;
-            const newQs = [...prev];
-
-            // 다음 질문 슬롯이 아직 없으면 스트리밍용 빈 객체 생성
-            if (!newQs[nextSlot]) {
-              newQs[nextSlot] = { id: `streaming_${Date.now()}`, content: '', isStreaming: true };
-            }
+      // 이미 서버에서 확정된 질문이 들어와 있으면 덮어쓰지 않음
+      if (slot && !slot.isStreaming) return prev;
 
-            // 토큰 이어붙이기
-            const existing = newQs[nextSlot].content || '';
-            newQs[nextSlot] = {
-              ...newQs[nextSlot],
-              content: existing + token,
-              isStreaming: true
-            };
-            return newQs;
-          });
-        }
-      } catch (err) {
-        console.error('[AI Stream WS] Parse error:', err);
+      const newQs = [...prev];
+      if (data.type === 'ai_question_error') {
+        if (slot) newQs.splice(nextSlot, 1);
+        return newQs;
+      }
+      if (data.type === 'ai_question_start') {
+        newQs[nextSlot] = { id: `streaming_${Date.now()}`, content: '', isStreaming: true };
+        return newQs;
+      }
+
+      // 다음 질문 슬롯이 아직 없으면 스트리밍용 빈 객체 생성
+      const base = slot || { id: `streaming_${Date.now()}`, content: '', isStreaming: true };
+      newQs[nextSlot] = {
+        ...base,
+        // 토큰 이어붙이기 / 완료 시 정제된 최종 질문으로 교체
+        content: data.type === 'ai_question_done' ? data.text : (base.content || '') + data.token,
+        isStreaming: true
+      };
+      return newQs;
+    });
+  };
+
+  // [문장 파이프라인 TTS] 세그먼트 플레이어 정지 및 내려받은 음성 해제
+  const stopSegmentPlayer = () => {
+    const player = segmentPlayerRef.current;
+    if (!player) return;
+    clearTimeout(player.stallTimer);
+    if (player.audio) {
+      player.audio.onended = null;
+      player.audio.onerror = null;
+      player.audio.pause();
+    }
+    Object.values(player.urls).forEach(url => URL.revokeObjectURL(url));
+    segmentPlayerRef.current = null;
+  };
+
+  const endSegmentPlayer = (status) => {
+    const player = segmentPlayerRef.current;
+    if (!player) return;
+    stopSegmentPlayer();
+    console.log(`🧩 [TTS Segment] playback ${status} (question: ${player.questionId})`);
+    setPipelinedAudio({ questionId: player.questionId, status });
+  };
+
+  // 다음 순번 세그먼트가 준비되어 있으면 재생
+  // done 이전에는 인트로(0번)만 재생: 이후 세그먼트는 후처리 전 LLM 문장이라 최종 질문에서 빠질 수 있으므로
+  // done의 조립 대상 순번(plan)에 포함된 것만 재생
+  const pumpSegmentPlayer = () => {
+    const player = segmentPlayerRef.current;
+    if (!player || player.audio) return;
+
+    let seq;
+    if (player.plan) {
+      const remaining = player.plan.filter(s => s >= player.nextSeq);
+      if (remaining.length === 0) {
+        endSegmentPlayer('finished');
+        return;
       }
+      seq = remaining[0];
+    } else if (player.nextSeq === 0) {
+      seq = 0;
+    } else {
+      return; // 인트로 재생 완료 → done(plan) 대기
+    }
+
+    clearTimeout(player.stallTimer);
+    const url = player.urls[seq];
+    if (!url) {
+      player.stallTimer = setTimeout(() => endSegmentPlayer('failed'), SEGMENT_STALL_MS);
+      return;
+    }
+
+    const audio = new Audio(url);
+    player.audio = audio;
+    audio.onended = () => {
+      if (segmentPlayerRef.current !== player) return;
+      player.audio = null;
+      player.nextSeq = seq + 1;
+      URL.revokeObjectURL(url);
+      delete player.urls[seq];
+      pumpSegmentPlayer();
     };
+    audio.onerror = () => {
+      if (segmentPlayerRef.current === player) endSegmentPlayer('failed');
+    };
+    audio.play().catch(e => {
+      console.error('[TTS Segment] play() 실패:', e);
+      if (segmentPlayerRef.current === player) endSegmentPlayer('failed');
+    });
+  };
+
+  // 질문 생성 시작/완료/실패에 맞춰 세그먼트 플레이어 상태 전환
+  const handleSegmentStreamMessage = (data) => {
+    if (data.type === 'ai_question_start') {
+      stopSegmentPlayer();
+      segmentPlayerRef.current = {
+        questionId: null,
+        plan: null,
+        nextSeq: data.lead ? 0 : 1, // 0번은 인트로 문장 세그먼트
+        urls: {},
+        audio: null,
+        stallTimer: null
+      };
+      return;
+    }
+    if (data.type === 'ai_question_error') {
+      stopSegmentPlayer();
+      return;
+    }
+    if (data.type !== 'ai_question_done') return;
+
+    const player = segmentPlayerRef.current;
+    const seqs = data.audio_seqs || [];
+    if (!player || seqs.length === 0) {
+      // 세그먼트가 최종 질문과 불일치(전체 합성 폴백)하면 세그먼트 재생을 멈추고 q_{id}.wav 를 기다림
+      stopSegmentPlayer();
+      setPipelinedAudio({ questionId: data.question_id, status: 'failed' });
+      return;
+    }
+    player.questionId = data.question_id;
+    player.plan = seqs;
+    // 최종 질문에서 빠진 문장의 세그먼트는 재생하지 않으므로 바로 해제
+    Object.keys(player.urls).map(Number).filter(s => !seqs.includes(s)).forEach(s => {
+      URL.revokeObjectURL(player.urls[s]);
+      delete player.urls[s];
+    });
+    setPipelinedAudio({ questionId: data.question_id, status: 'playing' });
+    pumpSegmentPlayer();
+  };
 
-    ws.onerror = (err) => console.error('[AI Stream WS] Error:', err);
-    ws.onclose = () => console.log('[AI Stream WS] Closed');
+  const handleAudioSegment = (data) => {
+    const player = segmentPlayerRef.current;
+    if (!player || !data.url) return;
+    // 조립이 끝나면 서버가 세그먼트 파일을 정리하므로, 재생 차례를 기다리지 않고 도착 즉시 내려받아 보관
+    fetch(`${UPLOAD_BASE_URL}${data.url}`)
+      .then(res => (res.ok ? res.blob() : Promise.reject(new Error(`HTTP ${res.status}`))))
+      .then(blob => {
+        if (segmentPlayerRef.current !== player) return;
+        if (player.plan && !player.plan.includes(data.seq)) return;
+        player.urls[data.seq] = URL.createObjectURL(blob);
+        pumpSegmentPlayer();
+      })
+      .catch(err => console.warn(`[TTS Segment] #${data.seq} 다운로드 실패:`, err));
   };
 
   const setupWebRTC = async (interviewId) => {
@@ -801,6 +935,7 @@ function App() {
 
     if (wsRef.current) { wsRef.current.close(); wsRef.current = null; }
     if (pcRef.current) { pcRef.current.close(); pcRef.current = null; }
+    stopSegmentPlayer();
 
     try {
       if (currentInterview) {
@@ -877,8 +1012,11 @@ function App() {
         console.log('[nextQuestion] Transcript already saved by Auto-Save, skipping manual save');
       }
 
+      // 스트리밍 중인 임시 슬롯은 아직 확정된 질문이 아니므로 제외
+      const committedQuestions = questions.filter(q => !q.isStreaming);
+
       // 1. 현재 로컬 배열에 다음 질문이 있는지 확인
-      if (currentIdx < questions.length - 1) {
+      if (currentIdx < committedQuestions.length - 1) {
         // [추가/수정] 미리 생성된 다음 질문(2번 등)의 최신 정보(특히 audio_url)를 서버에서 다시 가져옴
         const freshData = await getInterviewQuestions(interview.id);
         if (freshData.questions && freshData.questions.length > 0) {
@@ -923,11 +1061,11 @@ function App() {
               break;
             }
 
-            const lastQId = questions.length > 0 ? questions[questions.length - 1].id : null;
+            const lastQId = committedQuestions.length > 0 ? committedQuestions[committedQuestions.length - 1].id : null;
             const newLastQId = updatedQs.length > 0 ? updatedQs[updatedQs.length - 1].id : null;
 
-            if (updatedQs.length > questions.length || (newLastQId !== null && newLastQId !== lastQId)) {
-              const nextIdx = questions.length; // 새로 추가된 질문의 인덱스
+            if (updatedQs.length > committedQuestions.length || (newLastQId !== null && newLastQId !== lastQId)) {
+              const nextIdx = committedQuestions.length; // 새로 추가된 질문의 인덱스
 
               // [수정] audio_url 기다리지 않고 질문 텍스트 즉시 표시 (TTS는 백그라운드에서 생성됨)
               console.log("✅ [Next Question] New question ready. Showing immediately.");
@@ -1015,7 +1153,6 @@ function App() {
         try {
           await setupWebRTC(interview.id);
           setupWebSocket(interview.id);
-          setupAiStreamWebSocket(interview.id); // [NEW] AI 스트리밍 연결
         } catch (err) {
           console.error("Media init error:", err);
         }
@@ -1042,9 +1179,9 @@ function App() {
   useEffect(() => {
     return () => {
       if (wsRef.current) wsRef.current.close();
-      if (aiStreamWsRef.current) aiStreamWsRef.current.close(); // [NEW]
       if (pcRef.current) pcRef.current.close();
       if (mediaRecorderRef.current) mediaRecorderRef.current.stop();
+      stopSegmentPlayer();
     };
   }, []);
 
@@ -1235,6 +1372,11 @@ function App() {
             totalQuestions={15} // 시나리오 기준 15단계 고정
             question={questions[currentIdx]?.content}
             audioUrl={questions[currentIdx]?.audio_url}
+            pipelinedAudioStatus={
+              pipelinedAudio.questionId != null && pipelinedAudio.questionId === questions[currentIdx]?.id
+                ? pipelinedAudio.status
+                : null
+            }
             isRecording={isRecording}
             isMediaReady={isMediaReady}
             transcript={transcript}
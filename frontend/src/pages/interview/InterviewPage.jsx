@@ -7,6 +7,7 @@ const InterviewPage = ({
   totalQuestions,
   question,
   audioUrl,
+  pipelinedAudioStatus, // [신규] 문장 세그먼트 음성 재생 상태 (App이 재생, 'playing' | 'finished' | 'failed' | null)
   isRecording,
   transcript,
   setTranscript,
@@ -80,9 +81,18 @@ const InterviewPage = ({
     };
   }, [currentIdx]);
 
-  // audioUrl이 도착하면 재생
+  // [문장 파이프라인 TTS] 세그먼트 음성 재생이 끝났으면 전체 음성 재생 없이 타이머 시작
+  React.useEffect(() => {
+    if (pipelinedAudioStatus === 'finished') {
+      console.log("✅ [TTS] Pipelined segments ENDED → setTtsFinished(true)");
+      setTtsFinished(true);
+    }
+  }, [pipelinedAudioStatus, currentIdx]);
+
+  // audioUrl이 도착하면 재생 (세그먼트 음성이 재생 중이거나 이미 끝났으면 생략)
   React.useEffect(() => {
     if (!audioUrl || !question) return;
+    if (pipelinedAudioStatus === 'playing' || pipelinedAudioStatus === 'finished') return;
 
     const stripQuery = (url) => url?.split('?')[0] || '';
     const baseUrl = stripQuery(audioUrl);
@@ -129,7 +139,7 @@ const InterviewPage = ({
       console.error("❌ [TTS] play() 실패 → setTtsFinished(true)", e);
       setTtsFinished(true);
     });
-  }, [audioUrl, currentIdx, question]);
+  }, [audioUrl, currentIdx, question, pipelinedAudioStatus]);
 
   // 1분 카운트다운 — ttsFinished가 true일 때만 작동
   React.useEffect(() => {
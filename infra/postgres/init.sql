@@ -52,7 +52,8 @@ END $$;
 -- 7. 벡터 검색 인덱스 생성 (Phase 2)
 -- resume_chunks 테이블의 embedding 컬럼에 HNSW 인덱스 생성
 -- HNSW (Hierarchical Navigable Small World): 고속 근사 최근접 이웃 검색
-CREATE INDEX IF NOT EXISTS idx_resume_chunks_embedding 
+-- (인덱스 이름은 db_models.ResumeChunk / migrations/003 과 동일하게 유지)
+CREATE INDEX IF NOT EXISTS ix_resume_chunks_embedding_hnsw 
 ON resume_chunks 
 USING hnsw (embedding vector_cosine_ops)
 WITH (m = 16, ef_construction = 64);
@@ -61,8 +62,8 @@ WITH (m = 16, ef_construction = 64);
 CREATE INDEX IF NOT EXISTS idx_resumes_status 
 ON resumes(processing_status);
 
-CREATE INDEX IF NOT EXISTS idx_resume_chunks_resume_id 
-ON resume_chunks(resume_id);
+CREATE INDEX IF NOT EXISTS ix_resume_chunks_resume_id_chunk_type 
+ON resume_chunks(resume_id, chunk_type);
 
 -- 8. 통계 수집 (성능 최적화)
 ANALYZE users;
@@ -0,0 +1,30 @@
+-- ==========================================
+-- 리포트 섹션 사전 요약 테이블 추가 마이그레이션
+-- 실행 날짜: 2026-10-17
+-- ==========================================
+
+-- 1. 섹션(스테이지 묶음)별 요약 테이블 생성
+CREATE TABLE IF NOT EXISTS report_section_summaries (
+    id SERIAL PRIMARY KEY,
+    interview_id INTEGER NOT NULL REFERENCES interviews(id),
+    section VARCHAR NOT NULL,
+    score DOUBLE PRECISION,
+    summary TEXT,
+    strengths JSONB,
+    improvements JSONB,
+    source_transcript_ids JSONB,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT uq_report_section_summaries_interview_section UNIQUE (interview_id, section)
+);
+
+-- 2. 인덱스 생성
+CREATE INDEX IF NOT EXISTS ix_report_section_summaries_interview_id ON report_section_summaries(interview_id);
+
+-- ==========================================
+-- 마이그레이션 완료 메시지
+-- ==========================================
+DO $$
+BEGIN
+    RAISE NOTICE '✅ report_section_summaries 테이블 마이그레이션 완료';
+END $$;
@@ -0,0 +1,58 @@
+-- ==========================================
+-- 이력서 청크 테이블(resume_chunks) 추가 마이그레이션
+-- LangChain PGVector(langchain_pg_embedding, JSONB cmetadata 필터) → 정식 컬럼 + HNSW 인덱스
+-- 실행 날짜: 2026-10-17
+-- ==========================================
+
+-- 1. 이력서 청크 테이블 생성
+CREATE TABLE IF NOT EXISTS resume_chunks (
+    id SERIAL PRIMARY KEY,
+    resume_id INTEGER NOT NULL REFERENCES resumes(id),
+    chunk_index INTEGER NOT NULL DEFAULT 0,
+    chunk_type VARCHAR NOT NULL DEFAULT 'unknown',
+    content TEXT NOT NULL,
+    metadata JSONB,
+    embedding vector(1024),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 2. 인덱스 생성
+-- 면접 중 검색은 항상 resume_id (+ chunk_type) 필터가 붙으므로 복합 B-tree
+CREATE INDEX IF NOT EXISTS ix_resume_chunks_resume_id_chunk_type ON resume_chunks(resume_id, chunk_type);
+-- 코사인 거리 근사 최근접 이웃 검색 (HNSW)
+CREATE INDEX IF NOT EXISTS ix_resume_chunks_embedding_hnsw
+ON resume_chunks
+USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64);
+
+-- 3. 기존 LangChain PGVector 컬렉션 데이터 이관 (아직 이관되지 않은 이력서만)
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_tables WHERE tablename = 'langchain_pg_embedding')
+       AND EXISTS (SELECT 1 FROM pg_tables WHERE tablename = 'langchain_pg_collection') THEN
+        INSERT INTO resume_chunks (resume_id, chunk_index, chunk_type, content, metadata, embedding)
+        SELECT
+            (e.cmetadata->>'resume_id')::int,
+            (ROW_NUMBER() OVER (PARTITION BY e.cmetadata->>'resume_id' ORDER BY e.uuid) - 1)::int,
+            COALESCE(e.cmetadata->>'chunk_type', 'unknown'),
+            e.document,
+            e.cmetadata - 'resume_id' - 'chunk_type',
+            e.embedding::vector(1024)
+        FROM langchain_pg_embedding e
+        JOIN langchain_pg_collection c ON c.uuid = e.collection_id
+        WHERE c.name = 'resume_all_embeddings'
+          AND (e.cmetadata->>'resume_id') ~ '^[0-9]+$'
+          AND EXISTS (SELECT 1 FROM resumes r WHERE r.id = (e.cmetadata->>'resume_id')::int)
+          AND NOT EXISTS (SELECT 1 FROM resume_chunks rc WHERE rc.resume_id = (e.cmetadata->>'resume_id')::int);
+    END IF;
+END $$;
+
+ANALYZE resume_chunks;
+
+-- ==========================================
+-- 마이그레이션 완료 메시지
+-- ==========================================
+DO $$
+BEGIN
+    RAISE NOTICE '✅ resume_chunks 테이블 마이그레이션 완료';
+END $$;
@@ -0,0 +1,23 @@
+-- ==========================================
+-- 내용 주소 기반 임베딩 캐시 테이블(embedding_cache) 추가 마이그레이션
+-- (접두어 + 정규화 텍스트의 SHA-256, 모델 식별자) → KURE-v1 벡터
+-- 실행 날짜: 2026-10-17
+-- ==========================================
+
+-- 1. 임베딩 캐시 테이블 생성
+-- 조회는 항상 (content_hash, model_id) 동등 비교이므로 복합 기본키 B-tree만 사용 (벡터 인덱스 불필요)
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    content_hash VARCHAR(64) NOT NULL,
+    model_id VARCHAR(128) NOT NULL,
+    embedding vector(1024) NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT embedding_cache_pkey PRIMARY KEY (content_hash, model_id)
+);
+
+-- ==========================================
+-- 마이그레이션 완료 메시지
+-- ==========================================
+DO $$
+BEGIN
+    RAISE NOTICE '✅ embedding_cache 테이블 마이그레이션 완료';
+END $$;
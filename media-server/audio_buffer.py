@@ -0,0 +1,127 @@
+import av
+import numpy as np
+import logging
+
+logger = logging.getLogger("Audio-Buffer")
+
+# [설정] STT 입력 포맷: 16kHz mono int16, 윈도우 1개 = 20ms (WebRTC 프레임 단위와 동일)
+SAMPLE_RATE = 16000
+WINDOW_SAMPLES = 320
+
+
+class AudioRingBuffer:
+    """설명:
+        세션별로 미리 할당된 int16 PCM 링 버퍼.
+        WebRTC 오디오 프레임(48kHz stereo)은 도착 즉시 16kHz mono로 리샘플링되어 고정 크기 배열에 기록되고,
+        20ms 윈도우마다 RMS를 함께 계산해 둠. STT/자신감 분석은 윈도우 번호로 구간을 지정해 배열 뷰를 받아 감.
+        (av.AudioFrame 객체를 답변 내내 리스트로 들고 있지 않으므로 세션당 메모리가 고정됨)
+
+        윈도우 번호는 답변 시작(reset) 이후의 누적 번호이며, 링이 한 바퀴 돌면 가장 오래된 PCM부터 덮어씀.
+        스트리밍 STT는 세그먼트를 바로 보내므로 링은 아직 보내지 않은 구간만 담을 수 있으면 충분함.
+
+    Attributes:
+        capacity (int): PCM 링 용량 (윈도우 수).
+        rms_capacity (int): RMS 링 용량 (윈도우 수, 자신감 분석용으로 답변 전체를 담을 만큼).
+        written (int): 현재 답변에서 기록된 윈도우 수.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+
+    def __init__(self, capacity_windows: int, rms_capacity_windows: int):
+        self.capacity = capacity_windows
+        self.rms_capacity = rms_capacity_windows
+        self.pcm = np.zeros((capacity_windows, WINDOW_SAMPLES), dtype=np.int16)
+        self.rms = np.zeros(rms_capacity_windows, dtype=np.float32)
+        self._pending = np.zeros(WINDOW_SAMPLES, dtype=np.int16)  # 윈도우를 채우지 못한 나머지 샘플
+        self._pending_len = 0
+        self.written = 0
+        self._resampler = None
+        self.reset()
+
+    def reset(self):
+        """새 답변 시작: 기록 위치/나머지 샘플/리샘플러 상태 초기화 (버퍼는 재사용)"""
+        self.written = 0
+        self._pending_len = 0
+        self._resampler = av.AudioResampler(format='s16', layout='mono', rate=SAMPLE_RATE)
+
+    def _write_window(self, window: np.ndarray) -> float:
+        """윈도우 1개를 링에 기록하고 RMS(-1.0 ~ 1.0 기준) 반환"""
+        self.pcm[self.written % self.capacity] = window
+        samples = window.astype(np.float32) / 32768.0
+        rms = float(np.sqrt(np.mean(samples * samples)))
+        self.rms[self.written % self.rms_capacity] = rms
+        self.written += 1
+        return rms
+
+    def append(self, frame) -> list:
+        """설명:
+            WebRTC 오디오 프레임을 16kHz mono로 리샘플링하여 기록.
+
+        Args:
+            frame (av.AudioFrame): 수신된 오디오 프레임.
+
+        Returns:
+            list: 이번 호출로 완성된 윈도우들의 RMS 목록 (보통 1개, 리샘플러 지연에 따라 0~2개).
+
+        생성자: ejm
+        생성일자: 2026-10-17
+        """
+        rms_values = []
+        for out in self._resampler.resample(frame):
+            samples = out.to_ndarray().reshape(-1)
+            pos = 0
+            # 이전 호출의 나머지 샘플부터 채움
+            if self._pending_len:
+                take = min(WINDOW_SAMPLES - self._pending_len, len(samples))
+                self._pending[self._pending_len:self._pending_len + take] = samples[:take]
+                self._pending_len += take
+                pos = take
+                if self._pending_len == WINDOW_SAMPLES:
+                    rms_values.append(self._write_window(self._pending))
+                    self._pending_len = 0
+            while len(samples) - pos >= WINDOW_SAMPLES:
+                rms_values.append(self._write_window(samples[pos:pos + WINDOW_SAMPLES]))
+                pos += WINDOW_SAMPLES
+            rest = len(samples) - pos
+            if rest:
+                self._pending[:rest] = samples[pos:]
+                self._pending_len = rest
+        return rms_values
+
+    def oldest_window(self) -> int:
+        """PCM 링에 아직 남아 있는 가장 오래된 윈도우 번호"""
+        return max(0, self.written - self.capacity)
+
+    def _ring_slice(self, ring: np.ndarray, start: int, end: int) -> np.ndarray:
+        """[start, end) 윈도우 구간을 반환 (링 경계를 넘지 않으면 복사 없는 뷰, 넘으면 두 조각을 이어붙임)"""
+        size = len(ring)
+        start = max(start, end - size)
+        if end <= start:
+            return ring[:0]
+        a, b = start % size, end % size or size
+        if a < b:
+            return ring[a:b]
+        return np.concatenate([ring[a:], ring[:b]])
+
+    def windows(self, start: int, end: int) -> np.ndarray:
+        """설명:
+            [start, end) 윈도우 구간의 PCM을 (윈도우 수, 320) int16 배열로 반환.
+
+        Args:
+            start (int): 시작 윈도우 번호 (덮어써진 구간이면 남아 있는 부분부터).
+            end (int): 끝 윈도우 번호 (미포함).
+
+        Returns:
+            np.ndarray: PCM 뷰 (링 경계를 넘는 경우에만 복사본).
+
+        생성자: ejm
+        생성일자: 2026-10-17
+        """
+        if start < self.oldest_window():
+            logger.warning(f"⚠️ [AudioBuffer] 링 용량 초과: 윈도우 {self.oldest_window() - start}개 유실")
+        return self._ring_slice(self.pcm, start, end)
+
+    def rms_values(self, start: int = 0, end: int = None) -> np.ndarray:
+        """[start, end) 윈도우 구간의 RMS 배열 (기본: 현재 답변 전체, 용량 초과분은 최근 구간만)"""
+        return self._ring_slice(self.rms, start, self.written if end is None else end)
@@ -0,0 +1,178 @@
+import os
+import time
+
+# [설정] 노드 전체 비전 처리 예산 (초당 프레임, 모든 면접 세션 합산)
+VISION_NODE_FPS = float(os.getenv("VISION_NODE_FPS", "40"))
+# 세션별 샘플 간격 범위 (초): 움직임이 크면 MIN 쪽, 안정적이면 MAX 쪽으로 이동
+VISION_MIN_INTERVAL = float(os.getenv("VISION_MIN_INTERVAL", "0.2"))
+VISION_BASE_INTERVAL = float(os.getenv("VISION_BASE_INTERVAL", "0.4"))
+VISION_MAX_INTERVAL = float(os.getenv("VISION_MAX_INTERVAL", "1.2"))
+# 감지기 작업 해상도 (가로 픽셀). MediaPipe FaceLandmarker는 내부적으로 192~256px로 줄여 추론하므로
+# 원본 해상도를 그대로 넘기면 변환 비용만 늘어남
+VISION_WORK_WIDTH = int(os.getenv("VISION_WORK_WIDTH", "640"))
+
+# 연속 결과 간 변화량 기준 (점수 0~1 스케일, 자세 지표는 x10 보정)
+MOTION_HIGH = 0.08
+MOTION_LOW = 0.02
+
+
+class VisionFrameBudget:
+    """설명:
+        노드 전역 비전 프레임 예산 (토큰 버킷). 세션 수와 무관하게 초당 처리 프레임 수를 VISION_NODE_FPS 이하로 묶음.
+        이벤트 루프 스레드에서만 호출되므로 락을 사용하지 않음.
+
+    Attributes:
+        rate (float): 초당 허용 프레임 수.
+        active_sessions (int): 예산을 공유하는 세션 수.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+
+    def __init__(self, rate: float = VISION_NODE_FPS):
+        self.rate = rate
+        self.capacity = max(1.0, rate)  # 최대 1초 분량까지만 몰아서 사용 가능
+        self.tokens = self.capacity
+        self.updated_at = time.time()
+        self.active_sessions = 0
+        self.granted = 0
+        self.denied = 0
+
+    def try_acquire(self, now: float) -> bool:
+        """토큰 1개 사용 시도 (없으면 False → 해당 프레임은 건너뜀)"""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            self.granted += 1
+            return True
+        self.denied += 1
+        return False
+
+    def fair_interval(self) -> float:
+        """세션당 공정 배분 간격 (세션이 많을수록 길어짐)"""
+        return max(1, self.active_sessions) / self.rate
+
+    def stats(self) -> dict:
+        return {
+            "fps_budget": self.rate,
+            "active_sessions": self.active_sessions,
+            "granted": self.granted,
+            "denied": self.denied,
+        }
+
+
+vision_budget = VisionFrameBudget()
+
+
+class AdaptiveFrameSampler:
+    """설명:
+        세션별 적응형 프레임 샘플러.
+        - 연속 분석 결과의 변화량(미소/긴장도/자세 지표, 시선 라벨)이 크면 간격을 줄이고, 안정적이면 늘림
+        - 분석 대기열이 밀리면(서버 부하) 간격을 늘림
+        - 실제 간격은 노드 예산의 세션당 공정 배분 간격보다 짧아지지 않으며, 최종적으로 토큰 버킷을 통과해야 샘플링됨
+
+    Attributes:
+        interval (float): 현재 적응 간격 (초).
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+
+    def __init__(self, budget: VisionFrameBudget = vision_budget):
+        self.budget = budget
+        self.interval = VISION_BASE_INTERVAL
+        self.next_time = 0.0
+        self.last_result = None
+        self.closed = False
+        budget.active_sessions += 1
+
+    def effective_interval(self) -> float:
+        return min(VISION_MAX_INTERVAL, max(self.interval, self.budget.fair_interval()))
+
+    def should_sample(self, now: float) -> bool:
+        """설명:
+            이번 프레임을 분석할지 결정.
+
+        Args:
+            now (float): 현재 시각 (time.time()).
+
+        Returns:
+            bool: 분석 대상이면 True.
+
+        생성자: ejm
+        생성일자: 2026-10-17
+        """
+        if now < self.next_time:
+            return False
+        if not self.budget.try_acquire(now):
+            # 노드 예산 소진 → 공정 배분 간격의 절반 뒤 재시도
+            self.next_time = now + self.budget.fair_interval() / 2
+            return False
+        self.next_time = now + self.effective_interval()
+        return True
+
+    def note_backlog(self, pending: int):
+        """분석 대기열에 프레임이 밀려 있으면 간격을 늘림 (서버 부하 대응)"""
+        if pending > 0:
+            self.interval = min(VISION_MAX_INTERVAL, self.interval * 1.5)
+
+    def update(self, result):
+        """설명:
+            분석 결과로 다음 샘플 간격 조정.
+
+        Args:
+            result (dict | None): VisionAnalyzer.process_frame 결과.
+
+        생성자: ejm
+        생성일자: 2026-10-17
+        """
+        if not result or result.get("status") != "detected":
+            # 얼굴 미감지 → 재감지를 위해 기본 간격으로 복귀
+            self.interval = VISION_BASE_INTERVAL
+            self.last_result = None
+            return
+
+        prev = self.last_result
+        self.last_result = result
+        if prev is None:
+            return
+
+        cur_s, prev_s = result["scores"], prev["scores"]
+        motion = max(
+            abs(cur_s["smile"] - prev_s["smile"]),
+            abs(cur_s["anxiety"] - prev_s["anxiety"]),
+            abs(cur_s["pitch"] - prev_s["pitch"]) * 10,
+            abs(cur_s["eye_diff"] - prev_s["eye_diff"]) * 10,
+            abs(cur_s["tilt_diff"] - prev_s["tilt_diff"]) * 10,
+        )
+        if result["labels"]["gaze"] != prev["labels"]["gaze"] or motion > MOTION_HIGH:
+            self.interval = max(VISION_MIN_INTERVAL, self.interval * 0.5)
+        elif motion < MOTION_LOW:
+            self.interval = min(VISION_MAX_INTERVAL, self.interval * 1.25)
+
+    def close(self):
+        """세션 종료 시 예산 공유 세션 수에서 제외"""
+        if not self.closed:
+            self.closed = True
+            self.budget.active_sessions = max(0, self.budget.active_sessions - 1)
+
+
+def work_size(width: int, height: int) -> tuple:
+    """설명:
+        감지기 작업 해상도 계산 (가로 VISION_WORK_WIDTH 이하, 비율 유지, 짝수 크기).
+
+    Args:
+        width (int): 원본 가로.
+        height (int): 원본 세로.
+
+    Returns:
+        tuple: (가로, 세로).
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    if width <= VISION_WORK_WIDTH:
+        return width, height
+    scale = VISION_WORK_WIDTH / width
+    return VISION_WORK_WIDTH, max(2, int(height * scale) // 2 * 2)
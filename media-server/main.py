@@ -10,6 +10,7 @@ import logging
 
 import base64
 import time
+import uuid
 import cv2
 from typing import Dict, Set
 from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
@@ -18,7 +19,12 @@ from aiortc.contrib.media import MediaRelay
 from celery import Celery
 import av
 from vision_analyzer import VisionAnalyzer  # [NEW] MediaPipe Vision Analyzer
+from vision_pool import VisionWorkerPool, VISION_WORKERS  # [NEW] 비전 추론 프로세스 풀
+from frame_sampler import AdaptiveFrameSampler, vision_budget, work_size  # [NEW] 적응형 프레임 샘플링
+from vision_aggregate import VisionAggregate, RunningStat  # [NEW] 질문별 스트리밍 집계기
+from audio_buffer import AudioRingBuffer, WINDOW_SAMPLES  # [NEW] 세션별 int16 PCM 링 버퍼
 import io  # [NEW] 오디오 버퍼링용
+import wave
 
 # [Global Monkey Patch] Force UDP Port Range for Docker NAT Traversal
 # aiortc/aioice는 기본적으로 random port(0)를 사용하므로, 이를 Docker가 매핑한 50000-50050 범위로 강제함
@@ -94,6 +100,7 @@ relay = MediaRelay()
 
 # 비전 분석기 전역 변수
 analyzer_instance = None
+vision_pool = None  # [비전 워커 풀] VISION_WORKERS > 0 이면 startup 시 생성
 
 def get_analyzer():
     """설명:
@@ -136,6 +143,41 @@ except Exception as _re:
     redis_sync_client = None
     print(f"⚠️ [미디어 서버] Redis 클라이언트 초기화 실패 (심리적 안전장치 비활성화): {_re}", flush=True)
 
+# [질문 스트리밍] ai-worker가 Redis Stream에 발행하는 질문 토큰 구독용 비동기 클라이언트
+# XREAD BLOCK을 사용하므로 socket_timeout은 지정하지 않음 (블로킹 대기 중 타임아웃 방지)
+try:
+    import redis.asyncio as _redis_async_mod
+    redis_async_client = _redis_async_mod.Redis.from_url(redis_url, decode_responses=True, socket_connect_timeout=2)
+except Exception as _re:
+    redis_async_client = None
+    print(f"⚠️ [미디어 서버] Redis 비동기 클라이언트 초기화 실패 (질문 스트리밍 비활성화): {_re}", flush=True)
+
+# ai-worker utils/question_stream.py 의 STREAM_KEY_TEMPLATE 과 반드시 동일해야 함
+QUESTION_STREAM_KEY_TEMPLATE = "interview:{interview_id}:question_stream"
+
+# [스트리밍 STT] 녹음 중 VAD 경계(발화 후 침묵)마다 세그먼트를 먼저 STT로 보내고 종료 시 결과를 이어붙임
+# WebRTC 오디오 프레임 1개 = 20ms
+STREAMING_STT = os.getenv("STREAMING_STT", "true").lower() == "true"
+STT_SPEECH_RMS = 0.0056  # -45dB 이상이면 발화 프레임으로 간주 (자신감 분석 발화율 기준과 동일)
+STT_SEGMENT_MIN_FRAMES = int(float(os.getenv("STT_SEGMENT_MIN_SEC", "4")) * 50)       # 너무 짧은 세그먼트 방지
+STT_SEGMENT_SILENCE_FRAMES = int(float(os.getenv("STT_SEGMENT_SILENCE_MS", "500")) / 20)  # 경계로 볼 연속 무음 길이
+STT_SEGMENT_MAX_FRAMES = int(float(os.getenv("STT_SEGMENT_MAX_SEC", "15")) * 50)      # 침묵이 없어도 강제 분할
+
+# [VAD 게이팅] 인코딩 전에 앞/뒤 무음과 긴 멈춤을 잘라 Whisper 디코딩 길이를 줄임 (발화 앞뒤 패딩만 유지)
+STT_VAD_GATING = os.getenv("STT_VAD_GATING", "true").lower() == "true"
+STT_VAD_PAD_FRAMES = int(float(os.getenv("STT_VAD_PAD_MS", "300")) / 20)
+
+# [링 버퍼] 답변 최대 길이(6분)와 스트리밍 모드의 PCM 링 용량 (20ms 윈도우 단위)
+# 스트리밍 모드는 세그먼트를 바로 보내므로 미전송 구간(최대 STT_SEGMENT_MAX_SEC)만 담으면 됨
+STT_MAX_ANSWER_WINDOWS = 18000
+STT_RING_WINDOWS = int(float(os.getenv("STT_RING_SEC", "60")) * 50)
+
+# [바이너리 STT 전송] raw PCM(16kHz mono int16)을 Redis 바이트 키에 한 번 쓰고 Celery에는 키만 전달
+# ai-worker tasks/stt.py 의 STT_PCM_KEY_PREFIX 와 반드시 동일해야 함
+STT_BINARY_TRANSPORT = os.getenv("STT_BINARY_TRANSPORT", "true").lower() == "true"
+STT_PCM_KEY_PREFIX = "stt:pcm:"
+STT_PCM_TTL = 300  # 워커가 읽지 못하고 남은 오디오는 5분 뒤 자동 삭제
+
 # 3. 연결 관리 (세션별 WebSocket 및 PeerConnection 저장)
 active_websockets: Dict[str, WebSocket] = {}
 active_pcs: Dict[str, RTCPeerConnection] = {}
@@ -143,6 +185,7 @@ active_video_tracks: Dict[str, 'VideoAnalysisTrack'] = {}
 active_analysis_tasks: Dict[str, asyncio.Task] = {}  # 분석 루프 태스크 관리
 active_recording_flags: Dict[str, bool] = {}          # [핵심] 세션별 녹음 상태 플래그
 active_recording_indices: Dict[str, int] = {}         # [신규] 세션별 녹음 중인 질문 인덱스
+active_question_streams: Dict[str, asyncio.Task] = {}  # [신규] 세션별 질문 토큰 중계 태스크
 
 class VideoAnalysisTrack(MediaStreamTrack):
     """비디오 프레임을 추출하여 ai-worker에 감정 분석을 요청하는 트랙"""
@@ -158,37 +201,37 @@ class VideoAnalysisTrack(MediaStreamTrack):
         self.session_started_at = time.time()
         self.total_frames = 0
         
-        # 질문별 데이터 (전체 합산을 위해 리스트로 관리)
+        # 질문별 데이터 (고정 크기 누적 집계기, 끝난 질문은 리스트로 보관)
         self.questions_history = [] 
         self.current_q_index = 0
         self.current_q_data = self._get_empty_q_data()
         
-        # 전체 면접 통합 데이터 버켓 (모든 프레임 누적)
+        # 전체 면접 통합 집계 (모든 프레임 + 음성 자신감 점수 누적)
         self.session_all_data = self._get_empty_q_data()
         
-        # 오디오 자신감 점수 누적 리스트 (전체 + 질문별)
-        self.audio_scores = []
-        
         # [신규] 질문별 최종 점수 저장 (DB 저장용)
         self.questions_scores = []
         
         # 실시간 로그 쿨타임
         self.last_log_time = 0
         self.last_tracking_time = 0
+
+        # [적응형 샘플링] 움직임/부하/노드 예산에 따라 분석 간격 조절
+        self.sampler = AdaptiveFrameSampler()
+
+        # [비전 워커 풀] 세션 전용 제출 창구 (풀 미사용 시 None → 스레드 풀 폴백)
+        self.vision_session = vision_pool.open_session(session_id, self.handle_vision_result) if vision_pool else None
         
         print(f"✅ [{self.session_id}] VideoAnalysisTrack 초기화 완료", flush=True)
 
     def _get_empty_q_data(self):
-        """새 질문을 위한 빈 데이터 구조 생성"""
-        return {
-            "smile_scores": [],
-            "anxiety_scores": [],
-            "gaze_center_frames": 0,
-            "posture_stable_frames": 0,
-            "total_frames": 0,
-            "audio_scores": [],  # 질문별 음성 자신감 점수
-            "start_time": time.time()
-        }
+        """새 질문을 위한 빈 집계기 생성 (값 목록 대신 개수/합/Welford 분산만 누적)"""
+        return VisionAggregate()
+
+    def add_audio_score(self, confidence_score):
+        """답변 1건의 음성 자신감 점수를 현재 질문과 전체 집계에 누적"""
+        self.current_q_data.add_audio(confidence_score)
+        self.session_all_data.add_audio(confidence_score)
 
     def _score_question(self, q_data, q_index):
         """질문 하나의 영상+음성 통합 점수 계산 및 로그 출력"""
@@ -204,8 +247,7 @@ class VideoAnalysisTrack(MediaStreamTrack):
         val_emotion = v['score_emotion'] / 0.2 if v['score_emotion'] else 60.0
         
         # 음성 점수 (해당 질문 동안의 평균)
-        q_audio = q_data.get("audio_scores", [])
-        val_audio = sum(q_audio) / len(q_audio) if q_audio else 0
+        val_audio = q_data.audio.mean if q_data.audio.n else 0
         
         # 가중합 (시선30, 음성30, 미소15, 자세15, 정서10) - POC 가중치 준수
         q_total = (
@@ -235,7 +277,7 @@ class VideoAnalysisTrack(MediaStreamTrack):
 
     def switch_question(self, new_index):
         """질문이 바뀔 때 호출 (from WebSocket)"""
-        if self.current_q_data["total_frames"] > 0:
+        if self.current_q_data.total_frames > 0:
             self.questions_history.append(self.current_q_data)
             # 질문별 채점 수행
             score = self._score_question(self.current_q_data, self.current_q_index)
@@ -252,30 +294,27 @@ class VideoAnalysisTrack(MediaStreamTrack):
         print(f"➡️ [{self.session_id}] {new_index}번 질문으로 전환됨", flush=True)
 
     def _calculate_scores(self, q_list):
-        """질문 리스트(또는 단일 질문)로부터 POC 가중치 기반 점수 계산"""
+        """질문 집계 목록(또는 단일 집계)으로부터 POC 가중치 기반 점수 계산 (누적 카운터만 사용, 질문 수에만 비례)"""
         if not q_list: return None
-        if isinstance(q_list, dict): q_list = [q_list]
+        if isinstance(q_list, VisionAggregate): q_list = [q_list]
         
-        total_frames = sum(q["total_frames"] for q in q_list)
+        total_frames = sum(q.total_frames for q in q_list)
         if total_frames == 0: return None
 
-        all_smiles = []
-        all_anxiety = []
+        smile = RunningStat()
+        anxiety = RunningStat()
         total_gaze_center = 0
         total_posture_stable = 0
         
         for q in q_list:
-            all_smiles.extend(q["smile_scores"])
-            all_anxiety.extend(q["anxiety_scores"])
-            total_gaze_center += q["gaze_center_frames"]
-            total_posture_stable += q["posture_stable_frames"]
+            smile.merge(q.smile)
+            anxiety.merge(q.anxiety)
+            total_gaze_center += q.gaze_center_frames
+            total_posture_stable += q.posture_stable_frames
 
         # [계산] 평균값 산출 (0으로 나누기 방지)
-        if not all_smiles: avg_smile = 0.0
-        else: avg_smile = (sum(all_smiles) / len(all_smiles)) * 100  # 0~1 -> 0~100점 환산
-        
-        if not all_anxiety: avg_anxiety = 0.0
-        else: avg_anxiety = (sum(all_anxiety) / len(all_anxiety)) * 100 # 0~1 -> 0~100점 환산
+        avg_smile = smile.mean * 100 if smile.n else 0.0        # 0~1 -> 0~100점 환산
+        avg_anxiety = anxiety.mean * 100 if anxiety.n else 0.0  # 0~1 -> 0~100점 환산
         
         gaze_ratio = (total_gaze_center / total_frames) * 100
         posture_ratio = (total_posture_stable / total_frames) * 100
@@ -310,7 +349,8 @@ class VideoAnalysisTrack(MediaStreamTrack):
             "raw_smile": avg_smile, "raw_focus": gaze_ratio, # 디버깅용 원본값
             "score_conf": score_conf, "score_focus": score_focus,
             "score_posture": score_posture, "score_emotion": score_emotion,
-            "overall_score": overall_score, "total_frames": total_frames
+            "overall_score": overall_score, "total_frames": total_frames,
+            "smile_std": smile.std * 100, "anxiety_std": anxiety.std * 100  # 질문 내 변동폭 (Welford)
         }
 
     def _log_question_summary(self):
@@ -332,7 +372,7 @@ class VideoAnalysisTrack(MediaStreamTrack):
     def generate_final_report(self):
         """면접 종료 시 질문별 + 최종 종합 리포트 출력"""
         # 마지막 질문 채점 (아직 switch_question이 호출 안 됐으므로)
-        if self.current_q_data["total_frames"] > 0:
+        if self.current_q_data.total_frames > 0:
             self.questions_history.append(self.current_q_data)
             score = self._score_question(self.current_q_data, self.current_q_index)
             if score:
@@ -424,37 +464,56 @@ class VideoAnalysisTrack(MediaStreamTrack):
         
         print("=" * 60 + "\n")
 
+    def _to_work_image(self, frame):
+        """프레임을 감지기 작업 해상도의 BGR 배열로 변환 (축소와 색공간 변환을 swscale 한 번으로 처리)"""
+        width, height = work_size(frame.width, frame.height)
+        return frame.reformat(width=width, height=height, format="bgr24").to_ndarray()
+
+    def submit_frame(self, frame, timestamp_ms):
+        """샘플링된 프레임을 분석에 제출 (비전 워커 풀 사용 시 공유 메모리 + drop-oldest 대기열)"""
+        if self.vision_session is not None:
+            self.sampler.note_backlog(len(self.vision_session.pending))
+            self.vision_session.submit(self._to_work_image(frame), timestamp_ms)
+        else:
+            asyncio.create_task(self.process_vision(frame, timestamp_ms))
+
+    def close_vision(self):
+        """비전 워커 풀의 세션 자원(전용 분석기, 공유 메모리)과 노드 예산 몫 반납"""
+        self.sampler.close()
+        if self.vision_session is not None:
+            self.vision_session.close()
+            self.vision_session = None
+
     async def process_vision(self, frame, timestamp_ms):
+        """[폴백] 비전 워커 풀 미사용 시: 싱글톤 분석기를 기본 스레드 풀에서 실행"""
         if not self.analyzer.is_ready:
             print(f"⚠️ [{self.session_id}] 분석 엔진이 아직 준비되지 않았습니다.", flush=True)
             return
 
         try:
             # print(f"[{self.session_id}] Processing frame at {timestamp_ms}", flush=True)
-            img = frame.to_ndarray(format="bgr24")
+            img = self._to_work_image(frame)
             
             # [최적화] CPU 집약적 작업(MediaPipe)을 스레드 풀로 위임하여 이벤트 루프 차단 방지
             loop = asyncio.get_event_loop()
             result = await loop.run_in_executor(None, self.analyzer.process_frame, img, timestamp_ms)
-            
+            await self.handle_vision_result(result)
+        except Exception as e:
+            logger.error(f"Vision analysis failed: {e}")
+
+    async def handle_vision_result(self, result):
+        """분석 결과 1건을 질문/세션 데이터에 누적하고 실시간 로그·긴장도·WS 알림 처리"""
+        self.sampler.update(result)
+        try:
             if result and result.get("status") == "detected":
                 self.total_frames += 1
                 
                 # 1. 현재 질문 데이터 누적
                 q = self.current_q_data
-                q["total_frames"] += 1
-                q["smile_scores"].append(result["scores"]["smile"])
-                q["anxiety_scores"].append(result["scores"]["anxiety"])
-                if result["flags"]["is_center"]: q["gaze_center_frames"] += 1
-                if result["flags"]["is_stable"]: q["posture_stable_frames"] += 1
+                q.add_vision(result)
 
                 # 2. 전체 세션 데이터에도 통합 누적
-                a = self.session_all_data
-                a["total_frames"] += 1
-                a["smile_scores"].append(result["scores"]["smile"])
-                a["anxiety_scores"].append(result["scores"]["anxiety"])
-                if result["flags"]["is_center"]: a["gaze_center_frames"] += 1
-                if result["flags"]["is_stable"]: a["posture_stable_frames"] += 1
+                self.session_all_data.add_vision(result)
 
                 # [DEBUG] 첫 프레임 수신 시 로그
                 if self.total_frames == 1:
@@ -469,9 +528,8 @@ class VideoAnalysisTrack(MediaStreamTrack):
                     print(f"[{self.session_id}] {self.current_q_index}번 질문 | [실시간 종합점수: {s['overall_score']:5.1f}점] | 👀 시선: {labels['gaze']:8} | 👤 자세: {labels['posture']:12} | 😊 미소: {int(result['scores']['smile']*100):3}%", flush=True)
 
                     # [심리적 안전장치] 최근 30프레임 anxiety 평균 → Redis 저장
-                    _recent_anxiety = q["anxiety_scores"][-30:] if len(q["anxiety_scores"]) >= 30 else q["anxiety_scores"]
-                    if _recent_anxiety and redis_sync_client:
-                        _avg_anxiety = sum(_recent_anxiety) / len(_recent_anxiety)
+                    _avg_anxiety = q.recent_anxiety_mean()
+                    if _avg_anxiety is not None and redis_sync_client:
                         try:
                             redis_sync_client.setex(
                                 f"interview_{self.session_id}_anxiety",
@@ -536,11 +594,11 @@ async def start_video_analysis(track, session_id):
                 if frame_count == 1:
                     print(f"🎉 [{session_id}] 첫 영상 프레임 수신 성공!", flush=True)
 
-                # [성능 조절] 2.5FPS (0.4s 간격) — STT 우선권 확보
-                # (Vision 부하를 줄여 cpu_queue 및 event loop에서 STT가 더 빠르게 처리되도록)
-                if curr - analysis_track.last_tracking_time > 0.4:
+                # [성능 조절] 적응형 샘플링 — 기본 2.5FPS(0.4s), 움직임이 크면 빠르게/안정적이거나 부하 시 느리게
+                # 노드 전체 비전 FPS 예산(VISION_NODE_FPS)을 넘지 않도록 토큰 버킷으로 제한 (STT 우선권 확보)
+                if analysis_track.sampler.should_sample(curr):
                     analysis_track.last_tracking_time = curr
-                    asyncio.create_task(analysis_track.process_vision(frame, int(curr * 1000)))
+                    analysis_track.submit_frame(frame, int(curr * 1000))
 
             except asyncio.TimeoutError:
                 print(f"⏰ [{session_id}] 5초간 프레임 수신 없음 (타임아웃)", flush=True)
@@ -552,7 +610,8 @@ async def start_video_analysis(track, session_id):
         print(f"⚠️ [{session_id}] 영상 분석 루프 에러: {e}", flush=True)
     finally:
         print(f"🏁 [{session_id}] 영상 분석 루프 종료됨", flush=True)
-        if analysis_track.current_q_data["total_frames"] > 0:
+        analysis_track.close_vision()
+        if analysis_track.current_q_data.total_frames > 0:
             analysis_track._log_question_summary()
         analysis_track.generate_final_report()
         active_video_tracks.pop(session_id, None)
@@ -565,118 +624,243 @@ async def send_to_websocket(ws: WebSocket, data: dict):
     except Exception as e:
         logger.error(f"WebSocket 전송 실패: {e}")
 
+def _question_stream_to_ws_messages(events):
+    """설명:
+        Redis Stream 이벤트 묶음을 WebSocket 메시지 리스트로 변환.
+        한 번의 XREAD로 읽힌 연속 토큰은 하나의 ai_token 메시지로 합쳐 프레임 수를 줄임.
+
+    Args:
+        events (list): (stream_id, fields) 튜플 리스트.
+
+    Returns:
+        list: 전송할 WebSocket 메시지(dict) 리스트.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    messages = []
+    pending_tokens = []
+    for _, fields in events:
+        ev_type = fields.get("type")
+        if ev_type == "token":
+            pending_tokens.append(fields.get("token", ""))
+            continue
+        if pending_tokens:
+            messages.append({"type": "ai_token", "token": "".join(pending_tokens)})
+            pending_tokens = []
+        if ev_type == "start":
+            messages.append({
+                "type": "ai_question_start",
+                "stage": fields.get("stage", ""),
+                "lead": fields.get("lead") == "1"
+            })
+        elif ev_type == "done":
+            q_id = fields.get("question_id")
+            audio_seqs = fields.get("audio_seqs", "")
+            messages.append({
+                "type": "ai_question_done",
+                "text": fields.get("text", ""),
+                "question_id": int(q_id) if q_id else None,
+                "audio_seqs": [int(s) for s in audio_seqs.split(",") if s]
+            })
+        elif ev_type == "audio":
+            # [문장 파이프라인 TTS] 문장 단위 음성 세그먼트 준비 알림 (seq 순서대로 재생 가능)
+            messages.append({
+                "type": "ai_audio_segment",
+                "seq": int(fields.get("seq", 0)),
+                "url": fields.get("url", "")
+            })
+        elif ev_type == "error":
+            messages.append({"type": "ai_question_error"})
+    if pending_tokens:
+        messages.append({"type": "ai_token", "token": "".join(pending_tokens)})
+    return messages
+
+
+async def forward_question_stream(session_id: str):
+    """설명:
+        ai-worker가 발행한 질문 생성 토큰(Redis Stream)을 구독하여 /ws/{session_id}로 중계하는 루프.
+        WebSocket 연결 동안만 실행되며, 연결 시점 이후('$')의 이벤트만 전달함.
+
+    Args:
+        session_id (str): 면접 세션 ID (= interview_id).
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    if redis_async_client is None:
+        return
+    stream_key = QUESTION_STREAM_KEY_TEMPLATE.format(interview_id=session_id)
+    last_id = "$"
+    logger.info(f"[{session_id}] 📡 질문 토큰 스트림 구독 시작 ({stream_key})")
+    try:
+        while True:
+            try:
+                result = await redis_async_client.xread({stream_key: last_id}, block=5000, count=200)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"[{session_id}] ⚠️ 질문 스트림 읽기 실패 (1초 후 재시도): {e}")
+                await asyncio.sleep(1.0)
+                continue
+
+            if not result:
+                continue
+            for _, events in result:
+                if not events:
+                    continue
+                last_id = events[-1][0]
+                ws = active_websockets.get(session_id)
+                if not ws:
+                    continue
+                for message in _question_stream_to_ws_messages(events):
+                    await send_to_websocket(ws, message)
+    except asyncio.CancelledError:
+        logger.info(f"[{session_id}] 📡 질문 토큰 스트림 구독 종료")
+
+
 # ============== WebSocket 엔드포인트 ==============
 
 # STT 중계 함수 (Remote STT)
 # WebRTC 오디오 스트림 -> WAV 파일 변환 -> AI Worker로 전송
 async def start_remote_stt(track, session_id):
-    logger.info(f"[{session_id}] 🎙️ 원격 STT 시작 (Remote STT Started)")
+    logger.info(f"[{session_id}] 🎙️ 원격 STT 시작 (Remote STT Started, streaming={STREAMING_STT})")
     
     # ── 설계 원칙 ──────────────────────────────────────────────────────
-    # recording=True  동안: 프레임을 무제한 누적 (발화 손실 없음)
-    # recording=False 전환: 누적된 전체 오디오를 한 번에 STT 전송
-    # → 중간에 청크를 자르지 않아 VAD 앞부분 잘림 / 발화 손실 문제 없음
+    # recording=True  동안: 링 버퍼에 기록하면서, 발화 뒤 침묵(VAD 경계)이 오면
+    #                       그때까지의 세그먼트를 바로 STT로 보냄 (스트리밍 모드)
+    # recording=False 전환: 남은 꼬리 세그먼트만 보내고, 세그먼트 결과를 순서대로 이어붙여 전달
+    # → 침묵 구간에서만 자르므로 어절이 잘리지 않고, 답변 길이와 무관하게 종료 후 꼬리 구간만 기다림
+    # (STREAMING_STT=false 이면 기존처럼 전체 오디오를 한 번에 전송)
+    # 각 세그먼트는 전송 전에 VAD 게이팅으로 무음을 잘라내고, 발화가 없는 세그먼트는 보내지 않음
     # ──────────────────────────────────────────────────────────────────
-    accumulated_frames = []   # 현재 녹음 세션의 모든 프레임
+    # [링 버퍼] 세션별 고정 크기 int16 PCM 버퍼 (프레임은 도착 즉시 16kHz mono로 리샘플링되어 기록)
+    audio_buffer = AudioRingBuffer(
+        STT_RING_WINDOWS if STREAMING_STT else STT_MAX_ANSWER_WINDOWS, STT_MAX_ANSWER_WINDOWS
+    )
+    segment_start = 0         # 아직 STT로 보내지 않은 현재 세그먼트의 시작 윈도우 번호
+    segment_tasks = []        # 전송된 세그먼트 STT 태스크 (발화 순서 유지)
+    silence_run = 0           # 현재 세그먼트 끝의 연속 무음 윈도우 수
+    segment_has_speech = False
+    vad_total_frames = 0      # [VAD 게이팅] 현재 답변에서 게이트에 들어온 윈도우 수
+    vad_kept_frames = 0       # [VAD 게이팅] 그중 STT로 보낸 윈도우 수
     prev_recording = False    # 이전 루프에서의 recording 상태 (전환 감지용)
     last_sent_q_idx = -1      # [신규] 마지막으로 시작된 녹음의 인덱스
 
-    async def _send_stt(frames: list, sid: str, q_idx: int):
-        """누적된 프레임 전체를 WAV로 인코딩 후 STT 전송 (질문 인덱스 포함)"""
-        if not frames:
-            return
+    def _encode_wav(pcm: np.ndarray) -> bytes:
+        """int16 PCM을 16kHz mono WAV로 감싸기 (In-Memory, base64 대체 경로용)"""
+        output_buffer = io.BytesIO()
+        with wave.open(output_buffer, 'wb') as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(16000)
+            wav.writeframes(memoryview(pcm).cast('B'))
+        return output_buffer.getvalue()
+
+    async def _recognize_frames(pcm: np.ndarray, sid: str, seg_no: int) -> str:
+        """세그먼트 오디오(C-contiguous int16 PCM)를 STT로 보내고 결과 텍스트 반환 (실패 시 빈 문자열)
+        기본: raw PCM을 Redis 바이너리 키에 한 번 쓰고 Celery에는 키만 전달
+        Redis 사용 불가 시: 기존 WAV + base64 페이로드로 전송
+        """
+        if not pcm.size:
+            return ""
         try:
-            # 1. WAV 인코딩 (In-Memory)
-            output_buffer = io.BytesIO()
-            output_container = av.open(output_buffer, mode='w', format='wav')
-            output_stream = output_container.add_stream('pcm_s16le', rate=16000, layout='mono')
-            for f in frames:
-                for pkt in output_stream.encode(f):
-                    output_container.mux(pkt)
-            for pkt in output_stream.encode(None):
-                output_container.mux(pkt)
-            output_container.close()
-            wav_bytes = output_buffer.getvalue()
-            audio_b64 = base64.b64encode(wav_bytes).decode('utf-8')
-
-            duration_s = len(frames) * 20 / 1000
-            logger.info(f"[{sid}] 📤 STT 전송: {duration_s:.1f}초 오디오 ({len(wav_bytes)} bytes)")
-
-            # 2. 오디오 자신감 점수 계산 (dB 스케일 반영)
-            try:
-                import math
-                audio_np = np.frombuffer(wav_bytes[44:], dtype=np.int16).astype(np.float32) / 32768.0
-                if len(audio_np) > 0:
-                    # [최종 고도화] 윈도우 기반 정밀 에너지 측정 (Spike 및 Noise 내성 확보)
-                    # 20ms 단위로 에너지를 계산하고, 상위 에너지를 추출하여 평균 산출
-                    window_size = 320 # 20ms at 16kHz
-                    num_windows = len(audio_np) // window_size
-                    if num_windows > 0:
-                        # 윈도우별 RMS 계산
-                        windows = audio_np[:num_windows * window_size].reshape(-1, window_size)
-                        window_rms = np.sqrt(np.mean(windows**2, axis=1))
-                        
-                        # 상위 30%의 에너지만 추출 (실제 발화 구간의 대표 에너지)
-                        top_n = max(1, int(num_windows * 0.3))
-                        top_rms_values = np.sort(window_rms)[-top_n:]
-                        volume_rms = np.mean(top_rms_values)
-                        
-                        # 발화 비율 (실제 발화라 판단되는 윈도우 비율 : -45dB 이상)
-                        # -45dB = 10^(-45/20) approx 0.0056
-                        active_windows = np.count_nonzero(window_rms > 0.0056)
-                        speaking_ratio = active_windows / num_windows
-                    else:
-                        volume_rms = 1e-6
-                        speaking_ratio = 0.0
-
-                    # dB 계산
-                    volume_db = 20 * math.log10(max(volume_rms, 1e-6))
-                    
-                    # [변별력 강화] -50dB ~ -15dB 범위를 40 ~ 100점으로 매핑
-                    db_score = (volume_db + 50) / 35 * 60 + 40
-                    volume_score = min(max(db_score, 20), 100)
-                    
-                    # 발화 비율 점수 (0% -> 40점, 20% 이상 -> 100점)
-                    speed_score = min(max(speaking_ratio / 0.20 * 60 + 40, 40), 100)
-                    
-                    # 신뢰도 보정: 발화 비율이 너무 낮으면(잡음만 있는 경우) 볼륨 점수 강제 무효화
-                    if speaking_ratio < 0.02: # 2% 미만 발화
-                        volume_score = min(volume_score, 40)
-                        confidence_score = 30
-                    else:
-                        confidence_score = (volume_score * 0.6) + (speed_score * 0.4)
-                        
-                    feedback_msg = (
-                        "👍 아주 좋습니다! (자신감 넘침)" if confidence_score >= 80 else
-                        "👌 안정적입니다. (무난함)" if confidence_score >= 65 else
-                        "⚠️ 조금 더 크게 말씀해 보세요. (소극적)"
-                    )
-                    logger.info(
-                        f"[{sid}] 🎙️ 자신감 {confidence_score:4.1f}점 | {feedback_msg} "
-                        f"(🔊dB:{volume_db:.1f}, 🐇발화율:{speaking_ratio:.2f})"
+            loop = asyncio.get_running_loop()  # get_event_loop() deprecated in Python 3.10+
+            task = None
+            if STT_BINARY_TRANSPORT and redis_async_client is not None:
+                try:
+                    audio_key = f"{STT_PCM_KEY_PREFIX}{sid}:{uuid.uuid4().hex}"
+                    await redis_async_client.set(audio_key, memoryview(pcm).cast('B'), ex=STT_PCM_TTL)
+                    logger.info(f"[{sid}] 📤 STT 세그먼트 #{seg_no} 전송(PCM): {pcm.size / 16000:.1f}초 오디오 ({pcm.nbytes} bytes)")
+                    task = celery_app.send_task(
+                        "tasks.stt.recognize_pcm",
+                        args=[audio_key],
+                        queue="cpu_queue"
                     )
-                    if sid in active_video_tracks:
-                        active_video_tracks[sid].audio_scores.append(confidence_score)
-                        active_video_tracks[sid].current_q_data["audio_scores"].append(confidence_score)
-            except Exception as e:
-                logger.warning(f"[{sid}] 오디오 자신감 분석 실패 (무시됨): {e}")
+                except Exception as e:
+                    logger.warning(f"[{sid}] ⚠️ PCM 전송 실패, base64 방식으로 전환: {e}")
+
+            if task is None:
+                wav_bytes = _encode_wav(pcm)
+                audio_b64 = base64.b64encode(wav_bytes).decode('utf-8')
+                logger.info(f"[{sid}] 📤 STT 세그먼트 #{seg_no} 전송: {pcm.size / 16000:.1f}초 오디오 ({len(wav_bytes)} bytes)")
+                task = celery_app.send_task(
+                    "tasks.stt.recognize",
+                    args=[audio_b64],
+                    queue="cpu_queue"
+                )
+            result = await loop.run_in_executor(
+                None, lambda: task.get(timeout=120)  # 최대 2분 (긴 답변 대응)
+            )
+            return result.get("text", "").strip() if result else ""
+        except Exception as e:
+            logger.warning(f"[{sid}] ⚠️ STT 세그먼트 #{seg_no} 실패: {e}")
+            return ""
 
-            # 3. Celery STT 전송 → 결과 WebSocket 전달
+    def _analyze_confidence(rms_values: np.ndarray, sid: str):
+        """윈도우(20ms)별 RMS로 오디오 자신감 점수 계산 (dB 스케일 반영)"""
+        try:
+            import math
+            window_rms = np.asarray(rms_values, dtype=np.float32)
+            num_windows = len(window_rms)
+            if num_windows == 0:
+                return
+            # [최종 고도화] 윈도우 기반 정밀 에너지 측정 (Spike 및 Noise 내성 확보)
+            # 20ms(WebRTC 프레임 1개) 단위 에너지에서 상위 에너지를 추출하여 평균 산출
+            top_n = max(1, int(num_windows * 0.3))
+            top_rms_values = np.sort(window_rms)[-top_n:]
+            volume_rms = float(np.mean(top_rms_values))
+
+            # 발화 비율 (실제 발화라 판단되는 윈도우 비율 : -45dB 이상)
+            active_windows = np.count_nonzero(window_rms > STT_SPEECH_RMS)
+            speaking_ratio = active_windows / num_windows
+
+            # dB 계산
+            volume_db = 20 * math.log10(max(volume_rms, 1e-6))
+            
+            # [변별력 강화] -50dB ~ -15dB 범위를 40 ~ 100점으로 매핑
+            db_score = (volume_db + 50) / 35 * 60 + 40
+            volume_score = min(max(db_score, 20), 100)
+            
+            # 발화 비율 점수 (0% -> 40점, 20% 이상 -> 100점)
+            speed_score = min(max(speaking_ratio / 0.20 * 60 + 40, 40), 100)
+            
+            # 신뢰도 보정: 발화 비율이 너무 낮으면(잡음만 있는 경우) 볼륨 점수 강제 무효화
+            if speaking_ratio < 0.02: # 2% 미만 발화
+                volume_score = min(volume_score, 40)
+                confidence_score = 30
+            else:
+                confidence_score = (volume_score * 0.6) + (speed_score * 0.4)
+                
+            feedback_msg = (
+                "👍 아주 좋습니다! (자신감 넘침)" if confidence_score >= 80 else
+                "👌 안정적입니다. (무난함)" if confidence_score >= 65 else
+                "⚠️ 조금 더 크게 말씀해 보세요. (소극적)"
+            )
+            logger.info(
+                f"[{sid}] 🎙️ 자신감 {confidence_score:4.1f}점 | {feedback_msg} "
+                f"(🔊dB:{volume_db:.1f}, 🐇발화율:{speaking_ratio:.2f})"
+            )
+            if sid in active_video_tracks:
+                active_video_tracks[sid].add_audio_score(confidence_score)
+        except Exception as e:
+            logger.warning(f"[{sid}] 오디오 자신감 분석 실패 (무시됨): {e}")
+
+    async def _finish_answer(tasks: list, sid: str, q_idx: int):
+        """세그먼트 STT 결과를 발화 순서대로 이어붙여 WebSocket으로 전달 (질문 인덱스 포함)"""
+        if not tasks:
+            return
+        try:
             # [알림] STT 서버 처리가 시작되었음을 알림
             ws = active_websockets.get(sid)
             if ws:
                 await ws.send_json({"type": "stt_processing", "index": q_idx})
 
-            loop = asyncio.get_running_loop()  # get_event_loop() deprecated in Python 3.10+
-            task = celery_app.send_task(
-                "tasks.stt.recognize",
-                args=[audio_b64],
-                queue="cpu_queue"
-            )
-            result = await loop.run_in_executor(
-                None, lambda: task.get(timeout=120)  # 최대 2분 (긴 답변 대응)
-            )
-            stt_text = result.get("text", "").strip() if result else ""
+            started = time.time()
+            texts = await asyncio.gather(*tasks)
+            stt_text = " ".join(t for t in texts if t).strip()
+            logger.info(f"[{sid}] 🧩 STT 세그먼트 {len(tasks)}개 병합 (녹음 종료 후 {time.time() - started:.2f}초 대기)")
+
             if stt_text:
                 ws = active_websockets.get(sid)
                 if not ws:
@@ -704,36 +888,97 @@ async def start_remote_stt(track, session_id):
         except Exception as e:
             logger.warning(f"[{sid}] ⚠️ STT 전송 실패: {e}")
 
+    def _vad_gate(windows: np.ndarray, rms_values: np.ndarray) -> np.ndarray:
+        """에너지 기반 VAD 게이팅: 발화 윈도우 앞뒤 STT_VAD_PAD_FRAMES 이내만 남긴 연속 PCM 반환
+        → 앞/뒤 무음은 제거되고, 긴 멈춤은 최대 2 x 패딩 길이로 줄어듦 (발화가 없으면 빈 배열)
+        링 버퍼 뷰를 그대로 넘기지 않도록 항상 새 배열을 반환함 (이후 링이 덮어써도 안전)
+        """
+        if not STT_VAD_GATING:
+            return windows.reshape(-1).copy()
+        speech = rms_values > STT_SPEECH_RMS
+        if not speech.any():
+            return windows[:0].reshape(-1)
+        kernel = np.ones(2 * STT_VAD_PAD_FRAMES + 1, dtype=np.int32)
+        keep = np.convolve(speech.astype(np.int32), kernel, mode="same") > 0
+        return windows[keep].reshape(-1)
+
+    def _submit_segment(start: int, end: int, sid: str):
+        """링 버퍼의 [start, end) 윈도우 구간을 VAD 게이팅 후 STT 태스크로 전송 (무음 구간은 전송 생략)"""
+        nonlocal vad_total_frames, vad_kept_frames
+        start = max(start, audio_buffer.oldest_window())
+        if end <= start:
+            return
+        pcm = _vad_gate(audio_buffer.windows(start, end), audio_buffer.rms_values(start, end))
+        vad_total_frames += end - start
+        vad_kept_frames += pcm.size // WINDOW_SAMPLES
+        if pcm.size:
+            segment_tasks.append(asyncio.create_task(_recognize_frames(pcm, sid, len(segment_tasks) + 1)))
+
+    def _flush_answer(sid: str, q_idx: int):
+        """녹음 종료/스트림 종료 시 꼬리 세그먼트를 보내고 결과 병합 태스크 시작"""
+        nonlocal segment_start, segment_tasks, silence_run, segment_has_speech
+        nonlocal vad_total_frames, vad_kept_frames
+        # 스트리밍 모드는 꼬리 세그먼트만, 전체 전송 모드는 답변 전체를 하나의 세그먼트로 전송
+        _submit_segment(segment_start if STREAMING_STT else 0, audio_buffer.written, sid)
+        if vad_total_frames:
+            trimmed_ratio = 1 - vad_kept_frames / vad_total_frames
+            logger.info(
+                f"[{sid}] ✂️ VAD 게이팅: {vad_total_frames * 20 / 1000:.1f}초 중 "
+                f"{(vad_total_frames - vad_kept_frames) * 20 / 1000:.1f}초 제거 (제거 비율 {trimmed_ratio:.0%})"
+            )
+        # 자신감 분석은 링 버퍼의 RMS 뷰로 바로 수행 (버퍼 재사용 전에 완료)
+        if segment_tasks:
+            _analyze_confidence(audio_buffer.rms_values(), sid)
+        asyncio.create_task(_finish_answer(segment_tasks, sid, q_idx))
+        audio_buffer.reset()
+        segment_tasks = []
+        segment_start, silence_run, segment_has_speech = 0, 0, False
+        vad_total_frames, vad_kept_frames = 0, 0
+
     try:
         while True:
             frame = await track.recv()
             is_recording = active_recording_flags.get(session_id, False)
 
             if is_recording:
-                # 발화 중 → 프레임 누적 (최대 18,000프레임=6분, 메모리 보호)
+                # 발화 중 → 링 버퍼에 기록 (답변당 최대 18,000윈도우=6분)
                 if not prev_recording:
                     last_sent_q_idx = active_recording_indices.get(session_id, -1)
                     logger.info(f"[{session_id}] 🔴 녹음 시작 (Index:{last_sent_q_idx}) — 프레임 누적 시작")
                 
-                if len(accumulated_frames) < 18000:
-                    accumulated_frames.append(frame)
+                if audio_buffer.written < STT_MAX_ANSWER_WINDOWS:
+                    # 링 버퍼에 16kHz mono로 기록 (완성된 20ms 윈도우마다 RMS 반환)
+                    for rms in audio_buffer.append(frame):
+                        if not STREAMING_STT:
+                            continue
+                        if rms > STT_SPEECH_RMS:
+                            silence_run = 0
+                            segment_has_speech = True
+                        else:
+                            silence_run += 1
+                        # VAD 경계: 최소 길이 이상 발화 후 침묵이 이어지면 세그먼트 전송 (너무 길면 강제 전송)
+                        seg_len = audio_buffer.written - segment_start
+                        if (segment_has_speech and seg_len >= STT_SEGMENT_MIN_FRAMES and silence_run >= STT_SEGMENT_SILENCE_FRAMES) \
+                                or seg_len >= STT_SEGMENT_MAX_FRAMES:
+                            _submit_segment(segment_start, audio_buffer.written, session_id)
+                            segment_start = audio_buffer.written
+                            silence_run = 0
+                            segment_has_speech = False
                 prev_recording = True
 
             else:
                 if prev_recording:
-                    # recording True → False 전환: 전체 누적 오디오를 STT로 전송
-                    logger.info(f"[{session_id}] ⬛ 녹음 종료 — {len(accumulated_frames)}프레임({len(accumulated_frames)*20//1000}초) STT 전송 (Index:{last_sent_q_idx})")
-                    frames_to_send = accumulated_frames[:]
-                    accumulated_frames = []
-                    asyncio.create_task(_send_stt(frames_to_send, session_id, last_sent_q_idx))
+                    # recording True → False 전환: 남은 오디오를 STT로 전송하고 결과 병합
+                    logger.info(f"[{session_id}] ⬛ 녹음 종료 — {audio_buffer.written}프레임({audio_buffer.written*20//1000}초), 선행 세그먼트 {len(segment_tasks)}개 (Index:{last_sent_q_idx})")
+                    _flush_answer(session_id, last_sent_q_idx)
                 prev_recording = False
 
     except Exception as e:
         logger.info(f"[{session_id}] STT 스트림 종료: {e}")
         # 스트림 종료 시 누적된 프레임이 있으면 마지막으로 전송 (인덱스 포함)
-        if accumulated_frames:
-            logger.info(f"[{session_id}] 스트림 종료 전 {len(accumulated_frames)}프레임 최종 전송 (Index:{last_sent_q_idx})")
-            asyncio.create_task(_send_stt(accumulated_frames[:], session_id, last_sent_q_idx))
+        if audio_buffer.written:
+            logger.info(f"[{session_id}] 스트림 종료 전 {audio_buffer.written}프레임 최종 전송 (Index:{last_sent_q_idx})")
+            _flush_answer(session_id, last_sent_q_idx)
     finally:
         logger.info(f"[{session_id}] STT 리소스 정리")
         active_recording_flags.pop(session_id, None)
@@ -745,6 +990,12 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
     await websocket.accept()
     active_websockets[session_id] = websocket
     logger.info(f"[{session_id}] ✅ WebSocket 연결 성공")
+
+    # [질문 스트리밍] 이전 연결의 중계 태스크가 남아 있으면 정리 후 새로 시작
+    prev_stream_task = active_question_streams.pop(session_id, None)
+    if prev_stream_task and not prev_stream_task.done():
+        prev_stream_task.cancel()
+    active_question_streams[session_id] = asyncio.create_task(forward_question_stream(session_id))
     
     try:
         while True:
@@ -777,6 +1028,10 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
     except Exception as e:
         logger.error(f"[{session_id}] WebSocket 에러: {e}")
     finally:
+        stream_task = active_question_streams.get(session_id)
+        if stream_task and active_websockets.get(session_id) is websocket:
+            active_question_streams.pop(session_id, None)
+            stream_task.cancel()
         if session_id in active_websockets:
             del active_websockets[session_id]
         if session_id in active_pcs:
@@ -919,15 +1174,31 @@ async def stt_recognize(file: UploadFile = File(...)):
 @app.on_event("startup")
 async def on_startup():
     print("🚀 [Media-Server] FastAPI startup complete. Port 8080 is now open.", flush=True)
-    # 서버 기동 직후 백그라운드에서 모델 로딩 시작 (비블로킹)
+    # [비전 워커 풀] MediaPipe 추론을 별도 프로세스로 분리 (세션별 워커 고정 배정)
+    global vision_pool
+    if VISION_WORKERS > 0:
+        try:
+            vision_pool = VisionWorkerPool(VISION_WORKERS)
+            vision_pool.start(asyncio.get_running_loop())
+        except Exception as e:
+            vision_pool = None
+            print(f"⚠️ [미디어 서버] 비전 워커 풀 기동 실패 (스레드 풀로 폴백): {e}", flush=True)
+    # 서버 기동 직후 백그라운드에서 모델 로딩 시작 (비블로킹, 모델 파일 다운로드 포함)
     asyncio.create_task(background_init_analyzer())
 
+@app.on_event("shutdown")
+async def on_shutdown():
+    if vision_pool:
+        vision_pool.shutdown()
+
 @app.get("/status")
 async def status():
     is_ready = analyzer_instance.is_ready if analyzer_instance else False
     return {
         "status": "running",
         "vision_analyzer_ready": is_ready,
+        "vision_pool": vision_pool.stats() if vision_pool else None,
+        "vision_budget": vision_budget.stats(),
         "session_count": len(active_pcs)
     }
 
@@ -0,0 +1,102 @@
+import math
+import time
+from collections import deque
+
+# 긴장도 실시간 판단(심리적 안전장치)에 쓰는 최근 프레임 수
+RECENT_ANXIETY_WINDOW = 30
+
+
+class RunningStat:
+    """설명:
+        개수/평균/분산을 값 목록 없이 누적하는 Welford 온라인 통계.
+
+    Attributes:
+        n (int): 누적 개수.
+        mean (float): 평균.
+        m2 (float): 편차 제곱합 (분산 = m2 / n).
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    __slots__ = ("n", "mean", "m2")
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, x: float):
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+
+    def merge(self, other: "RunningStat"):
+        """다른 누적 통계를 합침 (Chan 병렬 결합식)"""
+        if other.n == 0:
+            return
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.mean += delta * other.n / n
+        self.m2 += other.m2 + delta * delta * self.n * other.n / n
+        self.n = n
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.m2 / self.n) if self.n else 0.0
+
+
+class VisionAggregate:
+    """설명:
+        질문 1개(또는 세션 전체)의 영상/음성 지표를 고정 크기 카운터로 누적하는 집계기.
+        프레임마다 리스트에 값을 쌓지 않으므로 면접이 길어져도 메모리가 일정하고, 점수 계산은 O(1).
+
+    Attributes:
+        total_frames (int): 얼굴이 감지된 분석 프레임 수.
+        gaze_center_frames (int): 정면 응시 프레임 수.
+        posture_stable_frames (int): 자세 안정 프레임 수.
+        smile (RunningStat): 미소 점수 (0~1).
+        anxiety (RunningStat): 긴장도 점수 (0~1).
+        audio (RunningStat): 음성 자신감 점수 (0~100).
+        recent_anxiety (deque): 최근 RECENT_ANXIETY_WINDOW 프레임의 긴장도.
+        start_time (float): 집계 시작 시각.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    __slots__ = (
+        "total_frames", "gaze_center_frames", "posture_stable_frames",
+        "smile", "anxiety", "audio", "recent_anxiety", "start_time",
+    )
+
+    def __init__(self):
+        self.total_frames = 0
+        self.gaze_center_frames = 0
+        self.posture_stable_frames = 0
+        self.smile = RunningStat()
+        self.anxiety = RunningStat()
+        self.audio = RunningStat()
+        self.recent_anxiety = deque(maxlen=RECENT_ANXIETY_WINDOW)
+        self.start_time = time.time()
+
+    def add_vision(self, result: dict):
+        """얼굴이 감지된 분석 결과 1건 누적"""
+        scores, flags = result["scores"], result["flags"]
+        self.total_frames += 1
+        self.smile.add(scores["smile"])
+        self.anxiety.add(scores["anxiety"])
+        self.recent_anxiety.append(scores["anxiety"])
+        if flags["is_center"]:
+            self.gaze_center_frames += 1
+        if flags["is_stable"]:
+            self.posture_stable_frames += 1
+
+    def add_audio(self, score: float):
+        """답변 1건의 음성 자신감 점수 누적"""
+        self.audio.add(score)
+
+    def recent_anxiety_mean(self):
+        """최근 프레임 긴장도 평균 (없으면 None)"""
+        if not self.recent_anxiety:
+            return None
+        return sum(self.recent_anxiety) / len(self.recent_anxiety)
@@ -17,13 +17,18 @@ HEAD_SENSITIVITY = 0.008 # 고개 끄덕임 민감도
 class VisionAnalyzer:
     _instance = None
 
-    def __new__(cls):
+    def __new__(cls, singleton: bool = True):
+        # singleton=False: 비전 워커 프로세스에서 세션별 전용 인스턴스 생성 (detect_for_video 타임스탬프/트래킹 분리)
+        if not singleton:
+            instance = super(VisionAnalyzer, cls).__new__(cls)
+            instance._initialized = False
+            return instance
         if cls._instance is None:
             cls._instance = super(VisionAnalyzer, cls).__new__(cls)
             cls._instance._initialized = False
         return cls._instance
 
-    def __init__(self):
+    def __init__(self, singleton: bool = True):
         if self._initialized: return
         
         # 모델 경로
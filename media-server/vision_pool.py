@@ -0,0 +1,344 @@
+import asyncio
+import logging
+import multiprocessing as mp
+import os
+import queue
+import threading
+import time
+from collections import deque
+from itertools import count
+from multiprocessing import resource_tracker, shared_memory
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger("Vision-Pool")
+
+# [설정] 비전 워커 프로세스 수 (0이면 풀 미사용 → 기존 스레드 풀 경로)
+VISION_WORKERS = int(os.getenv("VISION_WORKERS", "2"))
+# 세션별 대기 프레임 상한 (가득 차면 가장 오래된 프레임을 버림, 최소 1)
+VISION_QUEUE_MAX = max(1, int(os.getenv("VISION_QUEUE_MAX", "2")))
+# 공유 메모리 슬롯 1개의 최대 프레임 크기 (이보다 큰 프레임은 슬롯에 맞게 축소)
+VISION_MAX_WIDTH = int(os.getenv("VISION_MAX_WIDTH", "1280"))
+VISION_MAX_HEIGHT = int(os.getenv("VISION_MAX_HEIGHT", "720"))
+SLOT_BYTES = VISION_MAX_WIDTH * VISION_MAX_HEIGHT * 3
+# 워커 프로세스 생존 확인 주기 (초). 죽은 워커(MediaPipe segfault 등)는 재기동하고 처리 중이던 요청은 실패 처리
+VISION_WORKER_CHECK_SEC = float(os.getenv("VISION_WORKER_CHECK_SEC", "1.0"))
+
+
+def _vision_worker(worker_idx: int, request_queue, result_queue):
+    """설명:
+        비전 워커 프로세스 본체. 세션마다 전용 FaceLandmarker(VisionAnalyzer)를 두어
+        detect_for_video의 타임스탬프 단조 증가/트래킹 상태가 세션 간에 섞이지 않게 함.
+        프레임 픽셀은 공유 메모리 슬롯에서 복사 없이 읽음.
+
+    Args:
+        worker_idx (int): 워커 번호 (로그용).
+        request_queue (mp.Queue): ("frame", req_id, session_id, shm_name, slot, shape, ts) / ("release", session_id).
+        result_queue (mp.Queue): (req_id, result) 응답 큐.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+    from vision_analyzer import VisionAnalyzer
+
+    analyzers = {}   # session_id -> VisionAnalyzer (세션 전용 인스턴스)
+    segments = {}    # session_id -> SharedMemory (부착된 공유 메모리)
+    print(f"✅ [Vision-Worker {worker_idx}] 프로세스 시작 (pid={os.getpid()})", flush=True)
+
+    while True:
+        msg = request_queue.get()
+        if msg is None:
+            break
+
+        if msg[0] == "release":
+            session_id = msg[1]
+            analyzer = analyzers.pop(session_id, None)
+            if analyzer:
+                analyzer.close()
+            shm = segments.pop(session_id, None)
+            if shm:
+                shm.close()
+            continue
+
+        _, req_id, session_id, shm_name, slot, shape, ts = msg
+        result = None
+        try:
+            analyzer = analyzers.get(session_id)
+            if analyzer is None:
+                analyzer = analyzers[session_id] = VisionAnalyzer(singleton=False)
+            shm = segments.get(session_id)
+            if shm is None:
+                shm = segments[session_id] = shared_memory.SharedMemory(name=shm_name)
+                # 생성/해제는 메인 프로세스 담당 → 워커 종료 시 resource_tracker가 unlink하지 않도록 등록 해제
+                resource_tracker.unregister(shm._name, "shared_memory")
+            img = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf, offset=slot * SLOT_BYTES)
+            result = analyzer.process_frame(img, ts)
+        except Exception as e:
+            logger.error(f"[Vision-Worker {worker_idx}] 프레임 분석 실패: {e}")
+        result_queue.put((req_id, result))
+
+    for analyzer in analyzers.values():
+        analyzer.close()
+    for shm in segments.values():
+        shm.close()
+
+
+class VisionSession:
+    """설명:
+        세션 1개의 프레임 제출 창구. 공유 메모리 슬롯(대기 VISION_QUEUE_MAX + 처리 중 1)을 미리 할당하고,
+        워커에는 한 번에 프레임 1장만 보냄. 처리 중일 때 들어온 프레임은 bounded deque에 쌓이며
+        가득 차면 가장 오래된 프레임부터 버림 (분석이 실시간을 따라가지 못해도 지연이 누적되지 않음).
+
+    Attributes:
+        session_id (str): 면접 세션 ID.
+        worker_idx (int): 고정 배정된 워커 번호 (세션 affinity).
+        dropped (int): 대기열 초과로 버린 프레임 수.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+
+    def __init__(self, pool: "VisionWorkerPool", session_id: str, worker_idx: int, on_result):
+        self.pool = pool
+        self.session_id = session_id
+        self.worker_idx = worker_idx
+        self.on_result = on_result
+        self.num_slots = VISION_QUEUE_MAX + 1
+        self.shm = shared_memory.SharedMemory(create=True, size=SLOT_BYTES * self.num_slots)
+        self.free_slots = list(range(self.num_slots))
+        self.pending = deque()       # (slot, shape, ts) 대기 프레임
+        self.inflight = None         # 워커에서 처리 중인 slot
+        self.last_ts = 0
+        self.dropped = 0
+        self.closed = False
+
+    def _write_slot(self, slot: int, img: np.ndarray) -> tuple:
+        """프레임을 슬롯에 기록 (슬롯보다 크면 비율 유지 축소를 슬롯에 바로 씀)"""
+        h, w = img.shape[:2]
+        scale = min(1.0, VISION_MAX_WIDTH / w, VISION_MAX_HEIGHT / h)
+        if scale < 1.0:
+            h, w = int(h * scale), int(w * scale)
+        shape = (h, w, 3)
+        dst = np.ndarray(shape, dtype=np.uint8, buffer=self.shm.buf, offset=slot * SLOT_BYTES)
+        if scale < 1.0:
+            cv2.resize(img, (w, h), dst=dst, interpolation=cv2.INTER_AREA)
+        else:
+            dst[...] = img
+        return shape
+
+    def submit(self, img: np.ndarray, timestamp_ms: int):
+        """설명:
+            BGR 프레임 제출 (논블로킹). 워커가 비어 있으면 바로 전송, 아니면 대기열에 넣음.
+
+        Args:
+            img (np.ndarray): BGR uint8 프레임.
+            timestamp_ms (int): 프레임 시각 (세션 내에서 단조 증가하도록 보정됨).
+
+        생성자: ejm
+        생성일자: 2026-10-17
+        """
+        if self.closed:
+            return
+        if not self.free_slots:
+            if not self.pending:
+                # 모든 슬롯이 처리 중 → 들어온 프레임을 버림
+                self.dropped += 1
+                return
+            # 대기열이 가득 참 → 가장 오래된 대기 프레임의 슬롯을 재사용 (drop-oldest)
+            old_slot, _, _ = self.pending.popleft()
+            self.free_slots.append(old_slot)
+            self.dropped += 1
+        slot = self.free_slots.pop()
+        shape = self._write_slot(slot, img)
+        self.last_ts = max(int(timestamp_ms), self.last_ts + 1)
+        self.pending.append((slot, shape, self.last_ts))
+        self._dispatch_next()
+
+    def _dispatch_next(self):
+        """처리 중인 프레임이 없으면 대기열 맨 앞 프레임을 워커로 전송"""
+        if self.inflight is not None or not self.pending or self.closed:
+            return
+        slot, shape, ts = self.pending.popleft()
+        self.inflight = slot
+        self.pool._send_frame(self, slot, shape, ts)
+
+    def _on_done(self, result):
+        """워커 결과 수신 (이벤트 루프 스레드): 슬롯 반환 → 다음 프레임 전송 → 결과 콜백"""
+        if self.inflight is not None:
+            self.free_slots.append(self.inflight)
+            self.inflight = None
+        self._dispatch_next()
+        if not self.closed and self.on_result:
+            asyncio.ensure_future(self.on_result(result))
+
+    def close(self):
+        """세션 종료: 워커의 세션 전용 분석기 해제 요청 후 공유 메모리 반납"""
+        if self.closed:
+            return
+        self.closed = True
+        self.pending.clear()
+        self.pool._release(self)
+        try:
+            self.shm.close()
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
+        if self.dropped:
+            logger.info(f"[{self.session_id}] 🎞️ 비전 대기열 초과로 버린 프레임: {self.dropped}")
+
+
+class VisionWorkerPool:
+    """설명:
+        MediaPipe 비전 분석 프로세스 풀. 세션은 열릴 때 담당 세션 수가 가장 적은 워커에 고정 배정되고,
+        프레임은 공유 메모리로, 요청/응답은 작은 튜플만 프로세스 큐로 주고받음.
+        응답 큐는 전용 스레드가 읽어 이벤트 루프로 넘기므로 이벤트 루프/GIL이 추론에 묶이지 않음.
+        같은 스레드가 워커 생존을 주기적으로 확인하여, 죽은 워커는 같은 번호로 재기동하고
+        그 워커에서 처리 중이던 프레임은 실패(None)로 돌려 세션이 다음 프레임을 계속 보낼 수 있게 함.
+
+        (spawn 방식이므로 워커 기동 시 메인 모듈이 한 번 다시 import됨)
+
+    Attributes:
+        num_workers (int): 워커 프로세스 수.
+        sessions (dict): session_id -> VisionSession.
+
+    생성자: ejm
+    생성일자: 2026-10-17
+    """
+
+    def __init__(self, num_workers: int = VISION_WORKERS):
+        self.num_workers = num_workers
+        self.sessions = {}
+        self._ctx = mp.get_context("spawn")
+        self._request_queues = []
+        self._processes = []
+        self._result_queue = self._ctx.Queue()
+        self._worker_load = [0] * num_workers
+        self._req_ids = count(1)
+        self._inflight = {}   # req_id -> VisionSession
+        self._loop = None
+        self._reader = None
+        self._closing = False
+        self._restarts = [0] * num_workers
+
+    def _spawn_worker(self, idx: int):
+        q = self._ctx.Queue()
+        p = self._ctx.Process(target=_vision_worker, args=(idx, q, self._result_queue), daemon=True)
+        p.start()
+        return q, p
+
+    def start(self, loop: asyncio.AbstractEventLoop):
+        """워커 프로세스와 결과 수신 스레드 기동"""
+        self._loop = loop
+        for idx in range(self.num_workers):
+            q, p = self._spawn_worker(idx)
+            self._request_queues.append(q)
+            self._processes.append(p)
+        self._reader = threading.Thread(target=self._drain_results, name="vision-results", daemon=True)
+        self._reader.start()
+        print(f"✅ [미디어 서버] 비전 워커 풀 기동 (workers={self.num_workers}, queue_max={VISION_QUEUE_MAX})", flush=True)
+
+    def open_session(self, session_id: str, on_result) -> VisionSession:
+        """설명:
+            세션을 가장 한가한 워커에 배정하고 제출 창구 생성 (같은 ID로 다시 열면 기존 창구 정리).
+
+        Args:
+            session_id (str): 면접 세션 ID.
+            on_result (coroutine function): 분석 결과(dict | None)를 받는 콜백.
+
+        Returns:
+            VisionSession: 프레임 제출 창구.
+
+        생성자: ejm
+        생성일자: 2026-10-17
+        """
+        old = self.sessions.get(session_id)
+        if old:
+            old.close()
+        worker_idx = min(range(self.num_workers), key=lambda i: self._worker_load[i])
+        self._worker_load[worker_idx] += 1
+        session = VisionSession(self, session_id, worker_idx, on_result)
+        self.sessions[session_id] = session
+        return session
+
+    def _send_frame(self, session: VisionSession, slot: int, shape: tuple, ts: int):
+        req_id = next(self._req_ids)
+        self._inflight[req_id] = session
+        self._request_queues[session.worker_idx].put(
+            ("frame", req_id, session.session_id, session.shm.name, slot, shape, ts)
+        )
+
+    def _release(self, session: VisionSession):
+        if self.sessions.get(session.session_id) is session:
+            self.sessions.pop(session.session_id, None)
+        self._worker_load[session.worker_idx] -= 1
+        self._request_queues[session.worker_idx].put(("release", session.session_id))
+
+    def _drain_results(self):
+        """결과 큐 수신 스레드 → 이벤트 루프에서 세션 콜백 실행 (주기적으로 워커 생존 확인)"""
+        next_check = time.monotonic() + VISION_WORKER_CHECK_SEC
+        while True:
+            try:
+                item = self._result_queue.get(timeout=VISION_WORKER_CHECK_SEC)
+            except queue.Empty:
+                item = ()
+            except (EOFError, OSError):
+                break
+            if item is None:
+                break
+            if item:
+                self._loop.call_soon_threadsafe(self._dispatch_result, *item)
+            if time.monotonic() >= next_check:
+                next_check = time.monotonic() + VISION_WORKER_CHECK_SEC
+                for idx, p in enumerate(self._processes):
+                    if not p.is_alive() and not self._closing:
+                        self._loop.call_soon_threadsafe(self._handle_worker_exit, idx, p)
+
+    def _handle_worker_exit(self, idx: int, process):
+        """설명:
+            죽은 워커를 같은 번호로 재기동하고, 그 워커에서 처리 중이던 요청을 실패 처리 (이벤트 루프 스레드).
+            세션 affinity는 유지되며 새 워커가 세션 분석기/공유 메모리를 첫 프레임에서 다시 생성함.
+
+        Args:
+            idx (int): 워커 번호.
+            process (mp.Process): 죽은 것으로 확인된 프로세스 (이미 교체되었으면 무시).
+
+        생성자: ejm
+        생성일자: 2026-10-17
+        """
+        if self._closing or self._processes[idx] is not process:
+            return
+        self._restarts[idx] += 1
+        logger.error(
+            f"❌ [Vision-Worker {idx}] 프로세스 종료 감지 (exitcode={process.exitcode}) → 재기동 ({self._restarts[idx]}회째)"
+        )
+        self._request_queues[idx], self._processes[idx] = self._spawn_worker(idx)
+
+        lost = [req_id for req_id, session in self._inflight.items() if session.worker_idx == idx]
+        for req_id in lost:
+            self._inflight.pop(req_id)._on_done(None)
+
+    def _dispatch_result(self, req_id: int, result):
+        session = self._inflight.pop(req_id, None)
+        if session is not None:
+            session._on_done(result)
+
+    def stats(self) -> dict:
+        """워커별 담당 세션 수 (상태 조회용)"""
+        return {
+            "workers": self.num_workers,
+            "sessions_per_worker": list(self._worker_load),
+            "alive": [p.is_alive() for p in self._processes],
+            "restarts": list(self._restarts),
+        }
+
+    def shutdown(self):
+        """세션 정리 후 워커/수신 스레드 종료"""
+        self._closing = True
+        for session in list(self.sessions.values()):
+            session.close()
+        for q in self._request_queues:
+            q.put(None)
+        self._result_queue.put(None)
+        for p in self._processes:
+            p.join(timeout=3)